@@ -0,0 +1,6 @@
+"""
+CTkBootstrap benchmarks package.
+
+This directory contains headless benchmarks for theme switching on synthetic widget trees.
+Run them with: python -m benchmarks.bench_theme_switch --help
+"""
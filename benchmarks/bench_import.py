@@ -0,0 +1,121 @@
+"""
+Import time benchmark for CTkBootstrap.
+
+Measures how long "import CTkBootstrap" takes in a fresh interpreter, using the
+cumulative time reported by python -X importtime, and checks it against a budget.
+It also checks that the import has no side effects: it must not print anything and
+must not import CustomTkinter or tkinter, which are only loaded on first use.
+
+Usage:
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --budget-ms 10 --runs 20
+
+Exits with status 1 if the median import time exceeds the budget or the import has
+side effects, so it can run in CI.
+"""
+
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+from typing import List, Optional
+
+REPO_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC_DIR = os.path.join(REPO_DIR, 'src')
+
+# Median import time allowed by default, in milliseconds
+DEFAULT_BUDGET_MS = 25.0
+
+# Modules that must not be imported by "import CTkBootstrap" alone
+HEAVY_MODULES = ("customtkinter", "tkinter", "CTkBootstrap.themes", "CTkBootstrap.widget_theme_mapper")
+
+
+def run_python(code: str, *options: str) -> subprocess.CompletedProcess:
+    """Run code in a fresh interpreter that imports CTkBootstrap from this checkout"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = SRC_DIR + os.pathsep + env.get("PYTHONPATH", "")
+    env.pop("CTKBOOTSTRAP_PROFILE", None)
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        env=env, capture_output=True, text=True, check=True
+    )
+
+
+def measure_import(module: str = "CTkBootstrap") -> float:
+    """
+    Measure the cumulative import time of a module in a fresh interpreter.
+
+    Args:
+        module: The module to import
+
+    Returns:
+        The import time in milliseconds
+    """
+    result = run_python(f"import {module}", "-X", "importtime")
+    # Lines look like: "import time:  self [us] | cumulative | imported package"
+    for line in reversed(result.stderr.splitlines()):
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1]) / 1000.0
+    raise RuntimeError(f"No import time reported for {module}")
+
+
+def check_side_effects() -> List[str]:
+    """
+    Import CTkBootstrap and report any side effects.
+
+    Returns:
+        A list of problems, empty if the import is side-effect free
+    """
+    code = (
+        "import sys\n"
+        "before = set(sys.modules)\n"
+        "import CTkBootstrap\n"
+        "loaded = set(sys.modules) - before\n"
+        f"print('\\n'.join(name for name in {HEAVY_MODULES!r} if name in loaded))\n"
+    )
+    result = run_python(code)
+    lines = [line for line in result.stdout.splitlines() if line]
+    return [f"imports {name}" for name in lines if name in HEAVY_MODULES] + [
+        f"prints {line!r}" for line in lines if line not in HEAVY_MODULES
+    ]
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the import time of CTkBootstrap")
+    parser.add_argument("--runs", type=int, default=10,
+                        help="Number of fresh interpreters to measure (default: %(default)s)")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="Maximum median import time in milliseconds (default: %(default)s)")
+    args = parser.parse_args(argv)
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+
+    timings = [measure_import() for _ in range(args.runs)]
+    median = statistics.median(timings)
+    print(f"import CTkBootstrap: median {median:.2f} ms, min {min(timings):.2f} ms, "
+          f"max {max(timings):.2f} ms over {args.runs} runs (budget {args.budget_ms:.2f} ms)")
+
+    # For reference, the cost of loading the theme engine on first use
+    print(f"import CTkBootstrap.themed_widgets: {measure_import('CTkBootstrap.themed_widgets'):.2f} ms")
+
+    failed = False
+    if median > args.budget_ms:
+        print(f"FAIL: import time exceeds the budget by {median - args.budget_ms:.2f} ms")
+        failed = True
+
+    for problem in check_side_effects():
+        print(f"FAIL: import CTkBootstrap {problem}")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
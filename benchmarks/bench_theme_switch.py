@@ -0,0 +1,334 @@
+"""
+Theme switching benchmark for CTkBootstrap.
+
+Builds synthetic trees of mixed CustomTkinter, ttk and tk widgets and times switching
+between every ordered pair of built-in themes with:
+
+- CTk.apply_theme
+- ThemeManager.apply_theme_to_all_widgets
+- apply_global_theme
+
+Each measurement first applies the "from" theme untimed, then times switching to the
+"to" theme, including the Tk idle tasks (redraws) it triggers. Peak memory of a switch
+is measured in a separate run with tracemalloc, so it does not skew the timings.
+
+With --backend tk (the default) the widgets are real, which needs a display. Without
+one, the benchmark starts a virtual X server (Xvfb) if it is installed; alternatively
+run it under xvfb-run. With --backend null the widgets are in-memory stand-ins from
+CTkBootstrap.null_backend, which isolates the cost of the theme engine itself and runs
+anywhere.
+
+Usage:
+    python -m benchmarks.bench_theme_switch --sizes 100,1000 --output results.json
+    python -m benchmarks.bench_theme_switch --compare results.json
+    python -m benchmarks.bench_theme_switch --backend null --sizes 10000,50000
+
+Results are written as JSON together with the commit they were measured on, so runs on
+different commits can be compared with --compare to spot regressions, including ones
+that only show at larger tree sizes.
+"""
+
+import os
+import sys
+import gc
+import json
+import time
+import atexit
+import shutil
+import argparse
+import platform
+import itertools
+import subprocess
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Add the source directory to the path so we can import CTkBootstrap, and the
+# repository itself so the benchmarks package is importable when run as a script
+REPO_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(REPO_DIR, 'src'))
+sys.path.insert(1, REPO_DIR)
+
+DEFAULT_SIZES = [100, 1000, 10000, 50000]
+
+TARGETS = ("CTk.apply_theme", "ThemeManager.apply_theme_to_all_widgets", "apply_global_theme")
+
+BACKENDS = ("tk", "null")
+
+
+def ensure_display() -> None:
+    """Start a virtual X server if there is no display to connect to"""
+    if sys.platform in ("win32", "darwin") or os.environ.get("DISPLAY"):
+        return
+
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        raise SystemExit(
+            "No display available and Xvfb is not installed. "
+            "Install Xvfb or run the benchmark under xvfb-run."
+        )
+
+    display = ":%d" % (90 + os.getpid() % 100)
+    process = subprocess.Popen(
+        [xvfb, display, "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    atexit.register(process.terminate)
+    os.environ["DISPLAY"] = display
+    # Give the server a moment to accept connections
+    time.sleep(0.5)
+
+
+def git_commit() -> Optional[str]:
+    """Get the commit the benchmark runs on, if the repository is a git checkout"""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], cwd=REPO_DIR, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def make_switch(target: str, root: Any) -> Callable[[str], None]:
+    """
+    Get a function that switches the widgets of a root window to a theme.
+
+    Args:
+        target: One of TARGETS
+        root: The CTkBootstrap.CTk window holding the widget tree
+
+    Returns:
+        A function taking a theme name
+    """
+    import CTkBootstrap
+
+    if target == "CTk.apply_theme":
+        return root.apply_theme
+
+    if target == "ThemeManager.apply_theme_to_all_widgets":
+        manager = CTkBootstrap.ThemeManager()
+
+        def switch(theme_name: str) -> None:
+            manager.change_theme(theme_name)
+            manager.apply_theme_to_all_widgets(root)
+        return switch
+
+    if target == "apply_global_theme":
+        return lambda theme_name: CTkBootstrap.apply_global_theme(root, theme_name)
+
+    raise ValueError(f"Invalid target: {target}. Valid targets are: {', '.join(TARGETS)}")
+
+
+def time_switch(switch: Callable[[str], None], root: Any, from_theme: str, to_theme: str,
+                repeat: int) -> List[float]:
+    """Time switching from one theme to another, repeat times"""
+    timings = []
+    for _ in range(repeat):
+        switch(from_theme)
+        root.update_idletasks()
+        gc.collect()
+
+        start = time.perf_counter()
+        switch(to_theme)
+        root.update_idletasks()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def measure_peak_memory(switch: Callable[[str], None], root: Any, from_theme: str, to_theme: str) -> int:
+    """Measure the peak memory allocated while switching from one theme to another, in bytes"""
+    switch(from_theme)
+    root.update_idletasks()
+    gc.collect()
+
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        switch(to_theme)
+        root.update_idletasks()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peak - baseline
+
+
+def run_size(size: int, args: argparse.Namespace, themes: List[str]) -> List[Dict[str, Any]]:
+    """Run all benchmarks for one tree size"""
+    from benchmarks.widget_trees import build_widget_tree, create_widget
+
+    if args.backend == "null":
+        from CTkBootstrap.null_backend import NullCTk, create_null_widget
+        root, create = NullCTk(), create_null_widget
+    else:
+        import CTkBootstrap
+        root, create = CTkBootstrap.CTk(), create_widget
+    try:
+        start = time.perf_counter()
+        created = build_widget_tree(root, size, fanout=args.fanout, depth=args.depth,
+                                    pack=args.pack, create=create)
+        root.update_idletasks()
+        print(f"Built {created} widgets in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+
+        results = []
+        pairs = list(itertools.permutations(themes, 2))
+        for target in args.targets:
+            switch = make_switch(target, root)
+            for from_theme, to_theme in pairs:
+                timings = time_switch(switch, root, from_theme, to_theme, args.repeat)
+                best = min(timings)
+                result = {
+                    "backend": args.backend,
+                    "target": target,
+                    "size": created,
+                    "from": from_theme,
+                    "to": to_theme,
+                    "best": best,
+                    "mean": sum(timings) / len(timings),
+                    "ops_per_sec": 1.0 / best if best else None,
+                    "widgets_per_sec": created / best if best else None,
+                    "peak_memory": None,
+                }
+                if not args.no_memory:
+                    result["peak_memory"] = measure_peak_memory(switch, root, from_theme, to_theme)
+                results.append(result)
+                print(format_result(result), file=sys.stderr)
+        return results
+    finally:
+        root.destroy()
+
+
+def format_result(result: Dict[str, Any]) -> str:
+    """Format one result as a line of text"""
+    line = (
+        f"{result['target']:<42} {result['size']:>6} {result['from']:>8} -> {result['to']:<8} "
+        f"{result['best'] * 1000:>10.2f} ms {result['ops_per_sec']:>9.2f} ops/s "
+        f"{result['widgets_per_sec']:>11.0f} widgets/s"
+    )
+    if result["peak_memory"] is not None:
+        line += f" {result['peak_memory'] / 1024:>9.1f} KiB peak"
+    return line
+
+
+def result_key(result: Dict[str, Any]) -> Tuple[str, str, int, str, str]:
+    """The key identifying a measurement across runs"""
+    return result.get("backend", "tk"), result["target"], result["size"], result["from"], result["to"]
+
+
+def compare(results: List[Dict[str, Any]], baseline: Dict[str, Any], threshold: float) -> int:
+    """
+    Compare results with an earlier run and print the changes.
+
+    Args:
+        results: The results of this run
+        baseline: The JSON document of an earlier run
+        threshold: The relative slowdown reported as a regression, e.g. 0.1 for 10%
+
+    Returns:
+        The number of regressions
+    """
+    previous = {result_key(result): result for result in baseline["results"]}
+    print(f"Compared with {baseline.get('commit') or 'unknown commit'}:")
+
+    # Aggregate per target and size, so scaling regressions stand out
+    totals: Dict[Tuple[str, int], List[float]] = {}
+    regressions = 0
+    for result in results:
+        old = previous.get(result_key(result))
+        if old is None or not old["best"]:
+            continue
+        ratio = result["best"] / old["best"]
+        totals.setdefault((result["target"], result["size"]), []).append(ratio)
+        if ratio > 1 + threshold:
+            regressions += 1
+            print(f"  REGRESSION {format_result(result)} ({ratio:.2f}x)")
+
+    for (target, size), ratios in sorted(totals.items()):
+        geometric_mean = 1.0
+        for ratio in ratios:
+            geometric_mean *= ratio
+        geometric_mean **= 1.0 / len(ratios)
+        print(f"  {target:<42} {size:>6}: {geometric_mean:.2f}x time")
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark CTkBootstrap theme switching")
+    parser.add_argument("--backend", choices=BACKENDS, default="tk",
+                        help="Real Tk widgets, or in-memory null widgets (default: %(default)s)")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="Comma-separated widget counts (default: %(default)s)")
+    parser.add_argument("--fanout", type=int, default=8,
+                        help="Maximum children per container (default: %(default)s)")
+    parser.add_argument("--depth", type=int, default=None,
+                        help="Maximum tree depth (default: the smallest that fits)")
+    parser.add_argument("--themes", default=None,
+                        help="Comma-separated themes (default: all built-in themes)")
+    parser.add_argument("--targets", default=",".join(TARGETS),
+                        help="Comma-separated functions to time (default: all)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Timed switches per theme pair; the best is reported (default: %(default)s)")
+    parser.add_argument("--pack", action="store_true",
+                        help="Pack the widgets, adding geometry management to the timings")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="Skip the peak memory measurements")
+    parser.add_argument("--output", default=None,
+                        help="Write the results to this JSON file")
+    parser.add_argument("--compare", default=None,
+                        help="Compare with the results of an earlier run")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="Relative slowdown reported as a regression (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    args.sizes = [int(size) for size in args.sizes.split(",") if size]
+    args.targets = [target for target in args.targets.split(",") if target]
+    for target in args.targets:
+        if target not in TARGETS:
+            parser.error(f"Invalid target: {target}. Valid targets are: {', '.join(TARGETS)}")
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.backend == "tk":
+        ensure_display()
+
+    import customtkinter as ctk
+    import CTkBootstrap
+
+    themes = args.themes.split(",") if args.themes else list(CTkBootstrap.THEMES)
+
+    results = []
+    for size in args.sizes:
+        results.extend(run_size(size, args, themes))
+
+    document = {
+        "commit": git_commit(),
+        "version": CTkBootstrap.__version__,
+        "customtkinter": getattr(ctk, "__version__", None),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {
+            "backend": args.backend,
+            "fanout": args.fanout,
+            "depth": args.depth,
+            "repeat": args.repeat,
+            "pack": args.pack,
+        },
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(document, file, indent=2)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""
+Synthetic widget trees for the CTkBootstrap benchmarks.
+
+Trees mix CustomTkinter, ttk and plain tk widgets. The shape is controlled by the
+fan-out (children per container) and the maximum depth; widgets are spread evenly
+over the branches, so trees of the same size and shape are identical across runs.
+"""
+
+import math
+import tkinter as tk
+from tkinter import ttk
+import customtkinter as ctk
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+# Container widgets as (class, options), used in turn for every widget that has children
+CONTAINER_TYPES: List[Tuple[type, Dict[str, Any]]] = [
+    (ctk.CTkFrame, {}),
+    (ttk.Frame, {}),
+    (ctk.CTkFrame, {}),
+    (tk.Frame, {}),
+]
+
+# Leaf widgets as (class, options), used in turn for every widget without children
+LEAF_TYPES: List[Tuple[type, Dict[str, Any]]] = [
+    (ctk.CTkButton, {"text": "Button"}),
+    (ctk.CTkLabel, {"text": "Label"}),
+    (ctk.CTkEntry, {}),
+    (ctk.CTkCheckBox, {"text": "Check"}),
+    (ctk.CTkSwitch, {"text": "Switch"}),
+    (ctk.CTkSlider, {}),
+    (ctk.CTkProgressBar, {}),
+    (ttk.Label, {"text": "ttk"}),
+    (ttk.Button, {"text": "ttk"}),
+    (tk.Label, {"text": "tk"}),
+    (tk.Button, {"text": "tk"}),
+]
+
+
+def create_widget(widget_class: type, master: Any, **options) -> Any:
+    """Create a real Tk widget"""
+    return widget_class(master, **options)
+
+
+def default_depth(size: int, fanout: int) -> int:
+    """
+    Get the smallest tree depth that can hold a number of widgets.
+
+    Args:
+        size: The number of widgets below the root
+        fanout: The number of children per container
+
+    Returns:
+        The depth, at least 1
+    """
+    if fanout < 2:
+        return max(1, size)
+    # Widgets below the root in a full tree of depth d: fanout + fanout^2 + ... + fanout^d
+    depth = max(1, math.ceil(math.log(size * (fanout - 1) / fanout + 1, fanout)))
+    while tree_capacity(depth, fanout) < size:
+        depth += 1
+    return depth
+
+
+def tree_capacity(depth: int, fanout: int) -> int:
+    """
+    Get the number of widgets a tree of a given depth and fan-out holds below its root.
+
+    Args:
+        depth: The number of levels below the root
+        fanout: The number of children per container
+
+    Returns:
+        The number of widgets
+    """
+    return sum(fanout ** level for level in range(1, depth + 1))
+
+
+def build_widget_tree(root: Any,
+                      size: int,
+                      fanout: int = 8,
+                      depth: Optional[int] = None,
+                      containers: Optional[Sequence[Tuple[type, Dict[str, Any]]]] = None,
+                      leaves: Optional[Sequence[Tuple[type, Dict[str, Any]]]] = None,
+                      pack: bool = False,
+                      create: Callable[..., Any] = create_widget) -> int:
+    """
+    Build a synthetic widget tree below a root window.
+
+    The widgets are spread evenly over the subtrees, so every branch has about the
+    same size. Widgets without children are leaves, all others are containers.
+
+    Args:
+        root: The window or frame to build the tree in
+        size: The number of widgets to create below the root
+        fanout: The maximum number of children per container
+        depth: The maximum number of levels below the root, or None for the smallest
+            depth that holds size widgets. When given, the fan-out is lowered to the
+            smallest one that still holds size widgets, so deep, narrow trees can be
+            built by passing a large depth.
+        containers: (class, options) of container widgets, defaults to CONTAINER_TYPES
+        leaves: (class, options) of leaf widgets, defaults to LEAF_TYPES
+        pack: Pack every widget. Unpacked widgets are themed the same way, but do
+            not pay for geometry management.
+        create: Called as create(widget_class, master, **options) to create each
+            widget, e.g. null_backend.create_null_widget for a headless tree
+
+    Returns:
+        The number of widgets created
+
+    Raises:
+        ValueError: If a tree of the given depth and fan-out cannot hold size widgets
+    """
+    if fanout < 1:
+        raise ValueError(f"fanout must be at least 1, got {fanout}")
+    if depth is None:
+        depth = default_depth(size, fanout)
+    else:
+        while fanout > 1 and tree_capacity(depth, fanout - 1) >= size:
+            fanout -= 1
+    if tree_capacity(depth, fanout) < size:
+        raise ValueError(
+            f"A tree of depth {depth} and fan-out {fanout} holds at most "
+            f"{tree_capacity(depth, fanout)} widgets, {size} requested"
+        )
+
+    containers = containers or CONTAINER_TYPES
+    leaves = leaves or LEAF_TYPES
+    created_containers = 0
+    created_leaves = 0
+
+    # Entries are (parent, number of widgets to create below it). Spreading the widgets
+    # evenly keeps the tree within the smallest depth that holds them.
+    stack = [(root, size)]
+    while stack:
+        parent, budget = stack.pop()
+        children = min(fanout, budget)
+        # Spread the widgets below the children evenly over the children
+        below, extra = divmod(budget - children, children)
+        for index in range(children):
+            share = below + (1 if index < extra else 0)
+            if share:
+                widget_class, options = containers[created_containers % len(containers)]
+                widget = create(widget_class, parent, **options)
+                created_containers += 1
+                stack.append((widget, share))
+            else:
+                widget_class, options = leaves[created_leaves % len(leaves)]
+                widget = create(widget_class, parent, **options)
+                created_leaves += 1
+            if pack:
+                widget.pack()
+    return created_containers + created_leaves
@@ -22,5 +22,6 @@ setuptools.setup(
     package_dir={"": "src"},
     packages=setuptools.find_packages(where="src"),
     install_requires=["customtkinter>=5.2.0"],
+    extras_require={"numpy": ["numpy"]},
     python_requires=">=3.7",
 )
\ No newline at end of file
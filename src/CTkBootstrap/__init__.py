@@ -3,217 +3,286 @@ CTkBootstrap - A CustomTkinter theme extension implementing Bootstrap-style them
 
 This module provides a wrapper around CustomTkinter to easily apply Bootstrap-inspired
 themes to your CustomTkinter applications.
+
+Importing the package is cheap and has no side effects: the themes, the theme engine
+and CustomTkinter itself are only imported when one of their names is first used.
 """
 
-import sys
 import os
-from typing import Optional, Literal, Dict, Any
+import importlib
 
-# Import CustomTkinter components
-try:
-    import customtkinter as ctk
-    from customtkinter import *
-except ImportError:
-    raise ImportError("CustomTkinter is required. Install it with 'pip install customtkinter'.")
-
-# Import the theme configurations
-from .themes import THEMES, get_theme_colors
-from .widget_theme_mapper import apply_theme_to_widget, apply_theme_to_all_children
-
-# Import the ThemeManager and theme loading functionality
-from .theme_manager import (
-    ThemeManager,
-    add_theme_search_path,
-    get_theme_search_paths,
-    reload_themes,
-    load_theme_from_file,
-    load_themes_from_directory,
-    apply_theme as apply_global_theme,
-    set_theme as set_global_theme,
-    get_theme_color,
-    get_primary_color,
-    get_secondary_color,
-    get_success_color,
-    get_danger_color,
-    get_warning_color,
-    get_info_color
-)
+# Static type checkers treat this as True; importing typing would slow down the import
+TYPE_CHECKING = False
 
 # Version info
 __version__ = "1.0.0"
 
+# Public names -> (submodule, attribute) they are loaded from on first access
+_LAZY_ATTRIBUTES = {
+    # Theme configurations
+    "THEMES": ("themes", "THEMES"),
+    "get_theme_colors": ("themes", "get_theme_colors"),
+    "normalize_themes": ("themes", "normalize_themes"),
+    "resolve_widget_props": ("themes", "resolve_widget_props"),
+    "get_theme": ("themes", "get_theme"),
+    "theme_names": ("themes", "theme_names"),
+    "extend_theme": ("themes", "extend_theme"),
+    "theme_ancestors": ("themes", "theme_ancestors"),
+    # CustomTkinter color themes
+    "register_color_theme": ("appearance", "register_color_theme"),
+    # Theme generation
+    "generate_theme": ("theme_generator", "generate_theme"),
+    # Contrast validation
+    "validate_themes": ("theme_validator", "validate_themes"),
+    "validate_theme_files": ("theme_validator", "validate_theme_files"),
+    "ValidationReport": ("theme_validator", "ValidationReport"),
+    "ContrastViolation": ("theme_validator", "ContrastViolation"),
+    # Theme objects
+    "Theme": ("theme_objects", "Theme"),
+    "get_theme_object": ("theme_objects", "get_theme_object"),
+    # Theme packs
+    "ThemePack": ("theme_pack", "ThemePack"),
+    "add_theme_pack": ("theme_pack", "add_theme_pack"),
+    "remove_theme_pack": ("theme_pack", "remove_theme_pack"),
+    "get_theme_packs": ("theme_pack", "get_theme_packs"),
+    "write_theme_pack": ("theme_pack", "write_theme_pack"),
+    "build_theme_pack": ("theme_pack", "build_theme_pack"),
+    # Colors
+    "Color": ("colors", "Color"),
+    "color_pair": ("colors", "color_pair"),
+    "intern_theme": ("colors", "intern_theme"),
+    # Color math
+    "parse_color": ("colors", "parse_color"),
+    "relative_luminance": ("colors", "relative_luminance"),
+    "contrast_ratio": ("colors", "contrast_ratio"),
+    "is_light_color": ("colors", "is_light_color"),
+    "contrast_text_color": ("colors", "contrast_text_color"),
+    "mix": ("colors", "mix"),
+    "lighten": ("colors", "lighten"),
+    "darken": ("colors", "darken"),
+    "parse_colors": ("colors", "parse_colors"),
+    "relative_luminances": ("colors", "relative_luminances"),
+    "contrast_ratios": ("colors", "contrast_ratios"),
+    "mix_colors": ("colors", "mix_colors"),
+    # Themed window and widgets
+    "CTk": ("themed_widgets", "CTk"),
+    "CTkButton": ("themed_widgets", "CTkButton"),
+    "CTkFrame": ("themed_widgets", "CTkFrame"),
+    "CTkLabel": ("themed_widgets", "CTkLabel"),
+    "CTkEntry": ("themed_widgets", "CTkEntry"),
+    # Theme engine
+    "apply_theme_to_widget": ("widget_theme_mapper", "apply_theme_to_widget"),
+    "apply_theme_to_all_children": ("widget_theme_mapper", "apply_theme_to_all_children"),
+    "apply_theme_to_tree": ("widget_theme_mapper", "apply_theme_to_tree"),
+    "apply_theme_to_registry": ("widget_theme_mapper", "apply_theme_to_registry"),
+    "iter_theme_tree": ("widget_theme_mapper", "iter_theme_tree"),
+    "iter_theme_registry": ("widget_theme_mapper", "iter_theme_registry"),
+    "get_theme_mapper": ("widget_theme_mapper", "get_theme_mapper"),
+    "register_mapper": ("widget_theme_mapper", "register_mapper"),
+    "clear_mapper_cache": ("widget_theme_mapper", "clear_mapper_cache"),
+    "compile_theme": ("style_plans", "compile_theme"),
+    "get_style_plan": ("style_plans", "get_style_plan"),
+    "clear_style_plan_cache": ("style_plans", "clear_style_plan_cache"),
+    "compile_ttk_theme": ("ttk_themes", "compile_ttk_theme"),
+    "use_ttk_theme": ("ttk_themes", "use_ttk_theme"),
+    "ttk_theme_name": ("ttk_themes", "ttk_theme_name"),
+    "clear_ttk_theme_cache": ("ttk_themes", "clear_ttk_theme_cache"),
+    "get_transition_plan": ("theme_transitions", "get_transition_plan"),
+    "clear_transition_cache": ("theme_transitions", "clear_transition_cache"),
+    "WidgetRegistry": ("widget_registry", "WidgetRegistry"),
+    "IncrementalThemeApplication": ("theme_scheduler", "IncrementalThemeApplication"),
+    "ThemeTransaction": ("theme_transactions", "ThemeTransaction"),
+    "theme_transaction": ("theme_transactions", "theme_transaction"),
+    "DeferredTheming": ("deferred_theming", "DeferredTheming"),
+    # Profiling
+    "ThemeProfile": ("theme_profiler", "ThemeProfile"),
+    "profile_theming": ("theme_profiler", "profile_theming"),
+    "enable_profiling": ("theme_profiler", "enable_profiling"),
+    "disable_profiling": ("theme_profiler", "disable_profiling"),
+    "get_active_profile": ("theme_profiler", "get_active_profile"),
+    # Headless widgets
+    "NullCTk": ("null_backend", "NullCTk"),
+    "NullWidget": ("null_backend", "NullWidget"),
+    "null_class": ("null_backend", "null_class"),
+    "create_null_widget": ("null_backend", "create_null_widget"),
+    # ThemeManager and theme loading functionality
+    "ThemeManager": ("theme_manager", "ThemeManager"),
+    "add_theme_search_path": ("theme_manager", "add_theme_search_path"),
+    "get_theme_search_paths": ("theme_manager", "get_theme_search_paths"),
+    "reload_themes": ("theme_manager", "reload_themes"),
+    "load_theme_from_file": ("theme_manager", "load_theme_from_file"),
+    "load_themes_from_directory": ("theme_manager", "load_themes_from_directory"),
+    "get_theme_load_stats": ("theme_loader", "get_load_stats"),
+    "ThemeWatcher": ("theme_watcher", "ThemeWatcher"),
+    "watch_themes": ("theme_watcher", "watch_themes"),
+    "get_theme_cache_directory": ("theme_cache", "get_cache_directory"),
+    "set_theme_cache_directory": ("theme_cache", "set_cache_directory"),
+    "clear_theme_cache": ("theme_cache", "clear"),
+    "apply_global_theme": ("theme_manager", "apply_theme"),
+    "set_global_theme": ("theme_manager", "set_theme"),
+    "get_theme_color": ("theme_manager", "get_theme_color"),
+    "get_primary_color": ("theme_manager", "get_primary_color"),
+    "get_secondary_color": ("theme_manager", "get_secondary_color"),
+    "get_success_color": ("theme_manager", "get_success_color"),
+    "get_danger_color": ("theme_manager", "get_danger_color"),
+    "get_warning_color": ("theme_manager", "get_warning_color"),
+    "get_info_color": ("theme_manager", "get_info_color"),
+}
 
-class CTk(ctk.CTk):
-    """
-    A wrapper around the CTk class that adds theme support.
-    """
-    
-    def __init__(
-        self,
-        style: Optional[str] = None,
-        fg_color: Optional[str | tuple[str, str]] = None,
-        **kwargs
-    ):
-        """
-        Initialize a themed CTk window.
-        
-        Args:
-            style: The name of the theme to apply ("solar", "darkly", "cyborg", "vapor", "monodim", "normal", "aurium")
-            fg_color: The background color of the window (overrides theme if provided)
-            **kwargs: Additional arguments to pass to CTk
-        """
-        # Store the current theme name
-        self._current_theme = None
-        
-        # Initialize the base CTk window
-        super().__init__(fg_color=fg_color, **kwargs)
-        
-        # Apply the theme if provided
-        if style:
-            self.apply_theme(style)
-    
-    def apply_theme(self, theme_name: str) -> None:
-        """
-        Apply a predefined theme to the CTk window.
-        
-        Args:
-            theme_name: The name of the theme to apply
-        """
-        theme_name = theme_name.lower()
-        if theme_name not in THEMES:
-            valid_themes = ", ".join(THEMES.keys())
-            raise ValueError(f"Invalid theme: {theme_name}. Valid themes are: {valid_themes}")
-        
-        # Get the theme configuration
-        theme = THEMES[theme_name]
-        
-        # Store the current theme name
-        self._current_theme = theme_name
-        
-        # Set the appearance mode (light or dark)
-        ctk.set_appearance_mode(theme["appearance_mode"])
-        
-        # Set the default color theme
-        ctk.set_default_color_theme(theme.get("color_theme", "blue"))
-        
-        # Apply custom colors to the window
-        if "window" in theme:
-            for prop, value in theme["window"].items():
-                if hasattr(self, prop):
-                    setattr(self, prop, value)
-        
-        # Apply theme to existing widgets
-        self.update_idletasks()  # Make sure all widgets are created
-        apply_theme_to_all_children(self, theme_name, theme)
-    
-    def get_current_theme(self) -> Optional[str]:
-        """
-        Get the name of the currently applied theme.
-        
-        Returns:
-            The name of the currently applied theme, or None if no theme has been applied
-        """
-        return self._current_theme
-    
-    def apply_theme_to_widget(self, widget, widget_props=None):
-        """
-        Apply the current theme to a specific widget.
-        
-        Args:
-            widget: The widget to apply the theme to
-            widget_props: Optional override for widget properties
-        """
-        if self._current_theme is None:
-            return
-        
-        theme = THEMES[self._current_theme]
-        widget_type = type(widget).__name__.lower()
-        
-        # Get specific properties for this widget type, or use the widget_props if provided
-        if widget_props is None:
-            widget_props = theme.get(widget_type, {})
-        
-        apply_theme_to_widget(widget, self._current_theme, widget_props)
+if TYPE_CHECKING:
+    from customtkinter import *
+    from .themes import (
+        THEMES,
+        get_theme_colors,
+        normalize_themes,
+        resolve_widget_props,
+        get_theme,
+        theme_names,
+        extend_theme,
+        theme_ancestors
+    )
+    from .appearance import register_color_theme
+    from .colors import (
+        Color,
+        color_pair,
+        intern_theme,
+        parse_color,
+        relative_luminance,
+        contrast_ratio,
+        is_light_color,
+        contrast_text_color,
+        mix,
+        lighten,
+        darken,
+        parse_colors,
+        relative_luminances,
+        contrast_ratios,
+        mix_colors
+    )
+    from .theme_generator import generate_theme
+    from .theme_validator import (
+        validate_themes,
+        validate_theme_files,
+        ValidationReport,
+        ContrastViolation
+    )
+    from .theme_objects import Theme, get_theme_object
+    from .theme_pack import (
+        ThemePack,
+        add_theme_pack,
+        remove_theme_pack,
+        get_theme_packs,
+        write_theme_pack,
+        build_theme_pack
+    )
+    from .themed_widgets import CTk, CTkButton, CTkFrame, CTkLabel, CTkEntry
+    from .widget_theme_mapper import (
+        apply_theme_to_widget,
+        apply_theme_to_all_children,
+        apply_theme_to_tree,
+        apply_theme_to_registry,
+        iter_theme_tree,
+        iter_theme_registry,
+        get_theme_mapper,
+        register_mapper,
+        clear_mapper_cache
+    )
+    from .style_plans import compile_theme, get_style_plan, clear_style_plan_cache
+    from .ttk_themes import compile_ttk_theme, use_ttk_theme, ttk_theme_name, clear_ttk_theme_cache
+    from .theme_transitions import get_transition_plan, clear_transition_cache
+    from .widget_registry import WidgetRegistry
+    from .theme_scheduler import IncrementalThemeApplication
+    from .theme_transactions import ThemeTransaction, theme_transaction
+    from .deferred_theming import DeferredTheming
+    from .theme_profiler import (
+        ThemeProfile,
+        profile_theming,
+        enable_profiling,
+        disable_profiling,
+        get_active_profile
+    )
+    from .null_backend import NullCTk, NullWidget, null_class, create_null_widget
+    from .theme_manager import (
+        ThemeManager,
+        add_theme_search_path,
+        get_theme_search_paths,
+        reload_themes,
+        load_theme_from_file,
+        load_themes_from_directory,
+        apply_theme as apply_global_theme,
+        set_theme as set_global_theme,
+        get_theme_color,
+        get_primary_color,
+        get_secondary_color,
+        get_success_color,
+        get_danger_color,
+        get_warning_color,
+        get_info_color
+    )
+    from .theme_loader import get_load_stats as get_theme_load_stats
+    from .theme_watcher import ThemeWatcher, watch_themes
+    from .theme_cache import (
+        get_cache_directory as get_theme_cache_directory,
+        set_cache_directory as set_theme_cache_directory,
+        clear as clear_theme_cache
+    )
 
 
-# Enhanced versions of CustomTkinter widgets with theme support
+def _import_customtkinter():
+    """Import CustomTkinter, explaining how to install it if it is missing"""
+    try:
+        import customtkinter
+    except ImportError:
+        raise ImportError("CustomTkinter is required. Install it with 'pip install customtkinter'.")
+    return customtkinter
 
-class CTkButton(ctk.CTkButton):
-    """Themed version of CTkButton."""
-    
-    def __init__(self, master=None, **kwargs):
-        super().__init__(master, **kwargs)
-        
-        # Apply theme if master has a theme applied
-        if hasattr(master, "get_current_theme") and master.get_current_theme():
-            theme_name = master.get_current_theme()
-            if theme_name and theme_name in THEMES:
-                theme = THEMES[theme_name]
-                if "button" in theme:
-                    button_props = theme["button"]
-                    for prop, value in button_props.items():
-                        if hasattr(self, prop):
-                            setattr(self, prop, value)
-
-
-class CTkFrame(ctk.CTkFrame):
-    """Themed version of CTkFrame."""
-    
-    def __init__(self, master=None, **kwargs):
-        super().__init__(master, **kwargs)
-        
-        # Apply theme if master has a theme applied
-        if hasattr(master, "get_current_theme") and master.get_current_theme():
-            theme_name = master.get_current_theme()
-            if theme_name and theme_name in THEMES:
-                theme = THEMES[theme_name]
-                if "frame" in theme:
-                    frame_props = theme["frame"]
-                    for prop, value in frame_props.items():
-                        if hasattr(self, prop):
-                            setattr(self, prop, value)
-
-
-class CTkLabel(ctk.CTkLabel):
-    """Themed version of CTkLabel."""
-    
-    def __init__(self, master=None, **kwargs):
-        super().__init__(master, **kwargs)
-        
-        # Apply theme if master has a theme applied
-        if hasattr(master, "get_current_theme") and master.get_current_theme():
-            theme_name = master.get_current_theme()
-            if theme_name and theme_name in THEMES:
-                theme = THEMES[theme_name]
-                if "label" in theme:
-                    label_props = theme["label"]
-                    for prop, value in label_props.items():
-                        if hasattr(self, prop):
-                            setattr(self, prop, value)
-
-
-class CTkEntry(ctk.CTkEntry):
-    """Themed version of CTkEntry."""
-    
-    def __init__(self, master=None, **kwargs):
-        super().__init__(master, **kwargs)
+
+def _public_names():
+    """Get the names exported by a star import: the package's and CustomTkinter's"""
+    customtkinter = _import_customtkinter()
+    # Without an __all__, a star import of CustomTkinter exports all of its public globals
+    names = getattr(customtkinter, "__all__", None)
+    if names is None:
+        names = [name for name in vars(customtkinter) if not name.startswith("_")]
+    return list(_LAZY_ATTRIBUTES) + [name for name in names if name not in _LAZY_ATTRIBUTES]
+
+
+def __getattr__(name: str):
+    """Load public names on first access"""
+    target = _LAZY_ATTRIBUTES.get(name)
+    if target is not None:
+        module_name, attribute = target
+        value = getattr(importlib.import_module(f".{module_name}", __name__), attribute)
+    elif name == "__all__":
+        # Built on first use, so only a star import loads CustomTkinter
+        value = _public_names()
+    elif name.startswith("_"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    else:
+        # Submodules that have not been imported yet take precedence over CustomTkinter
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
         
-        # Apply theme if master has a theme applied
-        if hasattr(master, "get_current_theme") and master.get_current_theme():
-            theme_name = master.get_current_theme()
-            if theme_name and theme_name in THEMES:
-                theme = THEMES[theme_name]
-                if "entry" in theme:
-                    entry_props = theme["entry"]
-                    for prop, value in entry_props.items():
-                        if hasattr(self, prop):
-                            setattr(self, prop, value)
-
-
-# Add more themed widgets as needed...
-
-# For backward compatibility with customtkinter, re-export other classes
-# (but without themed versions yet)
-for name, obj in ctk.__dict__.items():
-    if isinstance(obj, type) and name.startswith("CTk") and name not in globals():
-        globals()[name] = obj 
\ No newline at end of file
+        # For backward compatibility with customtkinter, re-export its other names
+        # (but without themed versions yet)
+        try:
+            value = getattr(_import_customtkinter(), name)
+        except AttributeError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    # Cache the value so later lookups do not go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+# Enable theme profiling for the whole process if CTKBOOTSTRAP_PROFILE is set
+if os.environ.get("CTKBOOTSTRAP_PROFILE", "").strip() not in ("", "0"):
+    from .theme_profiler import _enable_from_environment
+    _enable_from_environment()
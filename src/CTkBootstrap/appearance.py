@@ -0,0 +1,103 @@
+"""
+Global CustomTkinter appearance settings for CTkBootstrap.
+
+Loading a CustomTkinter color theme reads and parses its JSON file. set_color_theme()
+only loads a color theme when it changes, and keeps the built-in color themes in memory
+once loaded. Color themes that do not exist as files can be registered as dictionaries:
+
+    register_color_theme("acme", acme_ctk_theme)
+    THEMES["acme"] = {..., "color_theme": "acme"}
+"""
+
+import sys
+import customtkinter as ctk
+from typing import Any, Dict, Mapping
+
+
+# Prepared CustomTkinter color themes by name: registered ones and loaded built-in ones.
+# They are installed as ctk.ThemeManager.theme as they are, so they must not be modified.
+_color_themes: Dict[str, Dict[str, Any]] = {}
+
+if sys.platform == "darwin":
+    _PLATFORM = "macOS"
+elif sys.platform.startswith("win"):
+    _PLATFORM = "Windows"
+else:
+    _PLATFORM = "Linux"
+
+
+def _prepare_color_theme(theme: Mapping[str, Any]) -> Dict[str, Any]:
+    """Apply the platform filtering and name fixes of ctk.ThemeManager.load_theme() to a copy"""
+    prepared = {}
+    for key, value in theme.items():
+        if not isinstance(value, Mapping):
+            raise ValueError(f"Invalid color theme: '{key}' must be a dictionary")
+        # Values that differ per platform are given for each platform
+        if "macOS" in value:
+            value = value[_PLATFORM]
+        prepared[key] = dict(value)
+
+    if "CTkCheckbox" in prepared:
+        prepared["CTkCheckBox"] = prepared.pop("CTkCheckbox")
+    if "CTkRadiobutton" in prepared:
+        prepared["CTkRadioButton"] = prepared.pop("CTkRadiobutton")
+    if "CTkLabel" in prepared:
+        prepared["CTkLabel"].setdefault("border_width", 0)
+        prepared["CTkLabel"].setdefault("border_color", ["black", "white"])
+    return prepared
+
+
+def register_color_theme(name: str, theme: Mapping[str, Any]) -> None:
+    """
+    Register a CustomTkinter color theme held in memory.
+
+    Themes can then use the name as their "color_theme", and set_color_theme() installs
+    it without reading a file.
+
+    Args:
+        name: The color theme name; registering a built-in name ("blue", "green",
+            "dark-blue") replaces the built-in color theme
+        theme: The color theme, in the format of the CustomTkinter theme files, keyed by
+            widget class name. It is copied.
+
+    Raises:
+        ValueError: If the color theme is not a mapping of dictionaries
+    """
+    if not isinstance(theme, Mapping):
+        raise ValueError("Invalid color theme: must be a dictionary")
+    _color_themes[name] = _prepare_color_theme(theme)
+
+
+def set_color_theme(name: str) -> bool:
+    """
+    Set the default CustomTkinter color theme, unless it is already loaded.
+
+    The color theme applies to CustomTkinter widgets created afterwards.
+
+    Args:
+        name: A registered color theme, a built-in CustomTkinter color theme or the
+            path of a color theme file
+
+    Returns:
+        True if the color theme was installed, False if it was already loaded
+    """
+    manager = ctk.ThemeManager
+    loaded = getattr(manager, "_currently_loaded_theme", None)
+    theme = _color_themes.get(name)
+
+    if theme is not None:
+        if loaded == name and manager.theme is theme:
+            return False
+        manager.theme = theme
+        manager._currently_loaded_theme = name
+        return True
+
+    built_in = name in getattr(manager, "_built_in_themes", ())
+    if loaded != name:
+        ctk.set_default_color_theme(name)
+    elif not built_in:
+        return False
+    # Keep built-in color themes, including the one CustomTkinter loads on import
+    if built_in:
+        _color_themes[name] = manager.theme
+    return loaded != name
@@ -0,0 +1,566 @@
+"""
+Color model for CTkBootstrap.
+
+Theme colors are interned: every spelling of a color ("#fff", "#FFFFFF", "#ffffff")
+maps to one shared Color object, and every (light, dark) pair of colors to one shared
+tuple. Themes therefore hold each distinct color once, and comparing two colors of
+interned themes is an identity check.
+
+Color derives from str and holds its canonical spelling (uppercase "#RRGGBB" for hex
+colors), so it can be passed to CustomTkinter and Tk widgets like any color string.
+
+The module also provides the color math used by the theme engine: parsing, WCAG relative
+luminance and contrast ratios, and lightening, darkening and mixing colors. The scalar
+functions are memoized, since themes use few distinct colors. The batch functions
+(parse_colors(), relative_luminances(), contrast_ratios(), mix_colors()) process whole
+palettes at once with NumPy when it is installed, and fall back to the scalar functions
+otherwise.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+class Color(str):
+    """
+    An interned color. Create colors with color(), not by calling the class.
+
+    Attributes:
+        rgb: The color packed as 0xRRGGBB, or None for named colors such as "white"
+    """
+
+    __slots__ = ("rgb",)
+
+    @property
+    def red(self) -> Optional[int]:
+        """The red component (0-255), or None for named colors"""
+        return None if self.rgb is None else self.rgb >> 16
+
+    @property
+    def green(self) -> Optional[int]:
+        """The green component (0-255), or None for named colors"""
+        return None if self.rgb is None else (self.rgb >> 8) & 0xFF
+
+    @property
+    def blue(self) -> Optional[int]:
+        """The blue component (0-255), or None for named colors"""
+        return None if self.rgb is None else self.rgb & 0xFF
+
+    def __repr__(self) -> str:
+        return f"Color({str.__repr__(self)})"
+
+    def __reduce__(self):
+        return color, (str(self),)
+
+
+# Interned colors by every spelling seen, and interned (light, dark) pairs
+_colors: Dict[str, Color] = {}
+_pairs: Dict[Tuple[Color, Color], Tuple[Color, Color]] = {}
+
+# Memoized results of is_color_property() and intern_color_value()
+_color_properties: Dict[str, bool] = {}
+_interned_values: Dict[Any, Any] = {}
+
+
+def _canonicalize(value: str) -> Tuple[Optional[str], Optional[int]]:
+    """Get the canonical spelling and packed RGB of a color, or (None, None) if it is not one color"""
+    if value.startswith("#"):
+        digits = value[1:]
+        if not _HEX_DIGITS.issuperset(digits):
+            return None, None
+        if len(digits) == 3:
+            digits = "".join(digit * 2 for digit in digits)
+        if len(digits) != 6:
+            # Other Tk hex forms (#RRRGGGBBB, #RRRRGGGGBBBB) are kept as they are
+            return (value, None) if len(digits) in (9, 12) else (None, None)
+        digits = digits.upper()
+        return "#" + digits, int(digits, 16)
+    if not value or value.split() != [value]:
+        return None, None
+    return value, None
+
+
+def color(value: str) -> Any:
+    """
+    Get the interned Color for a color string.
+
+    Args:
+        value: A hex color ("#RGB" or "#RRGGBB") or a Tk color name
+
+    Returns:
+        The shared Color object, or value itself if it is not a single color
+        (e.g. an empty string or several colors separated by spaces)
+    """
+    if not isinstance(value, str):
+        return value
+    interned = _colors.get(value)
+    if interned is not None:
+        return interned
+
+    canonical, rgb = _canonicalize(value)
+    if canonical is None:
+        return value
+    interned = _colors.get(canonical)
+    if interned is None:
+        interned = str.__new__(Color, canonical)
+        interned.rgb = rgb
+        _colors[canonical] = interned
+    _colors[value] = interned
+    return interned
+
+
+def color_pair(light: str, dark: str) -> Tuple[Any, Any]:
+    """
+    Get the interned (light, dark) tuple of two colors.
+
+    Args:
+        light: The color used in light appearance mode
+        dark: The color used in dark appearance mode
+
+    Returns:
+        The shared tuple of the two interned colors
+    """
+    pair = (color(light), color(dark))
+    return _pairs.setdefault(pair, pair)
+
+
+def intern_color_value(value: Any) -> Any:
+    """
+    Intern a theme property value if it is a color or a (light, dark) pair of colors.
+
+    Args:
+        value: A theme property value
+
+    Returns:
+        The interned Color or pair, or value unchanged if it is not a color
+    """
+    try:
+        return _interned_values[value]
+    except (KeyError, TypeError):
+        pass
+
+    interned = value
+    if isinstance(value, str):
+        interned = color(value)
+    elif isinstance(value, (tuple, list)) and len(value) == 2 and isinstance(value[0], str) and isinstance(value[1], str):
+        pair = color_pair(value[0], value[1])
+        if isinstance(pair[0], Color) and isinstance(pair[1], Color):
+            interned = pair
+    if isinstance(value, (str, tuple)):
+        _interned_values[value] = interned
+    return interned
+
+
+def is_color_property(prop: str) -> bool:
+    """
+    Check whether a widget property takes a color, e.g. fg_color, bg or selectbackground.
+
+    Args:
+        prop: The property name
+
+    Returns:
+        True if the property holds a color
+    """
+    is_color = _color_properties.get(prop)
+    if is_color is None:
+        is_color = _color_properties[prop] = (
+            prop in ("bg", "fg")
+            or prop.endswith("color")
+            or prop.endswith("background")
+            or prop.endswith("foreground")
+        )
+    return is_color
+
+
+def intern_props(props: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Intern the colors of per-widget properties in place. Only color properties (see
+    is_color_property()) are interned.
+
+    Args:
+        props: A mapping from widget keys to property dictionaries
+
+    Returns:
+        props, for chaining
+    """
+    # Inlined lookups: this runs over every property of every loaded theme
+    color_properties = _color_properties
+    interned_values = _interned_values
+    for widget_props in props.values():
+        if isinstance(widget_props, dict):
+            for prop, value in widget_props.items():
+                is_color = color_properties.get(prop)
+                if is_color is None:
+                    is_color = is_color_property(prop)
+                if is_color:
+                    try:
+                        widget_props[prop] = interned_values[value]
+                    except (KeyError, TypeError):
+                        widget_props[prop] = intern_color_value(value)
+    return props
+
+
+def intern_theme(theme: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Intern the colors of a theme configuration in place: its palette and the color
+    properties of every widget key.
+
+    Args:
+        theme: The theme configuration
+
+    Returns:
+        theme, for chaining
+    """
+    palette = theme.get("colors")
+    if isinstance(palette, dict):
+        for name, value in palette.items():
+            palette[name] = intern_color_value(value)
+    return intern_props(theme)
+
+
+def interned_color_count() -> int:
+    """
+    Get the number of distinct colors interned so far.
+
+    Returns:
+        The number of Color objects
+    """
+    return len(set(map(id, _colors.values())))
+
+
+# Color math
+
+# A color accepted by the color math functions: a hex string or an (r, g, b) tuple of 0-255 values
+ColorValue = Union[str, Tuple[int, int, int]]
+
+_CACHE_SIZE = 4096
+
+# Linear-light value of each 8-bit sRGB channel value, as defined by WCAG 2
+_LINEAR = tuple(
+    value / 12.92 if value <= 0.04045 else ((value + 0.055) / 1.055) ** 2.4
+    for value in (channel / 255 for channel in range(256))
+)
+
+# Relative luminance above which black text contrasts more than white text
+_LIGHT_LUMINANCE = (1.05 * 0.05) ** 0.5 - 0.05
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _parse_hex(value: str) -> Tuple[int, int, int]:
+    digits = value[1:] if value.startswith("#") else value
+    if not _HEX_DIGITS.issuperset(digits) or len(digits) not in (3, 6, 9, 12):
+        raise ValueError(f"Invalid color: {value!r}. Expected a hex color such as '#RRGGBB'")
+    if len(digits) == 3:
+        return tuple(int(digit * 2, 16) for digit in digits)
+    width = len(digits) // 3
+    # Tk's 12 and 16 bit per channel forms are scaled down to 8 bits
+    return tuple(int(digits[i:i + 2], 16) for i in range(0, len(digits), width))
+
+
+def parse_color(value: ColorValue) -> Tuple[int, int, int]:
+    """
+    Parse a color into its red, green and blue components.
+
+    Args:
+        value: A hex color ("#RGB", "#RRGGBB", "#RRRGGGBBB" or "#RRRRGGGGBBBB", the "#"
+            is optional) or an (r, g, b) tuple
+
+    Returns:
+        The (r, g, b) components, from 0 to 255
+
+    Raises:
+        ValueError: If the value is not a hex color or a valid (r, g, b) tuple
+    """
+    if type(value) is Color and value.rgb is not None:
+        rgb = value.rgb
+        return rgb >> 16, (rgb >> 8) & 0xFF, rgb & 0xFF
+    if isinstance(value, str):
+        return _parse_hex(value)
+    if isinstance(value, (tuple, list)) and len(value) == 3 and all(
+            isinstance(channel, int) and 0 <= channel <= 255 for channel in value):
+        return tuple(value)
+    raise ValueError(f"Invalid color: {value!r}. Expected a hex color or an (r, g, b) tuple")
+
+
+def to_hex(rgb: Sequence[int]) -> Any:
+    """
+    Get the interned Color of red, green and blue components.
+
+    Args:
+        rgb: The (r, g, b) components, from 0 to 255
+
+    Returns:
+        The shared Color, spelled "#RRGGBB"
+    """
+    r, g, b = rgb
+    return color(f"#{r:02X}{g:02X}{b:02X}")
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def relative_luminance(value: ColorValue) -> float:
+    """
+    Get the relative luminance of a color, as defined by WCAG 2.
+
+    Args:
+        value: A hex color or an (r, g, b) tuple
+
+    Returns:
+        The luminance, from 0 (black) to 1 (white)
+    """
+    r, g, b = parse_color(value)
+    return 0.2126 * _LINEAR[r] + 0.7152 * _LINEAR[g] + 0.0722 * _LINEAR[b]
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def contrast_ratio(foreground: ColorValue, background: ColorValue) -> float:
+    """
+    Get the WCAG 2 contrast ratio of two colors. WCAG AA asks for at least 4.5 for
+    normal text and 3 for large text.
+
+    Args:
+        foreground: A hex color or an (r, g, b) tuple
+        background: A hex color or an (r, g, b) tuple
+
+    Returns:
+        The contrast ratio, from 1 (same luminance) to 21 (black on white)
+    """
+    lighter = relative_luminance(foreground)
+    darker = relative_luminance(background)
+    if lighter < darker:
+        lighter, darker = darker, lighter
+    return (lighter + 0.05) / (darker + 0.05)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def is_light_color(value: ColorValue) -> bool:
+    """
+    Check whether a color is light, i.e. black text has more contrast on it than white text.
+
+    Args:
+        value: A hex color or an (r, g, b) tuple
+
+    Returns:
+        True for light colors, False for dark colors
+    """
+    return relative_luminance(value) > _LIGHT_LUMINANCE
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def contrast_text_color(background: ColorValue, light: str = "#FFFFFF", dark: str = "#000000") -> Any:
+    """
+    Pick the text color with the most contrast on a background.
+
+    Args:
+        background: The background color
+        light: The text color for dark backgrounds
+        dark: The text color for light backgrounds
+
+    Returns:
+        The interned Color of light or dark
+    """
+    if contrast_ratio(dark, background) > contrast_ratio(light, background):
+        return color(dark)
+    return color(light)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def mix(color1: ColorValue, color2: ColorValue, amount: float = 0.5) -> Any:
+    """
+    Mix two colors in sRGB space.
+
+    Args:
+        color1: The base color
+        color2: The color mixed in
+        amount: The share of color2, from 0 (color1) to 1 (color2)
+
+    Returns:
+        The interned Color of the mix
+    """
+    if not 0 <= amount <= 1:
+        raise ValueError(f"amount must be between 0 and 1, got {amount}")
+    r1, g1, b1 = parse_color(color1)
+    r2, g2, b2 = parse_color(color2)
+    return to_hex((
+        int(r1 + (r2 - r1) * amount + 0.5),
+        int(g1 + (g2 - g1) * amount + 0.5),
+        int(b1 + (b2 - b1) * amount + 0.5),
+    ))
+
+
+def lighten(value: ColorValue, amount: float) -> Any:
+    """
+    Lighten a color by mixing it with white, like Bootstrap's tint-color().
+
+    Args:
+        value: A hex color or an (r, g, b) tuple
+        amount: The share of white, from 0 to 1
+
+    Returns:
+        The interned Color of the lighter color
+    """
+    return mix(value, "#FFFFFF", amount)
+
+
+def darken(value: ColorValue, amount: float) -> Any:
+    """
+    Darken a color by mixing it with black, like Bootstrap's shade-color().
+
+    Args:
+        value: A hex color or an (r, g, b) tuple
+        amount: The share of black, from 0 to 1
+
+    Returns:
+        The interned Color of the darker color
+    """
+    return mix(value, "#000000", amount)
+
+
+def clear_color_math_cache() -> None:
+    """Empty the caches of the scalar color math functions"""
+    for function in (_parse_hex, relative_luminance, contrast_ratio, is_light_color, contrast_text_color, mix):
+        function.cache_clear()
+
+
+# Batch color math
+
+# NumPy is imported on first use of a batch function, as it is slow to import
+_numpy_module: Any = False
+
+# _LINEAR and the luminance weights as NumPy arrays
+_linear_array: Any = None
+_luminance_weights: Any = None
+
+
+def _numpy() -> Any:
+    """Import NumPy on first use; None if it is not installed"""
+    global _numpy_module, _linear_array, _luminance_weights
+    if _numpy_module is False:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        else:
+            _linear_array = numpy.array(_LINEAR)
+            _luminance_weights = numpy.array((0.2126, 0.7152, 0.0722))
+        _numpy_module = numpy
+    return _numpy_module
+
+
+def has_numpy() -> bool:
+    """
+    Check whether the batch functions use NumPy.
+
+    Returns:
+        True if NumPy is installed
+    """
+    return _numpy() is not None
+
+
+def parse_colors(values: Iterable[ColorValue]) -> Any:
+    """
+    Parse many colors at once.
+
+    Args:
+        values: Hex colors or (r, g, b) tuples
+
+    Returns:
+        An (n, 3) uint8 NumPy array of the components, or a list of (r, g, b) tuples if
+        NumPy is not installed
+
+    Raises:
+        ValueError: If a value is not a color
+    """
+    components = [parse_color(value) for value in values]
+    np = _numpy()
+    if np is None:
+        return components
+    return np.array(components, dtype=np.uint8).reshape(-1, 3)
+
+
+def relative_luminances(values: Iterable[ColorValue]) -> Any:
+    """
+    Get the WCAG relative luminance of many colors at once.
+
+    Args:
+        values: Hex colors or (r, g, b) tuples
+
+    Returns:
+        A float NumPy array, or a list of floats if NumPy is not installed
+    """
+    np = _numpy()
+    if np is None:
+        return [relative_luminance(_hashable(value)) for value in values]
+    return _luminances(parse_colors(values))
+
+
+def _luminances(components: Any) -> Any:
+    return _linear_array[components] @ _luminance_weights
+
+
+def contrast_ratios(foregrounds: Iterable[ColorValue], backgrounds: Iterable[ColorValue]) -> Any:
+    """
+    Get the WCAG contrast ratios of many pairs of colors at once.
+
+    Args:
+        foregrounds: Hex colors or (r, g, b) tuples
+        backgrounds: The colors to compare them with, one per foreground
+
+    Returns:
+        A float NumPy array, or a list of floats if NumPy is not installed
+
+    Raises:
+        ValueError: If the two sequences have different lengths
+    """
+    foregrounds = list(foregrounds)
+    backgrounds = list(backgrounds)
+    if len(foregrounds) != len(backgrounds):
+        raise ValueError(f"Got {len(foregrounds)} foregrounds but {len(backgrounds)} backgrounds")
+
+    np = _numpy()
+    if np is None:
+        return [
+            contrast_ratio(_hashable(foreground), _hashable(background))
+            for foreground, background in zip(foregrounds, backgrounds)
+        ]
+    luminances = _luminances(parse_colors(foregrounds + backgrounds))
+    first, second = luminances[:len(foregrounds)], luminances[len(foregrounds):]
+    return (np.maximum(first, second) + 0.05) / (np.minimum(first, second) + 0.05)
+
+
+def mix_colors(colors1: Iterable[ColorValue], colors2: Iterable[ColorValue], amount: float = 0.5) -> List[Any]:
+    """
+    Mix many pairs of colors at once, e.g. to derive the hover colors of a palette.
+
+    Args:
+        colors1: The base colors
+        colors2: The colors mixed in, one per base color
+        amount: The share of colors2, from 0 to 1
+
+    Returns:
+        A list of interned Colors
+
+    Raises:
+        ValueError: If the two sequences have different lengths
+    """
+    colors1 = list(colors1)
+    colors2 = list(colors2)
+    if len(colors1) != len(colors2):
+        raise ValueError(f"Got {len(colors1)} base colors but {len(colors2)} colors to mix in")
+    if not 0 <= amount <= 1:
+        raise ValueError(f"amount must be between 0 and 1, got {amount}")
+
+    np = _numpy()
+    if np is None:
+        return [mix(_hashable(first), _hashable(second), amount) for first, second in zip(colors1, colors2)]
+    components = parse_colors(colors1 + colors2).astype(np.float64)
+    first, second = components[:len(colors1)], components[len(colors1):]
+    mixed = (first + (second - first) * amount + 0.5).astype(np.int64)
+    return [to_hex(rgb) for rgb in mixed.tolist()]
+
+
+def _hashable(value: ColorValue) -> ColorValue:
+    """Turn [r, g, b] lists into tuples for the memoized scalar functions"""
+    return value if isinstance(value, str) else tuple(value)
@@ -0,0 +1,170 @@
+"""
+Visibility-aware theming for CTkBootstrap.
+
+Applications often keep many hidden CTkTabview tabs and withdrawn CTkToplevel windows
+alive. DeferredTheming lets a theme switch skip every subtree that is not mapped: the
+subtree is marked with the pending theme version and themed on its first <Map> event,
+so the cost of a switch depends on what is on screen rather than on the widget count.
+"""
+
+import weakref
+import tkinter as tk
+from typing import Any, Callable, Dict, Optional
+
+
+class DeferredTheming:
+    """
+    Tracks widget subtrees whose theming was deferred until they are mapped.
+    """
+
+    def __init__(self, window: tk.Misc, apply_subtree: Callable[[Any], None]):
+        """
+        Initialize the tracker.
+
+        Args:
+            window: The window whose theme is being applied; it is never deferred
+            apply_subtree: Called with the root of a deferred subtree when it is mapped,
+                to theme that subtree with the window's current theme
+        """
+        self._window = window
+        self._apply_subtree = apply_subtree
+        self._version = 0
+        # Deferred subtree roots -> theme version they are waiting for
+        self._pending = weakref.WeakKeyDictionary()
+        # Widgets that already have a <Map> binding
+        self._bound = weakref.WeakSet()
+
+    @property
+    def version(self) -> int:
+        """The theme version of the most recent theme switch"""
+        return self._version
+
+    @property
+    def pending_count(self) -> int:
+        """The number of subtrees still waiting to be themed"""
+        return len(self._pending)
+
+    def is_pending(self, widget: Any) -> bool:
+        """Whether a widget is the root of a subtree still waiting to be themed"""
+        try:
+            return widget in self._pending
+        except TypeError:
+            return False
+
+    def begin_switch(self) -> int:
+        """
+        Start a new theme switch.
+
+        Returns:
+            The new theme version
+        """
+        self._version += 1
+        return self._version
+
+    def clear(self) -> None:
+        """Forget all pending subtrees, e.g. after a switch that themed every widget"""
+        self._pending.clear()
+
+    def defer_if_unmapped(self, widget: Any) -> bool:
+        """
+        Defer a widget's subtree if the widget is not mapped.
+
+        Intended as the defer callback of widget_theme_mapper.iter_theme_tree, which
+        stops descending into widgets for which it returns True.
+
+        Args:
+            widget: The widget about to be themed
+
+        Returns:
+            True if the widget's subtree was deferred
+        """
+        if widget is self._window:
+            return False
+        try:
+            if widget.winfo_ismapped():
+                return False
+        except (tk.TclError, AttributeError):
+            return False
+        return self._defer(widget)
+
+    def hidden_ancestor_deferrer(self) -> Callable[[Any], bool]:
+        """
+        Create a defer callback for widgets visited without a tree walk (e.g. a registry).
+
+        A widget is deferred when it or one of its masters is not mapped; the outermost
+        unmapped master becomes the deferred subtree root. Results are memoized for the
+        lifetime of the returned callback, i.e. for one theme switch.
+
+        Returns:
+            A callback taking a widget and returning True if its theming was deferred
+        """
+        # Widget -> outermost unmapped widget on its path to the window, or None
+        hidden_roots: Dict[int, Optional[Any]] = {}
+
+        def resolve(widget: Any) -> Optional[Any]:
+            chain = []
+            node = widget
+            hidden_root = None
+            while node is not None and node is not self._window:
+                if id(node) in hidden_roots:
+                    hidden_root = hidden_roots[id(node)]
+                    break
+                chain.append(node)
+                node = getattr(node, "master", None)
+
+            # Resolve from the outermost master inwards
+            for node in reversed(chain):
+                if hidden_root is None:
+                    try:
+                        if not node.winfo_ismapped():
+                            hidden_root = node
+                    except (tk.TclError, AttributeError):
+                        pass
+                hidden_roots[id(node)] = hidden_root
+            return hidden_root
+
+        def defer(widget: Any) -> bool:
+            hidden_root = resolve(widget)
+            if hidden_root is None:
+                return False
+            self._defer(hidden_root)
+            return True
+
+        return defer
+
+    def _defer(self, widget: Any) -> bool:
+        """Mark a subtree as pending and make sure its first <Map> themes it"""
+        try:
+            self._pending[widget] = self._version
+        except TypeError:
+            # Widgets that cannot be weakly referenced are themed right away
+            return False
+
+        if widget not in self._bound:
+            widget_path = str(widget)
+            widget_ref = weakref.ref(widget)
+            tracker_ref = weakref.ref(self)
+
+            def on_map(event):
+                # Toplevel windows also receive <Map> for each of their children
+                if str(event.widget) != widget_path:
+                    return
+                tracker = tracker_ref()
+                mapped = widget_ref()
+                if tracker is not None and mapped is not None:
+                    tracker._on_map(mapped)
+
+            # CustomTkinter widgets do not allow bind() on themselves, so bind on the Tk widget
+            try:
+                tk.Misc.bind(widget, "<Map>", on_map, add="+")
+            except tk.TclError:
+                del self._pending[widget]
+                return False
+            self._bound.add(widget)
+        return True
+
+    def _on_map(self, widget: Any) -> None:
+        """Theme a deferred subtree the first time it is mapped after a switch"""
+        if self._pending.pop(widget, None) is None:
+            return
+        self._apply_subtree(widget)
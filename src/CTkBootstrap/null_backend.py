@@ -0,0 +1,305 @@
+"""
+Null widget backend for CTkBootstrap.
+
+Stand-ins for CustomTkinter, tk and ttk widgets that live entirely in memory: no Tcl
+interpreter and no display are needed. Each stand-in class derives from the real
+widget class, so the theme engine dispatches on it exactly as on the real widget, but
+configure() only records the options it receives. This allows profiling, benchmarking
+and regression-testing the theme engine on headless machines.
+
+Example:
+    root = NullCTk()
+    frame = create_null_widget(ctk.CTkFrame, root)
+    button = create_null_widget(ctk.CTkButton, frame, text="OK")
+    root.apply_theme("darkly")
+    print(button.configure_calls)
+"""
+
+import itertools
+import tkinter as tk
+import customtkinter as ctk
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from .themed_widgets import CTk as ThemedCTk
+
+
+# Internal tk widgets that CustomTkinter widgets create, by attribute name
+_INTERNAL_WIDGETS: Dict[type, Dict[str, type]] = {
+    ctk.CTkBaseClass: {"_canvas": tk.Canvas},
+    ctk.CTkTextbox: {"_textbox": tk.Text},
+    ctk.CTkEntry: {"_entry": tk.Entry},
+}
+
+# Stand-in class per real widget class
+_null_classes: Dict[type, type] = {}
+
+_widget_ids = itertools.count(1)
+
+
+class _NullInterpreter:
+    """Stands in for the Tcl interpreter of a null widget tree (the widgets' tk attribute)"""
+
+
+class _NullEvent:
+    """The event passed to callbacks bound on null widgets"""
+
+    def __init__(self, widget: Any, sequence: str):
+        self.widget = widget
+        self.type = sequence.strip("<>")
+
+
+class NullWidget(tk.Misc):
+    """
+    In-memory stand-in behavior shared by all null widgets.
+
+    Null widget classes derive from this class first and from the real widget class
+    second; use null_class() or create_null_widget() to get them.
+    """
+
+    def __init__(self, master: Any = None, **options):
+        """
+        Initialize a null widget without creating any Tk widget.
+
+        Args:
+            master: The parent null widget, or None for a root window
+            **options: The initial widget options, as passed to the real widget
+        """
+        # Tk windows look up missing attributes on self.tk, so it is set first
+        if master is None:
+            self.tk = _NullInterpreter()
+            self._w = "."
+            self._null_root = self
+            self.configure_log: List[Tuple[Any, Dict[str, Any]]] = []
+            self._null_idle: List[Tuple[str, Callable, tuple]] = []
+            self._null_timers: List[Tuple[str, Callable, tuple]] = []
+        else:
+            self.tk = master.tk
+            self._w = f"{master._w.rstrip('.')}.!null{type(self).__name__.lower()}{next(_widget_ids)}"
+            self._null_root = master._null_root
+            master._null_children.append(self)
+
+        self.master = master
+        self.children = {}
+        self.configure_calls: List[Dict[str, Any]] = []
+        self._null_options = dict(options)
+        self._null_children: List[Any] = []
+        self._null_bindings: Dict[str, List[Tuple[str, Callable]]] = {}
+        self._null_mapped = master is None
+        self._null_destroyed = False
+        self._create_internal_widgets()
+
+    def _create_internal_widgets(self) -> None:
+        """Create stand-ins for the internal tk widgets of CustomTkinter widgets"""
+        for widget_class, internals in _INTERNAL_WIDGETS.items():
+            if isinstance(self, widget_class):
+                for attribute, internal_class in internals.items():
+                    internal = create_null_widget(internal_class, self)
+                    # CustomTkinter places its internal widgets right away
+                    internal._null_mapped = True
+                    setattr(self, attribute, internal)
+
+    # Options
+
+    def configure(self, cnf: Optional[Dict[str, Any]] = None, **kwargs):
+        """Record the options; with no options, return the current options like Tk does"""
+        if cnf:
+            kwargs = dict(cnf, **kwargs)
+        if not kwargs:
+            return dict(self._null_options)
+        self.configure_calls.append(kwargs)
+        self._null_root.configure_log.append((self, kwargs))
+        self._null_options.update(kwargs)
+
+    config = configure
+
+    def cget(self, key: str) -> Any:
+        """Get an option set at creation or by configure(), or None"""
+        return self._null_options.get(key)
+
+    def _draw(self, *args, **kwargs) -> None:
+        """Null widgets have nothing to draw"""
+
+    # Widget tree
+
+    def winfo_children(self) -> List[Any]:
+        return list(self._null_children)
+
+    def winfo_exists(self) -> int:
+        return 0 if self._null_destroyed else 1
+
+    def winfo_ismapped(self) -> int:
+        return 1 if self._null_mapped else 0
+
+    def destroy(self) -> None:
+        """Remove the widget and its descendants, firing their <Destroy> bindings"""
+        if self._null_destroyed:
+            return
+        for child in list(self._null_children):
+            child.destroy()
+        self._null_destroyed = True
+        self.event_generate("<Destroy>")
+        if self.master is not None and self in self.master._null_children:
+            self.master._null_children.remove(self)
+
+    # Geometry management only tracks whether the widget is mapped
+
+    def _set_mapped(self, mapped: bool) -> None:
+        was_mapped = self._null_mapped
+        self._null_mapped = mapped
+        if mapped and not was_mapped:
+            self.event_generate("<Map>")
+        elif was_mapped and not mapped:
+            self.event_generate("<Unmap>")
+
+    def pack(self, *args, **kwargs) -> None:
+        self._set_mapped(True)
+
+    def grid(self, *args, **kwargs) -> None:
+        self._set_mapped(True)
+
+    def place(self, *args, **kwargs) -> None:
+        self._set_mapped(True)
+
+    def pack_forget(self) -> None:
+        self._set_mapped(False)
+
+    def grid_forget(self) -> None:
+        self._set_mapped(False)
+
+    def place_forget(self) -> None:
+        self._set_mapped(False)
+
+    # Events
+
+    def _bind(self, what, sequence, func, add, needcleanup=1):
+        """Store the callback; tk.Misc.bind() and its variants end up here"""
+        if func is None:
+            return [funcid for funcid, _ in self._null_bindings.get(sequence, ())]
+        funcid = f"{id(func)}{func.__name__ if hasattr(func, '__name__') else 'callback'}"
+        bindings = self._null_bindings.setdefault(sequence, [])
+        if not add:
+            bindings.clear()
+        bindings.append((funcid, func))
+        return funcid
+
+    def unbind(self, sequence: str, funcid: Optional[str] = None) -> None:
+        bindings = self._null_bindings.get(sequence, [])
+        bindings[:] = [binding for binding in bindings if funcid is not None and binding[0] != funcid]
+
+    def event_generate(self, sequence: str, **kwargs) -> None:
+        """Call the callbacks bound to a sequence on this widget"""
+        event = _NullEvent(self, sequence)
+        for _, func in list(self._null_bindings.get(sequence, ())):
+            func(event)
+
+    # Scheduling: after_idle() callbacks run in update_idletasks(), after() callbacks in update()
+
+    def after(self, ms, func: Optional[Callable] = None, *args) -> Optional[str]:
+        if func is None:
+            return None
+        after_id = f"after#{next(_widget_ids)}"
+        self._null_root._null_timers.append((after_id, func, args))
+        return after_id
+
+    def after_idle(self, func: Callable, *args) -> str:
+        after_id = f"after#{next(_widget_ids)}"
+        self._null_root._null_idle.append((after_id, func, args))
+        return after_id
+
+    def after_cancel(self, after_id: str) -> None:
+        root = self._null_root
+        root._null_idle[:] = [entry for entry in root._null_idle if entry[0] != after_id]
+        root._null_timers[:] = [entry for entry in root._null_timers if entry[0] != after_id]
+
+    def update_idletasks(self) -> None:
+        """Run the pending after_idle() callbacks, including ones they schedule"""
+        idle = self._null_root._null_idle
+        while idle:
+            _, func, args = idle.pop(0)
+            func(*args)
+
+    def update(self) -> None:
+        """Run the pending idle callbacks, then the after() callbacks scheduled so far"""
+        self.update_idletasks()
+        root = self._null_root
+        timers, root._null_timers = root._null_timers, []
+        for _, func, args in timers:
+            func(*args)
+        self.update_idletasks()
+
+    def run_pending(self, limit: int = 100000) -> int:
+        """
+        Run scheduled callbacks until none are left, e.g. to finish an incremental switch.
+
+        Args:
+            limit: The maximum number of update() rounds
+
+        Returns:
+            The number of update() rounds run
+        """
+        root = self._null_root
+        rounds = 0
+        while (root._null_idle or root._null_timers) and rounds < limit:
+            self.update()
+            rounds += 1
+        return rounds
+
+
+def null_class(widget_class: type) -> type:
+    """
+    Get the null stand-in class for a widget class.
+
+    Args:
+        widget_class: A CustomTkinter, tk or ttk widget class, or a subclass of one
+
+    Returns:
+        A class deriving from NullWidget and widget_class. It has the same name as
+        widget_class, so it is themed and profiled under the same name.
+    """
+    if issubclass(widget_class, NullWidget):
+        return widget_class
+    stand_in = _null_classes.get(widget_class)
+    if stand_in is None:
+        stand_in = type(widget_class.__name__, (NullWidget, widget_class), {
+            "__module__": __name__,
+            "__doc__": f"In-memory stand-in for {widget_class.__module__}.{widget_class.__qualname__}.",
+        })
+        _null_classes[widget_class] = stand_in
+    return stand_in
+
+
+def create_null_widget(widget_class: type, master: Any = None, **options) -> Any:
+    """
+    Create a null stand-in for a widget.
+
+    Args:
+        widget_class: The class of the real widget, e.g. ctk.CTkButton or ttk.Label
+        master: The parent null widget, or None for a root window
+        **options: The widget options, as passed to the real widget
+
+    Returns:
+        The null widget
+    """
+    return null_class(widget_class)(master, **options)
+
+
+class NullCTk(NullWidget, ThemedCTk):
+    """
+    In-memory stand-in for the themed CTk window of this package.
+    """
+
+    def __init__(self, style: Optional[str] = None, track_widgets: bool = False, **options):
+        """
+        Initialize a null themed window.
+
+        Args:
+            style: The name of the theme to apply
+            track_widgets: Keep a registry of the window's widgets (see widget_registry)
+            **options: The initial window options
+        """
+        NullWidget.__init__(self, None, **options)
+        self._init_theme_state(track_widgets)
+        if style:
+            self.apply_theme(style)
+
+
+_null_classes[ThemedCTk] = NullCTk
@@ -0,0 +1,73 @@
+"""
+Compiled style plans for CTkBootstrap.
+
+A style plan is a theme entry from THEMES compiled into a mapping from widget class
+to the keyword arguments of a single configure() call. Plans are built once per theme
+and cached, so applying a theme costs exactly one configure() (and one redraw) per widget.
+"""
+
+from typing import Dict, Any, Optional, Tuple
+from .themes import get_theme
+from .widget_theme_mapper import WIDGET_THEME_PROPERTIES, WIDGET_THEME_KEYS
+
+
+# A compiled theme: widget class -> configure() keyword arguments
+StylePlan = Dict[type, Dict[str, Any]]
+
+# Compiled plans keyed by theme name. The source theme dictionary is stored next to
+# its plan so that a theme replaced in THEMES is recompiled on its next use.
+_style_plan_cache: Dict[str, Tuple[Dict[str, Any], StylePlan]] = {}
+
+
+def compile_theme(theme_data: Dict[str, Any]) -> StylePlan:
+    """
+    Compile a theme configuration into a style plan.
+
+    Args:
+        theme_data: The theme configuration, as found in THEMES
+
+    Returns:
+        A dictionary mapping each supported widget class to the keyword arguments
+        for one configure() call. Classes without theme properties map to an empty dict.
+    """
+    plan = {}
+    for widget_class, prop_names in WIDGET_THEME_PROPERTIES.items():
+        theme_props = theme_data.get(WIDGET_THEME_KEYS[widget_class], {})
+        plan[widget_class] = {prop: theme_props[prop] for prop in prop_names if prop in theme_props}
+    return plan
+
+
+def get_style_plan(theme_name: str) -> StylePlan:
+    """
+    Get the compiled style plan for a theme, compiling it on first use.
+
+    The returned plan is shared between callers and must not be modified.
+
+    Args:
+        theme_name: The name of the theme
+
+    Returns:
+        The compiled style plan
+    """
+    theme_name = theme_name.lower()
+    theme_data = get_theme(theme_name)
+    cached = _style_plan_cache.get(theme_name)
+    if cached is None or cached[0] is not theme_data:
+        cached = (theme_data, compile_theme(theme_data))
+        _style_plan_cache[theme_name] = cached
+    return cached[1]
+
+
+def clear_style_plan_cache(theme_name: Optional[str] = None) -> None:
+    """
+    Discard compiled style plans.
+
+    Call this after modifying a theme dictionary in place.
+
+    Args:
+        theme_name: The theme whose plan should be discarded, or None to discard all plans
+    """
+    if theme_name is None:
+        _style_plan_cache.clear()
+    else:
+        _style_plan_cache.pop(theme_name.lower(), None)
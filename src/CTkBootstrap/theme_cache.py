@@ -0,0 +1,269 @@
+"""
+Persistent cache of compiled theme files for CTkBootstrap.
+
+Compiling a theme file means parsing its JSON, normalizing it and resolving the
+fallbacks of every widget kind. The result is stored in the user cache directory in
+marshal format, keyed by a hash of the file contents, the CTkBootstrap version and the
+Python version, so a warm start loads fully resolved themes without parsing JSON.
+
+An entry is stale as soon as its file changes or CTkBootstrap is upgraded. evict(),
+which the theme loader calls after storing new entries, removes all but the newest
+entry of each file, then the least recently used entries beyond MAX_ENTRIES.
+
+The cache directory can be set with the CTKBOOTSTRAP_CACHE_DIR environment variable;
+setting it to an empty string or "0" disables the cache.
+"""
+
+import os
+import sys
+import marshal
+import hashlib
+import tempfile
+from typing import Any, Dict, Optional, Tuple
+from . import __version__
+
+
+# Bumped whenever the layout of compiled entries changes
+FORMAT_VERSION = 2
+
+# Maximum number of entries kept in the cache directory
+MAX_ENTRIES = 1024
+
+_MAGIC = b"CTKBTC%d" % FORMAT_VERSION
+_ENTRY_EXTENSION = ".ctkc"
+
+# Mixed into every key, so entries of other versions are never loaded
+_KEY_PREFIX = f"{FORMAT_VERSION}|{__version__}|{sys.version_info[:2]}|{marshal.version}|".encode()
+
+_cache_directory: Optional[str] = None
+_cache_directory_set = False
+
+
+def _default_cache_directory() -> Optional[str]:
+    """Get the cache directory from the environment or the platform conventions"""
+    configured = os.environ.get("CTKBOOTSTRAP_CACHE_DIR")
+    if configured is not None:
+        configured = configured.strip()
+        return None if configured in ("", "0") else os.path.expanduser(configured)
+
+    home = os.path.expanduser("~")
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.join(home, "AppData", "Local")
+        return os.path.join(base, "CTkBootstrap", "Cache")
+    if sys.platform == "darwin":
+        return os.path.join(home, "Library", "Caches", "CTkBootstrap")
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(home, ".cache")
+    return os.path.join(base, "ctkbootstrap")
+
+
+def get_cache_directory() -> Optional[str]:
+    """
+    Get the directory compiled themes are stored in.
+
+    Returns:
+        The directory path, or None if the cache is disabled
+    """
+    global _cache_directory, _cache_directory_set
+    if not _cache_directory_set:
+        _cache_directory = _default_cache_directory()
+        _cache_directory_set = True
+    return _cache_directory
+
+
+def set_cache_directory(path: Optional[str]) -> None:
+    """
+    Set the directory compiled themes are stored in.
+
+    Args:
+        path: The directory path, or None to disable the cache
+    """
+    global _cache_directory, _cache_directory_set
+    _cache_directory = os.path.abspath(os.path.expanduser(path)) if path is not None else None
+    _cache_directory_set = True
+
+
+def cache_key(source: bytes) -> str:
+    """
+    Get the cache key of a theme file.
+
+    Args:
+        source: The contents of the theme file
+
+    Returns:
+        A hex digest of the contents, the CTkBootstrap version and the Python version
+    """
+    return hashlib.sha256(_KEY_PREFIX + source).hexdigest()[:40]
+
+
+def _source_prefix(source_path: str) -> str:
+    """The part of the entry file names that identifies the theme file"""
+    return hashlib.sha1(os.path.abspath(source_path).encode("utf-8", "surrogatepass")).hexdigest()[:16]
+
+
+def _entry_path(directory: str, source_path: str, key: str) -> str:
+    return os.path.join(directory, f"{_source_prefix(source_path)}-{key}{_ENTRY_EXTENSION}")
+
+
+def load(source_path: str, key: str) -> Optional[Dict[str, Any]]:
+    """
+    Load a compiled theme.
+
+    Args:
+        source_path: The path of the theme file
+        key: The cache key of its contents, from cache_key()
+
+    Returns:
+        The compiled theme, or None if it is not cached or the entry is unreadable
+    """
+    directory = get_cache_directory()
+    if directory is None:
+        return None
+
+    entry_path = _entry_path(directory, source_path, key)
+    try:
+        with open(entry_path, "rb") as file:
+            data = file.read()
+    except OSError:
+        return None
+
+    if not data.startswith(_MAGIC):
+        return None
+    try:
+        compiled = marshal.loads(data[len(_MAGIC):])
+    except (EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(compiled, dict) or not isinstance(compiled.get("theme"), dict):
+        return None
+    if not isinstance(compiled.get("resolved"), (dict, type(None))):
+        return None
+
+    # Mark the entry as recently used for eviction
+    try:
+        os.utime(entry_path)
+    except OSError:
+        pass
+    return compiled
+
+
+def store(source_path: str, key: str, compiled: Dict[str, Any]) -> bool:
+    """
+    Store a compiled theme.
+
+    Failing to write the cache is not an error; the theme is simply compiled again
+    next time. Call evict() after storing a batch of entries.
+
+    Args:
+        source_path: The path of the theme file
+        key: The cache key of its contents, from cache_key()
+        compiled: The compiled theme, made of dicts, tuples, lists and strings (interned
+            colors are stored as plain strings)
+
+    Returns:
+        True if the entry was written
+    """
+    directory = get_cache_directory()
+    if directory is None:
+        return False
+
+    try:
+        data = _MAGIC + marshal.dumps(_to_plain(compiled))
+    except ValueError:
+        return False
+
+    try:
+        os.makedirs(directory, exist_ok=True)
+        # Write to a temporary file first, so concurrent readers never see partial entries
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(temp_path, _entry_path(directory, source_path, key))
+        except OSError:
+            os.unlink(temp_path)
+            raise
+    except OSError:
+        return False
+    return True
+
+
+def _to_plain(value: Any) -> Any:
+    """Replace str and tuple subclasses (such as interned colors) with plain values marshal accepts"""
+    if isinstance(value, str):
+        return value if type(value) is str else str(value)
+    if isinstance(value, dict):
+        return {key: _to_plain(item) for key, item in value.items()}
+    if isinstance(value, (tuple, list)):
+        items = [_to_plain(item) for item in value]
+        return items if isinstance(value, list) else tuple(items)
+    return value
+
+
+def evict(max_entries: Optional[int] = None) -> int:
+    """
+    Remove stale entries: all but the most recent entry of each theme file, then the
+    least recently used entries beyond the maximum number of entries.
+
+    Args:
+        max_entries: The number of entries to keep at most (default: MAX_ENTRIES)
+
+    Returns:
+        The number of entries removed
+    """
+    directory = get_cache_directory()
+    if directory is None:
+        return 0
+    if max_entries is None:
+        max_entries = MAX_ENTRIES
+
+    try:
+        names = [name for name in os.listdir(directory) if name.endswith(_ENTRY_EXTENSION)]
+    except OSError:
+        return 0
+
+    # The newest entry of each theme file, by the file name prefix
+    newest: Dict[str, Tuple[float, str]] = {}
+    stale = []
+    for name in names:
+        path = os.path.join(directory, name)
+        try:
+            entry = (os.path.getmtime(path), path)
+        except OSError:
+            continue
+        source_prefix = name.split("-", 1)[0]
+        previous = newest.get(source_prefix)
+        if previous is None or previous < entry:
+            newest[source_prefix] = entry
+            if previous is not None:
+                stale.append(previous[1])
+        else:
+            stale.append(path)
+
+    remaining = sorted(newest.values())
+    if len(remaining) > max_entries:
+        stale.extend(path for _, path in remaining[:len(remaining) - max_entries])
+
+    removed = 0
+    for path in stale:
+        try:
+            os.unlink(path)
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def clear() -> None:
+    """Remove all compiled themes from the cache directory"""
+    directory = get_cache_directory()
+    if directory is None:
+        return
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return
+    for name in names:
+        if name.endswith(_ENTRY_EXTENSION):
+            try:
+                os.unlink(os.path.join(directory, name))
+            except OSError:
+                pass
@@ -0,0 +1,278 @@
+"""
+Procedural theme generation for CTkBootstrap.
+
+generate_theme() derives a complete theme, with every widget key of the built-in themes,
+from the eight palette colors and an appearance mode. The palette colors are assigned
+to roles, following the layout of the darkly theme:
+
+    background  window, dropdowns and ttk/tk backgrounds ("dark" in dark mode, "light" in light mode)
+    surface     frames, entries and the tracks of switches, sliders and progress bars
+    accent      buttons and selected or checked states ("primary")
+    highlight   hover states and borders ("info")
+    muted       unselected tab and segment text
+
+Text colors are picked for contrast with every color they are drawn on, and colors
+that still fall short of WCAG AA (4.5, see theme_validator) are darkened or lightened
+until they pass, so generated themes validate cleanly. Generated themes are memoized per
+palette, so generating the same theme again costs one dictionary lookup.
+
+Example:
+    THEMES["acme"] = generate_theme({
+        "primary": "#6F42C1", "secondary": "#3A3F44", "success": "#62C462",
+        "danger": "#EE5F5B", "warning": "#F89406", "info": "#5BC0DE",
+        "light": "#E9ECEF", "dark": "#1C1E22",
+    })
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Tuple
+from .colors import color, color_pair, contrast_ratio, mix, parse_color
+from .themes import normalize_theme
+
+
+# The palette colors a theme is generated from
+PALETTE_COLORS = ("primary", "secondary", "success", "danger", "warning", "info", "light", "dark")
+
+APPEARANCE_MODES = ("light", "dark")
+
+# Fixed Bootstrap grays: gray-600 for disabled text, gray-200 for hovered switch knobs
+_DISABLED = "#6C757D"
+_KNOB = "#FFFFFF"
+_KNOB_HOVER = "#E9ECEF"
+
+# Contrast generated text colors must reach on their backgrounds: WCAG AA for normal text
+_MIN_CONTRAST = 4.5
+
+
+def generate_theme(palette: Mapping[str, str],
+                   appearance_mode: str = "dark",
+                   color_theme: str = "blue") -> Dict[str, Any]:
+    """
+    Generate a theme from a palette.
+
+    Args:
+        palette: The eight palette colors (see PALETTE_COLORS), as hex colors; other
+            keys are ignored
+        appearance_mode: "dark" or "light"
+        color_theme: The CustomTkinter color theme used as the base
+
+    Returns:
+        The theme configuration, normalized like the built-in themes. It is shared
+        between calls with the same palette and must not be modified.
+
+    Raises:
+        ValueError: If a palette color is missing or invalid, or the appearance mode is unknown
+    """
+    if appearance_mode not in APPEARANCE_MODES:
+        raise ValueError(f"Invalid appearance mode: {appearance_mode}. Valid modes are: {', '.join(APPEARANCE_MODES)}")
+    missing = [name for name in PALETTE_COLORS if name not in palette]
+    if missing:
+        raise ValueError(f"Invalid palette: missing {', '.join(missing)}")
+    return _generate_from_values(tuple(palette[name] for name in PALETTE_COLORS), appearance_mode, color_theme)
+
+
+@lru_cache(maxsize=256)
+def _generate_from_values(values: Tuple[str, ...], appearance_mode: str, color_theme: str) -> Dict[str, Any]:
+    """Canonicalize the palette colors as given, so spellings of one palette share a theme"""
+    colors = []
+    for name, value in zip(PALETTE_COLORS, values):
+        try:
+            colors.append(color("#%02X%02X%02X" % parse_color(value)))
+        except ValueError as e:
+            raise ValueError(f"Invalid palette: {name}: {e}") from None
+    return _generate_theme(tuple(colors), appearance_mode, color_theme)
+
+
+def _text_color(*backgrounds: str) -> Any:
+    """Pick white or black text, whichever has the most contrast on all the backgrounds"""
+    return color(max(("#FFFFFF", "#000000"),
+                     key=lambda text: min(contrast_ratio(text, background) for background in backgrounds)))
+
+
+def _readable(value: str, against: str) -> Any:
+    """Darken or lighten a color until it has enough contrast with another color"""
+    if contrast_ratio(value, against) >= _MIN_CONTRAST:
+        return color(value)
+    # Black or white always reach 4.5 against one of them, so the loop ends there
+    target = "#000000" if contrast_ratio("#000000", against) > contrast_ratio("#FFFFFF", against) else "#FFFFFF"
+    for step in range(1, 20):
+        shifted = mix(value, target, step / 20)
+        if contrast_ratio(shifted, against) >= _MIN_CONTRAST:
+            return shifted
+    return color(target)
+
+
+@lru_cache(maxsize=256)
+def _generate_theme(colors: Tuple[str, ...], appearance_mode: str, color_theme: str) -> Dict[str, Any]:
+    """Generate a theme from canonical palette colors; memoized per palette"""
+    palette = dict(zip(PALETTE_COLORS, colors))
+    primary, secondary, info, light, dark = (
+        palette["primary"], palette["secondary"], palette["info"], palette["light"], palette["dark"]
+    )
+
+    if appearance_mode == "dark":
+        background, surface, muted = dark, secondary, light
+    else:
+        background, surface, muted = light, mix(light, "#FFFFFF", 0.5), secondary
+    highlight = info
+
+    # Text colors with the most contrast on all the colors they are drawn on. Accent text
+    # is also drawn on the hover color, and window text on dropdown hovers and ttk fields.
+    text = _text_color(background, primary, surface)
+    field_text = _text_color(surface)
+    accent_text = _text_color(primary, highlight)
+
+    # Backgrounds shifted where the chosen text still falls short on them
+    background = _readable(background, text)
+    accent = _readable(primary, accent_text)
+    hover = _readable(highlight, accent_text)
+    dropdown_hover = _readable(primary, text)
+    text_field = _readable(surface, text)
+    muted = _readable(muted, surface)
+    disabled = color(_DISABLED)
+
+    def pair(value: str) -> Tuple[Any, Any]:
+        return color_pair(value, value)
+
+    theme = {
+        "appearance_mode": appearance_mode,
+        "color_theme": color_theme,
+        "colors": palette,
+        "window": {
+            "fg_color": pair(background),
+        },
+        "button": {
+            "fg_color": pair(accent),
+            "hover_color": pair(hover),
+            "text_color": pair(accent_text),
+        },
+        "frame": {
+            "fg_color": pair(surface),
+            "border_color": pair(highlight),
+        },
+        "entry": {
+            "fg_color": pair(surface),
+            "border_color": pair(highlight),
+            "text_color": pair(field_text),
+        },
+        "checkbox": {
+            "fg_color": pair(surface),
+            "border_color": pair(highlight),
+            "checkmark_color": pair(accent_text),
+            "hover_color": pair(accent),
+            "text_color": pair(text),
+        },
+        "radio_button": {
+            "fg_color": pair(surface),
+            "border_color": pair(highlight),
+            "hover_color": pair(accent),
+            "text_color": pair(text),
+        },
+        "switch": {
+            "fg_color": pair(surface),
+            "progress_color": pair(accent),
+            "button_color": pair(_KNOB),
+            "button_hover_color": pair(_KNOB_HOVER),
+            "text_color": pair(text),
+        },
+        "slider": {
+            "fg_color": pair(surface),
+            "progress_color": pair(accent),
+            "button_color": pair(_KNOB),
+            "button_hover_color": pair(_KNOB_HOVER),
+        },
+        "progressbar": {
+            "fg_color": pair(surface),
+            "progress_color": pair(accent),
+        },
+        "option_menu": {
+            "fg_color": pair(surface),
+            "button_color": pair(accent),
+            "button_hover_color": pair(highlight),
+            "text_color": pair(field_text),
+            "dropdown_fg_color": pair(background),
+            "dropdown_hover_color": pair(dropdown_hover),
+            "dropdown_text_color": pair(text),
+        },
+        "combobox": {
+            "fg_color": pair(surface),
+            "border_color": pair(highlight),
+            "button_color": pair(accent),
+            "button_hover_color": pair(highlight),
+            "text_color": pair(field_text),
+            "dropdown_fg_color": pair(background),
+            "dropdown_hover_color": pair(dropdown_hover),
+            "dropdown_text_color": pair(text),
+        },
+        "textbox": {
+            "fg_color": pair(surface),
+            "border_color": pair(highlight),
+            "text_color": pair(field_text),
+        },
+        "scrollbar": {
+            "fg_color": pair(surface),
+            "button_color": pair(accent),
+            "button_hover_color": pair(highlight),
+        },
+        "scrollable_frame": {
+            "fg_color": pair(surface),
+            "border_color": pair(highlight),
+            "scrollbar_fg_color": pair(surface),
+            "scrollbar_button_color": pair(accent),
+            "scrollbar_button_hover_color": pair(highlight),
+        },
+        "tabview": {
+            "fg_color": pair(surface),
+            "segmented_button_fg_color": pair(background),
+            "segmented_button_selected_color": pair(accent),
+            "segmented_button_selected_hover_color": pair(hover),
+            "segmented_button_unselected_color": pair(surface),
+            "segmented_button_unselected_hover_color": pair(background),
+            "text_color": pair(accent_text),
+            "selected_text_color": pair(accent_text),
+            "unselected_text_color": pair(muted),
+        },
+        "segmented_button": {
+            "fg_color": pair(background),
+            "selected_color": pair(accent),
+            "selected_hover_color": pair(hover),
+            "unselected_color": pair(surface),
+            "unselected_hover_color": pair(background),
+            "text_color": pair(accent_text),
+            "selected_text_color": pair(accent_text),
+            "unselected_text_color": pair(muted),
+        },
+        "ttk": {
+            "background": background,
+            "foreground": text,
+            "fieldbackground": text_field,
+            "selectbackground": accent,
+            "selectforeground": accent_text,
+            "activebackground": hover,
+            "activeforeground": accent_text,
+            "disabledforeground": disabled,
+            "bordercolor": highlight,
+            "insertcolor": field_text,
+        },
+        "tk": {
+            "background": background,
+            "foreground": text,
+            "activebackground": accent,
+            "activeforeground": accent_text,
+            "disabledforeground": disabled,
+            "highlightbackground": surface,
+            "highlightcolor": highlight,
+            "insertbackground": field_text,
+            "selectbackground": accent,
+            "selectforeground": accent_text,
+            "troughcolor": surface,
+        },
+    }
+    normalize_theme(theme)
+    return theme
+
+
+def clear_generated_themes() -> None:
+    """Forget the memoized generated themes"""
+    _generate_from_values.cache_clear()
+    _generate_theme.cache_clear()
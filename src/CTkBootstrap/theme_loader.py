@@ -0,0 +1,445 @@
+"""
+Theme file loading for CTkBootstrap.
+
+Themes can be defined in JSON files with the same structure as the entries of THEMES
+in themes.py; the file name (without extension) is the theme name. Files are found
+in the theme search paths and parsed on a thread pool. Importing this module reads no
+files: the search paths are loaded on first use, i.e. by the first get_search_paths()
+or reload_all_themes(), or when get_theme() is asked for a theme that is not in THEMES.
+Until then, a theme file does not replace the built-in theme of the same name.
+
+Parsed themes are cached by (path, modification time, size), so reloading only reads
+files that changed since the last load. An unchanged file also yields the same theme
+dictionary as before, which keeps the caches keyed on theme identity (style plans,
+transitions, resolved properties) valid across reloads. Across processes, compiled
+themes are kept in the persistent theme cache (see theme_cache).
+
+Example:
+    add_search_path("~/.config/myapp/themes")
+    reload_all_themes()
+    print(get_load_stats().as_dict())
+"""
+
+import os
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from .themes import (
+    THEMES, THEME_FILE_EXTENSION, normalize_theme, resolve_widget_props, add_theme_provider, _freeze_lists
+)
+from .colors import intern_theme, intern_props
+from . import theme_cache
+
+
+# Directories searched by default: the user's themes, then the themes shipped with the package
+DEFAULT_SEARCH_PATHS = [
+    os.path.join(os.path.expanduser("~"), ".ctkbootstrap", "themes"),
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "themes"),
+]
+
+# Directories searched for theme files, in order; later directories win on name clashes.
+# Directories that do not exist are skipped when loading.
+_search_paths: List[str] = list(DEFAULT_SEARCH_PATHS)
+
+# Compiled themes keyed by path, with the (mtime_ns, size) they were loaded at
+_parse_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+_cache_lock = threading.Lock()
+
+# Resolved widget properties of the loaded themes, keyed by the id of the theme dict
+_resolved_props: Dict[int, Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]] = {}
+
+# Theme name -> path of the file it was last loaded from
+_loaded_themes: Dict[str, str] = {}
+
+# Built-in themes replaced by a theme file, restored if the file goes away
+_overridden_themes: Dict[str, Dict[str, Any]] = {}
+
+# Whether the search paths have been loaded at least once
+_search_paths_loaded = False
+
+
+class ThemeLoadStats:
+    """
+    Statistics of the last theme load: files found, parsed and cached, and timings.
+
+    Files are either parsed, loaded precompiled from the persistent theme cache
+    (compiled), or unchanged since the previous load (cached).
+    """
+
+    def __init__(self):
+        self.files = 0
+        self.parsed = 0
+        self.compiled = 0
+        self.cached = 0
+        self.failed: Dict[str, str] = {}
+        self.parse_times: Dict[str, float] = {}
+        self.total_time = 0.0
+
+    @property
+    def parse_time(self) -> float:
+        """Total time spent loading changed files, summed over all worker threads"""
+        return sum(self.parse_times.values())
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Get the statistics as a dictionary.
+
+        Returns:
+            A JSON-serializable dict; times are in seconds and the slowest files come first
+        """
+        return {
+            "files": self.files,
+            "parsed": self.parsed,
+            "compiled": self.compiled,
+            "cached": self.cached,
+            "failed": dict(self.failed),
+            "total_time": self.total_time,
+            "parse_time": self.parse_time,
+            "parse_times": dict(sorted(self.parse_times.items(), key=lambda item: -item[1])),
+        }
+
+
+_last_stats = ThemeLoadStats()
+
+
+def get_load_stats() -> ThemeLoadStats:
+    """
+    Get the statistics of the last call to load_themes_from_directory() or reload_all_themes().
+
+    Returns:
+        The statistics of the last load
+    """
+    return _last_stats
+
+
+def _normalize_path(path: str) -> str:
+    return os.path.abspath(os.path.expanduser(path))
+
+
+def add_search_path(path: str) -> None:
+    """
+    Add a directory to search for theme files.
+
+    Args:
+        path: The directory to add; adding a directory twice has no effect
+    """
+    path = _normalize_path(path)
+    if not os.path.isdir(path):
+        raise ValueError(f"Invalid theme search path: {path} is not a directory")
+    if path not in _search_paths:
+        _search_paths.append(path)
+
+
+def get_search_paths() -> List[str]:
+    """
+    Get the theme search paths.
+
+    Returns:
+        A list of directory paths where themes are searched for
+    """
+    ensure_themes_loaded()
+    return list(_search_paths)
+
+
+def ensure_themes_loaded() -> None:
+    """Load the theme files in the search paths, unless they have been loaded before"""
+    if not _search_paths_loaded:
+        reload_all_themes()
+
+
+class _SearchPathThemes:
+    """
+    Theme provider (see themes.add_theme_provider) that loads the search paths when a
+    theme missing from THEMES is looked up, or when all theme names are listed.
+    """
+
+    def __contains__(self, theme_name: str) -> bool:
+        ensure_themes_loaded()
+        return theme_name in _loaded_themes and theme_name in THEMES
+
+    def names(self) -> List[str]:
+        ensure_themes_loaded()
+        return list(_loaded_themes)
+
+    def load(self, theme_name: str) -> Dict[str, Any]:
+        return THEMES[theme_name]
+
+
+def clear_cache() -> None:
+    """Forget all loaded theme files, so the next load reads every file again"""
+    with _cache_lock:
+        _parse_cache.clear()
+        _resolved_props.clear()
+
+
+def _stat_key(path: str) -> Tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _compile_theme_file(path: str) -> Tuple[Dict[str, Any], bool]:
+    """
+    Read a theme file and compile it: parse, validate and normalize the theme and
+    resolve the properties of every widget kind. Compiled themes are taken from the
+    persistent theme cache when the file contents are unchanged.
+
+    A theme that extends another theme is not resolved here, since its properties
+    depend on the parent; it is flattened and resolved when it is used.
+
+    Returns:
+        The compiled theme, a dict with the "theme" and its "resolved" properties (None
+        for themes that extend another theme), and whether it came from the persistent cache
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not a valid theme
+    """
+    with open(path, "rb") as file:
+        source = file.read()
+    key = theme_cache.cache_key(source)
+    compiled = theme_cache.load(path, key)
+    if compiled is not None:
+        intern_theme(compiled["theme"])
+        compiled.setdefault("resolved", None)
+        if compiled["resolved"] is not None:
+            intern_props(compiled["resolved"])
+        return compiled, True
+
+    try:
+        data = json.loads(source.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"Invalid JSON: {e}") from None
+    if not isinstance(data, dict):
+        raise ValueError("A theme file must contain a JSON object")
+
+    theme = _freeze_lists(data)
+    normalize_theme(theme)
+    resolved = resolve_widget_props(theme) if "extends" not in theme else None
+    compiled = {"theme": theme, "resolved": resolved}
+    theme_cache.store(path, key, compiled)
+    return compiled, False
+
+
+def _load_cached(path: str, key: Optional[Tuple[int, int]] = None) -> Tuple[Dict[str, Any], Optional[float], bool]:
+    """
+    Get a compiled theme file, compiling it only if it changed since it was last loaded.
+
+    Returns:
+        The theme, the time spent loading it (None if it came from the in-memory cache)
+        and whether it came from the persistent cache
+    """
+    if key is None:
+        key = _stat_key(path)
+    with _cache_lock:
+        entry = _parse_cache.get(path)
+    if entry is not None and entry[0] == key:
+        return entry[1]["theme"], None, False
+
+    start = time.perf_counter()
+    compiled, from_disk = _compile_theme_file(path)
+    elapsed = time.perf_counter() - start
+    theme = compiled["theme"]
+    with _cache_lock:
+        if entry is not None:
+            _resolved_props.pop(id(entry[1]["theme"]), None)
+        _parse_cache[path] = (key, compiled)
+        if compiled["resolved"] is not None:
+            _resolved_props[id(theme)] = (theme, compiled["resolved"])
+    return theme, elapsed, from_disk
+
+
+def get_resolved_props(theme: Dict[str, Any]) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Get the precompiled widget properties of a theme loaded from a file.
+
+    Args:
+        theme: A theme dictionary, as found in THEMES
+
+    Returns:
+        The properties of every widget kind, as resolve_widget_props() returns them, or
+        None if the theme was not loaded from a file
+    """
+    entry = _resolved_props.get(id(theme))
+    if entry is not None and entry[0] is theme:
+        return entry[1]
+    return None
+
+
+def load_theme_from_file(file_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Load a theme from a JSON file.
+
+    Args:
+        file_path: Path to the JSON theme file
+
+    Returns:
+        The theme dictionary, or None if the file could not be read or is not a theme
+    """
+    try:
+        theme, elapsed, from_disk = _load_cached(_normalize_path(file_path))
+    except (OSError, ValueError):
+        return None
+    if elapsed is not None and not from_disk:
+        theme_cache.evict()
+    return theme
+
+
+def _theme_name(path: str) -> str:
+    return os.path.splitext(os.path.basename(path))[0].lower()
+
+
+def _find_theme_files(directory_path: str) -> List[Tuple[str, Tuple[int, int]]]:
+    """Find the theme files directly in a directory, with their cache keys"""
+    files = []
+    with os.scandir(directory_path) as entries:
+        for entry in entries:
+            if not entry.name.lower().endswith(THEME_FILE_EXTENSION):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except OSError:
+                continue
+            files.append((os.path.abspath(entry.path), (stat.st_mtime_ns, stat.st_size)))
+    files.sort()
+    return files
+
+
+def _load_files(directories: List[str], max_workers: Optional[int]) -> Dict[str, Dict[str, Any]]:
+    """Load the theme files of several directories and record the statistics"""
+    global _last_stats
+    stats = ThemeLoadStats()
+    start = time.perf_counter()
+
+    files: List[Tuple[str, Tuple[int, int]]] = []
+    for directory in directories:
+        files.extend(_find_theme_files(directory))
+    stats.files = len(files)
+
+    def load(item: Tuple[str, Tuple[int, int]]):
+        path, key = item
+        try:
+            return _load_cached(path, key)
+        except (OSError, ValueError) as e:
+            return e
+
+    # A pool only pays off when there are several files to parse
+    with _cache_lock:
+        changed = sum(1 for path, key in files if _parse_cache.get(path, (None,))[0] != key)
+    if changed > 1 and max_workers != 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outcomes = list(executor.map(load, files))
+    else:
+        outcomes = [load(item) for item in files]
+
+    themes: Dict[str, Dict[str, Any]] = {}
+    sources: Dict[str, str] = {}
+    for (path, _), outcome in zip(files, outcomes):
+        if isinstance(outcome, Exception):
+            stats.failed[path] = str(outcome)
+            continue
+        theme, elapsed, from_disk = outcome
+        if elapsed is None:
+            stats.cached += 1
+        else:
+            if from_disk:
+                stats.compiled += 1
+            else:
+                stats.parsed += 1
+            stats.parse_times[path] = elapsed
+        name = _theme_name(path)
+        themes[name] = theme
+        sources[name] = path
+
+    _register_themes(themes, sources)
+    if stats.parsed:
+        theme_cache.evict()
+    stats.total_time = time.perf_counter() - start
+    _last_stats = stats
+    return themes
+
+
+def _register_themes(themes: Dict[str, Dict[str, Any]], sources: Dict[str, str]) -> None:
+    """Add loaded themes to THEMES, leaving unchanged themes in place"""
+    for name, theme in themes.items():
+        if name not in _loaded_themes and name in THEMES and name not in _overridden_themes:
+            _overridden_themes[name] = THEMES[name]
+        if THEMES.get(name) is not theme:
+            THEMES[name] = theme
+        _loaded_themes[name] = sources[name]
+
+
+def load_themes_from_directory(directory_path: str, max_workers: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Load all theme files in a directory and add them to the available themes.
+
+    Args:
+        directory_path: Path to the directory containing theme files
+        max_workers: The number of threads parsing files (default: chosen by Python)
+
+    Returns:
+        A dictionary mapping theme names to theme definitions
+    """
+    directory_path = _normalize_path(directory_path)
+    if not os.path.isdir(directory_path):
+        raise ValueError(f"Invalid theme directory: {directory_path} is not a directory")
+    return _load_files([directory_path], max_workers)
+
+
+def reload_all_themes(max_workers: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Load the theme files in all search paths, re-reading only files that changed.
+
+    Themes whose file was removed since the last reload are removed from the available
+    themes, and a built-in theme they replaced is restored.
+
+    Args:
+        max_workers: The number of threads parsing files (default: chosen by Python)
+
+    Returns:
+        A dictionary with all loaded themes
+    """
+    global _search_paths_loaded
+    _search_paths_loaded = True
+    directories = [path for path in _search_paths if os.path.isdir(path)]
+    themes = _load_files(directories, max_workers)
+
+    for name, path in list(_loaded_themes.items()):
+        if name in themes or os.path.isfile(path):
+            continue
+        del _loaded_themes[name]
+        with _cache_lock:
+            entry = _parse_cache.pop(path, None)
+            if entry is not None:
+                _resolved_props.pop(id(entry[1]["theme"]), None)
+        if name in _overridden_themes:
+            THEMES[name] = _overridden_themes.pop(name)
+        else:
+            THEMES.pop(name, None)
+    return themes
+
+
+def poll_changes(max_workers: Optional[int] = None) -> List[str]:
+    """
+    Reload the theme files in all search paths and report which themes changed.
+
+    Only files whose modification time or size changed are read again, so polling
+    unchanged search paths costs one directory scan each.
+
+    Args:
+        max_workers: The number of threads parsing files (default: chosen by Python)
+
+    Returns:
+        The names of the themes that were added, modified or removed
+    """
+    before = {name: THEMES.get(name) for name in _loaded_themes}
+    themes = reload_all_themes(max_workers)
+    changed = [name for name, theme in themes.items() if before.get(name) is not theme]
+    changed.extend(name for name in before if name not in _loaded_themes)
+    return changed
+
+
+add_theme_provider(_SearchPathThemes())
@@ -6,12 +6,30 @@ with CustomTkinter. It handles the complexities of theme application and provide
 a simple API for developers.
 """
 
+import warnings
+import weakref
 import customtkinter as ctk
-from typing import Dict, List, Any, Optional, Union, Tuple
-from .themes import THEMES
+from typing import Dict, List, Any, Mapping, Optional, Union, Tuple
+from .themes import THEMES, theme_names
+from .colors import is_light_color
+from .theme_objects import Theme, get_theme_object
+from .theme_transitions import get_transition
+from .widget_registry import WidgetRegistry
+from .theme_transactions import theme_transaction
+from .ttk_themes import use_ttk_theme
 from . import theme_loader
 
 
+# Widget kind resolved per widget class
+_widget_kind_cache: Dict[type, Optional[str]] = {}
+
+# Properties that are still applied when a widget rejects its full configuration
+_BASIC_PROPS = {
+    "tabview": ("fg_color", "text_color"),
+    "segmented_button": ("fg_color", "selected_color", "text_color"),
+}
+
+
 class ThemeManager:
     """
     A simplified theme manager for CTkBootstrap that makes theme application easy.
@@ -24,16 +42,18 @@ class ThemeManager:
         """
         Initialize the theme manager with a specified theme.
         
+        The appearance mode of the theme is set when it is applied with
+        apply_theme_to_all_widgets().
+        
         Args:
             theme_name: The name of the theme to use (default: "darkly")
         """
         self._theme_name = theme_name.lower()
-        self._theme = self._get_theme_dict(self._theme_name)
-        self._colors = self._theme.get("colors", {})
-        self._appearance_mode = self._theme.get("appearance_mode", "dark")
+        self._theme = self._get_theme_object(self._theme_name)
+        self._appearance_mode = self._theme.appearance_mode
         
-        # Set appearance mode globally
-        ctk.set_appearance_mode(self._appearance_mode)
+        # Theme name and resolved properties last applied to each root by apply_theme_to_all_widgets
+        self._applied_themes = weakref.WeakKeyDictionary()
     
     @property
     def theme_name(self) -> str:
@@ -48,53 +68,58 @@ class ThemeManager:
     @property
     def available_themes(self) -> List[str]:
         """Get a list of all available themes"""
-        return list(THEMES.keys())
+        return theme_names()
     
     @property
-    def colors(self) -> Dict[str, str]:
-        """Get all colors for the current theme"""
-        return self._colors
+    def theme(self) -> Theme:
+        """Get the current theme object"""
+        return self._theme
+    
+    @property
+    def colors(self) -> Mapping[str, str]:
+        """Get all colors for the current theme, as a read-only mapping"""
+        return self._theme.colors
     
     # Direct access to common theme colors as properties
     @property
     def primary(self) -> str:
         """Get the primary color"""
-        return self._colors.get("primary", "#375A7F")
+        return self._theme.primary
     
     @property
     def secondary(self) -> str:
         """Get the secondary color"""
-        return self._colors.get("secondary", "#444444")
+        return self._theme.secondary
     
     @property
     def success(self) -> str:
         """Get the success color"""
-        return self._colors.get("success", "#00BC8C")
+        return self._theme.success
     
     @property
     def danger(self) -> str:
         """Get the danger color"""
-        return self._colors.get("danger", "#E74C3C")
+        return self._theme.danger
     
     @property
     def warning(self) -> str:
         """Get the warning color"""
-        return self._colors.get("warning", "#F39C12")
+        return self._theme.warning
     
     @property
     def info(self) -> str:
         """Get the info color"""
-        return self._colors.get("info", "#3498DB")
+        return self._theme.info
     
     @property
     def light(self) -> str:
         """Get the light color"""
-        return self._colors.get("light", "#ADB5BD")
+        return self._theme.light
     
     @property
     def dark(self) -> str:
         """Get the dark color"""
-        return self._colors.get("dark", "#303030")
+        return self._theme.dark
     
     def get_color(self, color_name: str, fallback: str = None) -> str:
         """
@@ -107,27 +132,23 @@ class ThemeManager:
         Returns:
             The color value as a hex string
         """
-        return self._colors.get(color_name, fallback)
+        return self._theme.colors.get(color_name, fallback)
     
     def change_theme(self, theme_name: str) -> None:
         """
         Change the current theme.
         
+        Widgets keep their colors, and the global appearance mode is left as it is, until
+        the theme is applied with apply_theme_to_all_widgets(). Changing the mode there
+        redraws every widget once, together with the new widget properties.
+        
         Args:
             theme_name: The name of the theme to use
         """
         theme_name = theme_name.lower()
-        if theme_name not in THEMES:
-            valid_themes = ", ".join(self.available_themes)
-            raise ValueError(f"Invalid theme: {theme_name}. Valid themes are: {valid_themes}")
-        
+        self._theme = self._get_theme_object(theme_name)
         self._theme_name = theme_name
-        self._theme = self._get_theme_dict(theme_name)
-        self._colors = self._theme.get("colors", {})
-        self._appearance_mode = self._theme.get("appearance_mode", "dark")
-        
-        # Set appearance mode globally
-        ctk.set_appearance_mode(self._appearance_mode)
+        self._appearance_mode = self._theme.appearance_mode
     
     def apply_theme_to_widget(self, widget: ctk.CTkBaseClass) -> None:
         """
@@ -138,61 +159,89 @@ class ThemeManager:
         Args:
             widget: The CustomTkinter widget to apply the theme to
         """
-        widget_type = type(widget).__name__
-        
-        # Get appropriate theme properties based on widget type
-        if isinstance(widget, ctk.CTkButton):
-            self._apply_button_theme(widget)
-        elif isinstance(widget, ctk.CTkEntry):
-            self._apply_entry_theme(widget)
-        elif isinstance(widget, ctk.CTkTextbox):
-            self._apply_textbox_theme(widget)
-        elif isinstance(widget, ctk.CTkCheckBox):
-            self._apply_checkbox_theme(widget)
-        elif isinstance(widget, ctk.CTkRadioButton):
-            self._apply_radiobutton_theme(widget)
-        elif isinstance(widget, ctk.CTkSwitch):
-            self._apply_switch_theme(widget)
-        elif isinstance(widget, ctk.CTkSlider):
-            self._apply_slider_theme(widget)
-        elif isinstance(widget, ctk.CTkProgressBar):
-            self._apply_progressbar_theme(widget)
-        elif isinstance(widget, ctk.CTkOptionMenu):
-            self._apply_optionmenu_theme(widget)
-        elif isinstance(widget, ctk.CTkComboBox):
-            self._apply_combobox_theme(widget)
-        elif isinstance(widget, ctk.CTkFrame):
-            self._apply_frame_theme(widget)
-        elif isinstance(widget, ctk.CTkTabview):
-            self._apply_tabview_theme(widget)
-        elif isinstance(widget, ctk.CTkSegmentedButton):
-            self._apply_segmentedbutton_theme(widget)
-        elif isinstance(widget, ctk.CTkScrollableFrame):
-            self._apply_scrollableframe_theme(widget)
-        elif isinstance(widget, ctk.CTkLabel):
-            self._apply_label_theme(widget)
-    
-    def apply_theme_to_all_widgets(self, root: Union[ctk.CTk, ctk.CTkToplevel, ctk.CTkFrame]) -> None:
+        widget_kind = self._get_widget_kind(widget)
+        if widget_kind is not None:
+            self._configure_widget(widget, widget_kind, self._theme.resolved[widget_kind])
+    
+    def apply_theme_to_all_widgets(self, 
+                                   root: Union[ctk.CTk, ctk.CTkToplevel, ctk.CTkFrame],
+                                   registry: Optional[WidgetRegistry] = None,
+                                   full: bool = False) -> None:
         """
         Apply the current theme to all widgets in a window or frame.
         
         This method recursively applies theme settings to all CustomTkinter widgets.
+        If this manager previously applied another theme to the same root, or an
+        earlier version of the same theme that has since been reloaded, only the
+        properties that differ are reconfigured. Widgets added under the root since the
+        last application still have CustomTkinter's defaults for the properties the two
+        themes share, so pass full=True or theme them with apply_theme_to_widget().
         
         Args:
             root: The root window or frame containing widgets to theme
+            registry: A widget registry to theme instead of walking the widget tree.
+                Defaults to the root's own registry if it was created with track_widgets=True.
+                Only widgets whose properties change are visited.
+            full: Reconfigure every theme property, e.g. after widgets were added
+                or restyled outside of the theme
         """
-        # First apply theme to the root itself if it's a CTk widget
-        if isinstance(root, ctk.CTkBaseClass):
-            self.apply_theme_to_widget(root)
+        resolved_props = props = self._theme.resolved
+        try:
+            applied = self._applied_themes.get(root)
+        except TypeError:
+            applied = None
+        if applied is not None and applied[1] is not resolved_props and not full:
+            previous_theme, previous_props = applied
+            props = get_transition(
+                ("manager", previous_theme, self._theme_name), previous_props, resolved_props
+            )
         
-        # Then recursively apply to all children
-        for child in root.winfo_children():
-            if isinstance(child, ctk.CTkBaseClass):
-                self.apply_theme_to_widget(child)
+        if registry is None:
+            registry = getattr(root, "widget_registry", None)
+        
+        # Redraw each widget once, after all of its properties have been applied. The
+        # appearance mode of the theme is set here, within the same redraw pass, which
+        # also restores it if it was changed since, e.g. by a window's own apply_theme().
+        with theme_transaction(root):
+            ctk.set_appearance_mode(self._appearance_mode)
+            use_ttk_theme(root, self._theme_name)
+            if registry is not None:
+                self._apply_props_to_registry(registry, props)
+            else:
+                self._apply_props_to_all_widgets(root, props)
+        try:
+            self._applied_themes[root] = (self._theme_name, resolved_props)
+        except TypeError:
+            # Roots that cannot be weakly referenced are always themed in full
+            pass
+    
+    def _apply_props_to_all_widgets(self, root: Any, props: Dict[str, Dict[str, Any]]) -> None:
+        """Apply resolved widget properties to a root and all its descendants, visiting each once"""
+        stack = [root]
+        while stack:
+            widget = stack.pop()
+            if isinstance(widget, ctk.CTkBaseClass):
+                self._apply_props_to_widget(widget, props)
             
-            # Recursively apply to children of this widget
-            if hasattr(child, "winfo_children") and callable(getattr(child, "winfo_children")):
-                self.apply_theme_to_all_widgets(child)
+            if hasattr(widget, "winfo_children") and callable(getattr(widget, "winfo_children")):
+                stack.extend(reversed(widget.winfo_children()))
+    
+    def _apply_props_to_registry(self, registry: WidgetRegistry, props: Dict[str, Dict[str, Any]]) -> None:
+        """Apply resolved widget properties to the registered widgets of the classes they change"""
+        for widget_class in registry.classes():
+            if not issubclass(widget_class, ctk.CTkBaseClass):
+                continue
+            widget_kind = self._get_class_kind(widget_class)
+            if widget_kind is None or not props[widget_kind]:
+                continue
+            for widget in registry.widgets(widget_class, include_subclasses=False):
+                self._configure_widget(widget, widget_kind, props[widget_kind])
+    
+    def _apply_props_to_widget(self, widget: ctk.CTkBaseClass, props: Dict[str, Dict[str, Any]]) -> None:
+        """Apply resolved widget properties to a single widget"""
+        widget_kind = self._get_widget_kind(widget)
+        if widget_kind is not None:
+            self._configure_widget(widget, widget_kind, props[widget_kind])
     
     def create_themed_button(self, 
                             master: Any, 
@@ -432,346 +481,163 @@ class ThemeManager:
         Returns:
             True if the color is light (bright), False if the color is dark
         """
-        # Remove # if present
-        color_hex = color_hex.lstrip("#")
-        
-        # Convert to RGB
+        # A color is light if black text has more contrast on it than white text (WCAG)
         try:
-            r, g, b = int(color_hex[0:2], 16), int(color_hex[2:4], 16), int(color_hex[4:6], 16)
-            
-            # Calculate perceived brightness (ITU-R BT.709)
-            brightness = (0.2126 * r + 0.7152 * g + 0.0722 * b) / 255
-            
-            # Return True if the color is light (brightness > 0.5)
-            return brightness > 0.5
-        except (ValueError, IndexError):
+            return is_light_color(color_hex)
+        except (ValueError, TypeError):
             # If the color can't be parsed, assume it's dark
             return False
     
-    def _get_theme_dict(self, theme_name: str) -> Dict[str, Any]:
-        """Get the theme dictionary for a given theme name"""
-        if theme_name not in THEMES:
-            valid_themes = ", ".join(list(THEMES.keys()))
-            raise ValueError(f"Invalid theme: {theme_name}. Valid themes are: {valid_themes}")
-        return THEMES[theme_name]
+    def _get_theme_object(self, theme_name: str) -> Theme:
+        """Get the theme object for a given theme name, loading the theme on first use"""
+        return get_theme_object(theme_name)
     
-    def _get_widget_theme_props(self, widget_type: str) -> Dict[str, Any]:
-        """Get theme properties for a specific widget type"""
-        return self._theme.get(widget_type.lower(), {})
+    def _get_widget_kind(self, widget: Any) -> Optional[str]:
+        """Get the widget kind used to look up resolved properties, or None for unsupported widgets"""
+        return self._get_class_kind(type(widget))
     
-    def _apply_button_theme(self, button: ctk.CTkButton) -> None:
-        """Apply theme to a CTkButton widget"""
-        button_props = self._get_widget_theme_props("button")
+    def _get_class_kind(self, widget_class: type) -> Optional[str]:
+        """Get the widget kind of a widget class, or None for unsupported widget classes"""
+        try:
+            return _widget_kind_cache[widget_class]
+        except KeyError:
+            widget_kind = _widget_kind_cache[widget_class] = self._resolve_widget_kind(widget_class)
+            return widget_kind
+    
+    @staticmethod
+    def _resolve_widget_kind(widget_class: type) -> Optional[str]:
+        """Resolve the widget kind of a widget class; the result is memoized per class"""
+        if issubclass(widget_class, ctk.CTkButton):
+            return "button"
+        elif issubclass(widget_class, ctk.CTkEntry):
+            return "entry"
+        elif issubclass(widget_class, ctk.CTkTextbox):
+            return "textbox"
+        elif issubclass(widget_class, ctk.CTkCheckBox):
+            return "checkbox"
+        elif issubclass(widget_class, ctk.CTkRadioButton):
+            return "radio_button"
+        elif issubclass(widget_class, ctk.CTkSwitch):
+            return "switch"
+        elif issubclass(widget_class, ctk.CTkSlider):
+            return "slider"
+        elif issubclass(widget_class, ctk.CTkProgressBar):
+            return "progressbar"
+        elif issubclass(widget_class, ctk.CTkOptionMenu):
+            return "option_menu"
+        elif issubclass(widget_class, ctk.CTkComboBox):
+            return "combobox"
+        elif issubclass(widget_class, ctk.CTkFrame):
+            return "frame"
+        elif issubclass(widget_class, ctk.CTkTabview):
+            return "tabview"
+        elif issubclass(widget_class, ctk.CTkSegmentedButton):
+            return "segmented_button"
+        elif issubclass(widget_class, ctk.CTkScrollableFrame):
+            return "scrollable_frame"
+        elif issubclass(widget_class, ctk.CTkLabel):
+            return "label"
+        return None
+    
+    def _configure_widget(self, widget: ctk.CTkBaseClass, widget_kind: str, props: Dict[str, Any]) -> None:
+        """
+        Configure a widget with resolved properties in a single configure() call.
         
-        # Get theme properties or use fallbacks
-        fg_color = button_props.get("fg_color", [self.primary, self.primary])
-        hover_color = button_props.get("hover_color", [self.info, self.info])
-        text_color = button_props.get("text_color", ["#FFFFFF", "#FFFFFF"])
+        Args:
+            widget: The widget to configure
+            widget_kind: The widget kind the properties were resolved for
+            props: The properties to apply; may be a subset when switching themes
+        """
+        if not props:
+            return
         
-        # Apply theme
-        button.configure(
-            fg_color=fg_color,
-            hover_color=hover_color,
-            text_color=text_color
-        )
+        if widget_kind in _BASIC_PROPS:
+            # Apply theme - use only compatible parameters
+            try:
+                # Try the full configuration first
+                widget.configure(**props)
+            except ValueError:
+                # Fall back to basic configuration if advanced parameters are not supported
+                basic_props = {prop: value for prop, value in props.items() if prop in _BASIC_PROPS[widget_kind]}
+                try:
+                    widget.configure(**basic_props)
+                except Exception as e:
+                    warnings.warn(f"Could not fully apply theme to {type(widget).__name__}: {e}", RuntimeWarning)
+            return
+        
+        widget.configure(**props)
+        
+        # Apply theme to the internal text widget of a textbox
+        if widget_kind == "textbox" and "text_color" in props:
+            text_color = props["text_color"]
+            try:
+                internal_text = widget._textbox
+                if internal_text:
+                    internal_text.configure(
+                        fg=text_color[1] if self._appearance_mode == "dark" else text_color[0]
+                    )
+            except (AttributeError, IndexError):
+                pass
+    
+    def _apply_button_theme(self, button: ctk.CTkButton) -> None:
+        """Apply theme to a CTkButton widget"""
+        self._configure_widget(button, "button", self._theme.button)
     
     def _apply_entry_theme(self, entry: ctk.CTkEntry) -> None:
         """Apply theme to a CTkEntry widget"""
-        entry_props = self._get_widget_theme_props("entry")
-        
-        # Get theme properties or use fallbacks
-        fg_color = entry_props.get("fg_color", ["#343638", "#343638"])
-        border_color = entry_props.get("border_color", [self.info, self.info])
-        text_color = entry_props.get("text_color", ["#FFFFFF", "#FFFFFF"])
-        
-        # Apply theme
-        entry.configure(
-            fg_color=fg_color,
-            border_color=border_color,
-            text_color=text_color
-        )
+        self._configure_widget(entry, "entry", self._theme.entry)
     
     def _apply_textbox_theme(self, textbox: ctk.CTkTextbox) -> None:
         """Apply theme to a CTkTextbox widget"""
-        textbox_props = self._get_widget_theme_props("textbox")
-        # Fall back to entry properties if textbox properties are not defined
-        entry_props = self._get_widget_theme_props("entry")
-        
-        # Get theme properties or use fallbacks
-        fg_color = textbox_props.get("fg_color", entry_props.get("fg_color", ["#343638", "#343638"]))
-        border_color = textbox_props.get("border_color", entry_props.get("border_color", [self.info, self.info]))
-        text_color = textbox_props.get("text_color", entry_props.get("text_color", ["#FFFFFF", "#FFFFFF"]))
-        
-        # Apply theme
-        textbox.configure(
-            fg_color=fg_color,
-            border_color=border_color,
-            text_color=text_color
-        )
-        
-        # Apply theme to the internal text widget
-        try:
-            internal_text = textbox._textbox
-            if internal_text:
-                internal_text.configure(
-                    fg=text_color[1] if self._appearance_mode == "dark" else text_color[0]
-                )
-        except (AttributeError, IndexError):
-            pass
+        self._configure_widget(textbox, "textbox", self._theme.textbox)
     
     def _apply_checkbox_theme(self, checkbox: ctk.CTkCheckBox) -> None:
         """Apply theme to a CTkCheckBox widget"""
-        checkbox_props = self._get_widget_theme_props("checkbox")
-        
-        # Get theme properties or use fallbacks
-        fg_color = checkbox_props.get("fg_color", ["#343638", "#343638"])
-        border_color = checkbox_props.get("border_color", [self.info, self.info])
-        checkmark_color = checkbox_props.get("checkmark_color", ["#FFFFFF", "#FFFFFF"])
-        hover_color = checkbox_props.get("hover_color", [self.primary, self.primary])
-        text_color = checkbox_props.get("text_color", ["#FFFFFF", "#FFFFFF"])
-        
-        # Apply theme
-        checkbox.configure(
-            fg_color=fg_color,
-            border_color=border_color,
-            checkmark_color=checkmark_color,
-            hover_color=hover_color,
-            text_color=text_color
-        )
+        self._configure_widget(checkbox, "checkbox", self._theme.checkbox)
     
     def _apply_radiobutton_theme(self, radiobutton: ctk.CTkRadioButton) -> None:
         """Apply theme to a CTkRadioButton widget"""
-        radiobutton_props = self._get_widget_theme_props("radio_button")
-        checkbox_props = self._get_widget_theme_props("checkbox")
-        
-        # Get theme properties or use fallbacks from checkbox properties
-        fg_color = radiobutton_props.get("fg_color", checkbox_props.get("fg_color", ["#343638", "#343638"]))
-        border_color = radiobutton_props.get("border_color", checkbox_props.get("border_color", [self.info, self.info]))
-        hover_color = radiobutton_props.get("hover_color", checkbox_props.get("hover_color", [self.primary, self.primary]))
-        text_color = radiobutton_props.get("text_color", checkbox_props.get("text_color", ["#FFFFFF", "#FFFFFF"]))
-        
-        # Apply theme
-        radiobutton.configure(
-            fg_color=fg_color,
-            border_color=border_color,
-            hover_color=hover_color,
-            text_color=text_color
-        )
+        self._configure_widget(radiobutton, "radio_button", self._theme.radio_button)
     
     def _apply_switch_theme(self, switch: ctk.CTkSwitch) -> None:
         """Apply theme to a CTkSwitch widget"""
-        switch_props = self._get_widget_theme_props("switch")
-        
-        # Get theme properties or use fallbacks
-        fg_color = switch_props.get("fg_color", ["#343638", "#343638"])
-        progress_color = switch_props.get("progress_color", [self.primary, self.primary])
-        button_color = switch_props.get("button_color", ["#FFFFFF", "#FFFFFF"])
-        button_hover_color = switch_props.get("button_hover_color", ["#E9ECEF", "#E9ECEF"])
-        text_color = switch_props.get("text_color", ["#FFFFFF", "#FFFFFF"])
-        
-        # Apply theme
-        switch.configure(
-            fg_color=fg_color,
-            progress_color=progress_color,
-            button_color=button_color,
-            button_hover_color=button_hover_color,
-            text_color=text_color
-        )
+        self._configure_widget(switch, "switch", self._theme.switch)
     
     def _apply_slider_theme(self, slider: ctk.CTkSlider) -> None:
         """Apply theme to a CTkSlider widget"""
-        slider_props = self._get_widget_theme_props("slider")
-        
-        # Get theme properties or use fallbacks
-        fg_color = slider_props.get("fg_color", ["#343638", "#343638"])
-        progress_color = slider_props.get("progress_color", [self.primary, self.primary])
-        button_color = slider_props.get("button_color", ["#FFFFFF", "#FFFFFF"])
-        button_hover_color = slider_props.get("button_hover_color", ["#E9ECEF", "#E9ECEF"])
-        
-        # Apply theme
-        slider.configure(
-            fg_color=fg_color,
-            progress_color=progress_color,
-            button_color=button_color,
-            button_hover_color=button_hover_color
-        )
+        self._configure_widget(slider, "slider", self._theme.slider)
     
     def _apply_progressbar_theme(self, progressbar: ctk.CTkProgressBar) -> None:
         """Apply theme to a CTkProgressBar widget"""
-        progressbar_props = self._get_widget_theme_props("progressbar")
-        
-        # Get theme properties or use fallbacks
-        fg_color = progressbar_props.get("fg_color", ["#343638", "#343638"])
-        progress_color = progressbar_props.get("progress_color", [self.primary, self.primary])
-        
-        # Apply theme
-        progressbar.configure(
-            fg_color=fg_color,
-            progress_color=progress_color
-        )
+        self._configure_widget(progressbar, "progressbar", self._theme.progressbar)
     
     def _apply_optionmenu_theme(self, optionmenu: ctk.CTkOptionMenu) -> None:
         """Apply theme to a CTkOptionMenu widget"""
-        optionmenu_props = self._get_widget_theme_props("option_menu")
-        
-        # Get theme properties or use fallbacks
-        fg_color = optionmenu_props.get("fg_color", ["#343638", "#343638"])
-        button_color = optionmenu_props.get("button_color", [self.primary, self.primary])
-        button_hover_color = optionmenu_props.get("button_hover_color", [self.info, self.info])
-        text_color = optionmenu_props.get("text_color", ["#FFFFFF", "#FFFFFF"])
-        dropdown_fg_color = optionmenu_props.get("dropdown_fg_color", [self.dark, self.dark])
-        dropdown_hover_color = optionmenu_props.get("dropdown_hover_color", [self.primary, self.primary])
-        dropdown_text_color = optionmenu_props.get("dropdown_text_color", ["#FFFFFF", "#FFFFFF"])
-        
-        # Apply theme
-        optionmenu.configure(
-            fg_color=fg_color,
-            button_color=button_color,
-            button_hover_color=button_hover_color,
-            text_color=text_color,
-            dropdown_fg_color=dropdown_fg_color,
-            dropdown_hover_color=dropdown_hover_color,
-            dropdown_text_color=dropdown_text_color
-        )
+        self._configure_widget(optionmenu, "option_menu", self._theme.option_menu)
     
     def _apply_combobox_theme(self, combobox: ctk.CTkComboBox) -> None:
         """Apply theme to a CTkComboBox widget"""
-        combobox_props = self._get_widget_theme_props("combobox")
-        
-        # Get theme properties or use fallbacks
-        fg_color = combobox_props.get("fg_color", ["#343638", "#343638"])
-        border_color = combobox_props.get("border_color", [self.info, self.info])
-        button_color = combobox_props.get("button_color", [self.primary, self.primary])
-        button_hover_color = combobox_props.get("button_hover_color", [self.info, self.info])
-        text_color = combobox_props.get("text_color", ["#FFFFFF", "#FFFFFF"])
-        dropdown_fg_color = combobox_props.get("dropdown_fg_color", [self.dark, self.dark])
-        dropdown_hover_color = combobox_props.get("dropdown_hover_color", [self.primary, self.primary])
-        dropdown_text_color = combobox_props.get("dropdown_text_color", ["#FFFFFF", "#FFFFFF"])
-        
-        # Apply theme
-        combobox.configure(
-            fg_color=fg_color,
-            border_color=border_color,
-            button_color=button_color,
-            button_hover_color=button_hover_color,
-            text_color=text_color,
-            dropdown_fg_color=dropdown_fg_color,
-            dropdown_hover_color=dropdown_hover_color,
-            dropdown_text_color=dropdown_text_color
-        )
+        self._configure_widget(combobox, "combobox", self._theme.combobox)
     
     def _apply_frame_theme(self, frame: ctk.CTkFrame) -> None:
         """Apply theme to a CTkFrame widget"""
-        frame_props = self._get_widget_theme_props("frame")
-        
-        # Get theme properties or use fallbacks
-        fg_color = frame_props.get("fg_color", ["#2B2B2B", "#2B2B2B"])
-        border_color = frame_props.get("border_color", [self.info, self.info])
-        
-        # Apply theme
-        frame.configure(
-            fg_color=fg_color,
-            border_color=border_color
-        )
+        self._configure_widget(frame, "frame", self._theme.frame)
     
     def _apply_tabview_theme(self, tabview: ctk.CTkTabview) -> None:
         """Apply theme to a CTkTabview widget"""
-        tabview_props = self._get_widget_theme_props("tabview")
-        
-        # Get theme properties or use fallbacks
-        fg_color = tabview_props.get("fg_color", ["#2B2B2B", "#2B2B2B"])
-        segmented_button_fg_color = tabview_props.get("segmented_button_fg_color", [self.dark, self.dark])
-        segmented_button_selected_color = tabview_props.get("segmented_button_selected_color", [self.primary, self.primary])
-        segmented_button_selected_hover_color = tabview_props.get("segmented_button_selected_hover_color", [self.info, self.info])
-        segmented_button_unselected_color = tabview_props.get("segmented_button_unselected_color", ["#2B2B2B", "#2B2B2B"])
-        segmented_button_unselected_hover_color = tabview_props.get("segmented_button_unselected_hover_color", [self.dark, self.dark])
-        text_color = tabview_props.get("text_color", ["#FFFFFF", "#FFFFFF"])
-        
-        # Apply theme - use only compatible parameters
-        try:
-            # Try the full configuration first
-            tabview.configure(
-                fg_color=fg_color,
-                segmented_button_fg_color=segmented_button_fg_color,
-                segmented_button_selected_color=segmented_button_selected_color,
-                segmented_button_selected_hover_color=segmented_button_selected_hover_color,
-                segmented_button_unselected_color=segmented_button_unselected_color,
-                segmented_button_unselected_hover_color=segmented_button_unselected_hover_color,
-                text_color=text_color,
-            )
-        except ValueError:
-            # Fall back to basic configuration if advanced parameters are not supported
-            try:
-                tabview.configure(
-                    fg_color=fg_color,
-                    text_color=text_color
-                )
-            except Exception as e:
-                print(f"Warning: Could not fully apply theme to CTkTabview: {e}")
+        self._configure_widget(tabview, "tabview", self._theme.tabview)
     
     def _apply_segmentedbutton_theme(self, segmentedbutton: ctk.CTkSegmentedButton) -> None:
         """Apply theme to a CTkSegmentedButton widget"""
-        segmentedbutton_props = self._get_widget_theme_props("segmented_button")
-        
-        # Get theme properties or use fallbacks
-        fg_color = segmentedbutton_props.get("fg_color", [self.dark, self.dark])
-        selected_color = segmentedbutton_props.get("selected_color", [self.primary, self.primary])
-        selected_hover_color = segmentedbutton_props.get("selected_hover_color", [self.info, self.info])
-        unselected_color = segmentedbutton_props.get("unselected_color", ["#2B2B2B", "#2B2B2B"])
-        unselected_hover_color = segmentedbutton_props.get("unselected_hover_color", [self.dark, self.dark])
-        text_color = segmentedbutton_props.get("text_color", ["#FFFFFF", "#FFFFFF"])
-        
-        # Apply theme using only compatible parameters
-        try:
-            # Try full configuration first
-            segmentedbutton.configure(
-                fg_color=fg_color,
-                selected_color=selected_color,
-                selected_hover_color=selected_hover_color,
-                unselected_color=unselected_color,
-                unselected_hover_color=unselected_hover_color,
-                text_color=text_color,
-            )
-        except ValueError:
-            # Fall back to basic configuration
-            try:
-                segmentedbutton.configure(
-                    fg_color=fg_color,
-                    selected_color=selected_color,
-                    text_color=text_color
-                )
-            except Exception as e:
-                print(f"Warning: Could not fully apply theme to CTkSegmentedButton: {e}")
+        self._configure_widget(segmentedbutton, "segmented_button", self._theme.segmented_button)
     
     def _apply_scrollableframe_theme(self, scrollableframe: ctk.CTkScrollableFrame) -> None:
         """Apply theme to a CTkScrollableFrame widget"""
-        scrollableframe_props = self._get_widget_theme_props("scrollable_frame")
-        
-        # Get theme properties or use fallbacks
-        fg_color = scrollableframe_props.get("fg_color", ["#2B2B2B", "#2B2B2B"])
-        border_color = scrollableframe_props.get("border_color", [self.info, self.info])
-        scrollbar_fg_color = scrollableframe_props.get("scrollbar_fg_color", ["#2B2B2B", "#2B2B2B"])
-        scrollbar_button_color = scrollableframe_props.get("scrollbar_button_color", [self.primary, self.primary])
-        scrollbar_button_hover_color = scrollableframe_props.get("scrollbar_button_hover_color", [self.info, self.info])
-        
-        # Apply theme
-        scrollableframe.configure(
-            fg_color=fg_color,
-            border_color=border_color,
-            scrollbar_fg_color=scrollbar_fg_color,
-            scrollbar_button_color=scrollbar_button_color,
-            scrollbar_button_hover_color=scrollbar_button_hover_color
-        )
+        self._configure_widget(scrollableframe, "scrollable_frame", self._theme.scrollable_frame)
     
     def _apply_label_theme(self, label: ctk.CTkLabel) -> None:
         """Apply theme to a CTkLabel widget"""
-        # Labels don't have specific theme properties in the theme dict, 
-        # so we'll use text_color from various sources
-        button_props = self._get_widget_theme_props("button")
-        text_color = button_props.get("text_color", ["#FFFFFF", "#FFFFFF"])
-        
-        # Apply theme
-        label.configure(text_color=text_color)
+        self._configure_widget(label, "label", self._theme.label)
 
     @classmethod
     def add_theme_search_path(cls, path: str) -> None:
@@ -869,6 +735,7 @@ def set_theme(theme_name: str) -> None:
     Set the current theme for the application.
     
     This is a convenience function that creates or uses the global theme manager.
+    Widgets and the appearance mode change when the theme is applied with apply_theme().
     
     Args:
         theme_name: The name of the theme to use
@@ -887,9 +754,11 @@ def apply_theme(root: Union[ctk.CTk, ctk.CTkToplevel, ctk.CTkFrame], theme_name:
         theme_name: Optional name of the theme to use (if not provided, uses the current theme)
     """
     manager = get_theme_manager()
-    if theme_name:
-        manager.change_theme(theme_name)
-    manager.apply_theme_to_all_widgets(root)
+    # Redraw once for both the appearance mode change and the new widget properties
+    with theme_transaction(root):
+        if theme_name:
+            manager.change_theme(theme_name)
+        manager.apply_theme_to_all_widgets(root)
 
 def get_theme_color(color_name: str, fallback: str = None) -> str:
     """
@@ -0,0 +1,179 @@
+"""
+Frozen theme objects for CTkBootstrap.
+
+A Theme wraps a theme configuration (see themes.py) and precomputes what the theme
+manager looks up for every widget: the palette colors, with their defaults applied, and
+the resolved configure() properties of every widget kind. Reading them is plain
+attribute access instead of a chain of dict lookups.
+
+Themes are immutable and hashable, so they can be used as cache keys. They are also
+read-only mappings over their configuration, so code written for theme dictionaries
+keeps working:
+
+    theme = get_theme_object("darkly")
+    theme.primary            # "#375A7F"
+    theme.button             # {"fg_color": ..., "hover_color": ..., "text_color": ...}
+    theme["colors"]          # the palette, as in THEMES["darkly"]
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping, Optional
+from .themes import get_theme, resolve_widget_props, _DEFAULT_COLORS
+from . import theme_loader
+
+
+# Widget kinds with resolved properties, in the order of resolve_widget_props()
+WIDGET_KINDS = (
+    "button", "entry", "textbox", "checkbox", "radio_button", "switch", "slider",
+    "progressbar", "option_menu", "combobox", "frame", "tabview", "segmented_button",
+    "scrollable_frame", "label",
+)
+
+PALETTE_COLORS = tuple(_DEFAULT_COLORS)
+
+
+class Theme(Mapping):
+    """
+    An immutable theme with precomputed palette colors and widget properties.
+
+    Attributes:
+        name: The theme name
+        appearance_mode: "light" or "dark"
+        color_theme: The CustomTkinter color theme
+        colors: A read-only view of the palette
+        resolved: The configure() properties of every widget kind, keyed by kind
+        primary, secondary, success, danger, warning, info, light, dark: The palette
+            colors, falling back to the defaults for colors the theme does not define
+        button, entry, textbox, ...: The resolved properties of each widget kind (see
+            WIDGET_KINDS)
+
+    The property dictionaries are shared and must not be modified.
+    """
+
+    __slots__ = (
+        ("name", "appearance_mode", "color_theme", "colors", "resolved", "_data", "_hash")
+        + PALETTE_COLORS + WIDGET_KINDS
+    )
+
+    def __init__(self, name: str, data: Dict[str, Any], resolved: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        Create a theme object. Use get_theme_object() to get the shared object of a theme.
+
+        Args:
+            name: The theme name
+            data: The theme configuration; it is not copied and must not be modified afterwards
+            resolved: The resolved widget properties of the theme (default: resolved from data)
+        """
+        if resolved is None:
+            resolved = theme_loader.get_resolved_props(data)
+            if resolved is None:
+                resolved = resolve_widget_props(data)
+
+        palette = data.get("colors", {})
+        init = object.__setattr__
+        init(self, "name", name)
+        init(self, "appearance_mode", data.get("appearance_mode", "dark"))
+        init(self, "color_theme", data.get("color_theme", "blue"))
+        init(self, "colors", MappingProxyType(palette))
+        init(self, "resolved", resolved)
+        init(self, "_data", data)
+        init(self, "_hash", hash((name, id(data))))
+        for color_name, default in _DEFAULT_COLORS.items():
+            init(self, color_name, palette.get(color_name, default))
+        for widget_kind in WIDGET_KINDS:
+            init(self, widget_kind, resolved.get(widget_kind, {}))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"Theme objects are immutable; cannot set '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Theme objects are immutable; cannot delete '{name}'")
+
+    def __reduce__(self):
+        return Theme, (self.name, self._data, self.resolved)
+
+    # Read-only mapping over the theme configuration, for code written for theme dicts
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def keys(self):
+        return self._data.keys()
+
+    def values(self):
+        return self._data.values()
+
+    def items(self):
+        return self._data.items()
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Theme):
+            # Equal only to the same version of the same theme, consistent with __hash__
+            return self._data is other._data and self.name == other.name
+        if isinstance(other, Mapping):
+            return self._data == other
+        return NotImplemented
+
+    def __ne__(self, other: Any) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __repr__(self) -> str:
+        return f"<Theme {self.name!r} ({self.appearance_mode})>"
+
+    @property
+    def data(self) -> Mapping[str, Any]:
+        """A read-only view of the theme configuration"""
+        return MappingProxyType(self._data)
+
+    def widget_props(self, widget_kind: str) -> Dict[str, Any]:
+        """
+        Get the resolved properties of a widget kind.
+
+        Args:
+            widget_kind: A widget kind such as "button" or "radio_button"
+
+        Returns:
+            The configure() properties, or an empty dictionary for unknown kinds
+        """
+        return self.resolved.get(widget_kind, {})
+
+
+# Theme objects by name. A theme replaced in THEMES (e.g. a reloaded theme file) has a
+# new configuration dictionary and gets a new theme object.
+_theme_objects: Dict[str, Theme] = {}
+
+
+def get_theme_object(theme_name: str) -> Theme:
+    """
+    Get the theme object of a theme, creating it on first use.
+
+    Args:
+        theme_name: The name of the theme
+
+    Returns:
+        The shared Theme; the same object is returned until the theme changes
+
+    Raises:
+        ValueError: If the theme does not exist
+    """
+    theme_name = theme_name.lower()
+    data = get_theme(theme_name)
+    theme = _theme_objects.get(theme_name)
+    if theme is None or theme._data is not data:
+        theme = _theme_objects[theme_name] = Theme(theme_name, data)
+    return theme
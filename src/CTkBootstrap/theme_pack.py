@@ -0,0 +1,314 @@
+"""
+Theme packs for CTkBootstrap.
+
+A theme pack is a single file holding many themes, with an index at the start that
+maps each theme name to the position of its body. Packs are read through mmap: adding
+a pack only reads the index, so every theme in it is listed right away (e.g. by
+ThemeManager.available_themes), but a theme body is only deserialized when the theme
+is first used.
+
+File layout (integers are little-endian):
+    header  8-byte magic, format version (u16), theme count (u32)
+    index   per theme: name length (u16), UTF-8 name, body offset (u64), body length (u32)
+    bodies  one compact UTF-8 JSON object per theme
+
+Example:
+    write_theme_pack("corporate.ctkpack", themes)
+    add_theme_pack("corporate.ctkpack")
+    root.apply_theme("acme-dark")  # only acme-dark is loaded
+"""
+
+import os
+import sys
+import json
+import mmap
+import struct
+import argparse
+import tempfile
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+from .themes import (
+    THEME_FILE_EXTENSION, add_theme_provider, remove_theme_provider, normalize_theme, _freeze_lists
+)
+
+
+PACK_MAGIC = b"CTKBPACK"
+PACK_VERSION = 1
+
+# File extension of theme packs
+THEME_PACK_EXTENSION = ".ctkpack"
+
+_HEADER = struct.Struct("<8sHI")
+_NAME_LENGTH = struct.Struct("<H")
+_BODY_LOCATION = struct.Struct("<QI")
+
+
+class ThemePack:
+    """
+    A theme pack file opened for lazy, per-theme loading.
+
+    Supports "name in pack", len(pack) and use as a context manager, which closes it.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a theme pack and read its index.
+
+        Args:
+            path: Path to the theme pack file
+
+        Raises:
+            ValueError: If the file is not a valid theme pack
+        """
+        self.path = os.path.abspath(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # mmap rejects empty files
+            self._file.close()
+            raise ValueError(f"Invalid theme pack: {self.path} is empty") from None
+        try:
+            self._index = self._read_index()
+        except (ValueError, struct.error, UnicodeDecodeError) as e:
+            self.close()
+            raise ValueError(f"Invalid theme pack: {self.path}: {e}") from None
+        self._loaded: Dict[str, Dict[str, Any]] = {}
+
+    def _read_index(self) -> Dict[str, Tuple[int, int]]:
+        """Read the index from the start of the file"""
+        data = self._data
+        magic, version, count = _HEADER.unpack_from(data, 0)
+        if magic != PACK_MAGIC:
+            raise ValueError("not a theme pack")
+        if version != PACK_VERSION:
+            raise ValueError(f"unsupported format version {version}")
+
+        index = {}
+        position = _HEADER.size
+        for _ in range(count):
+            (name_length,) = _NAME_LENGTH.unpack_from(data, position)
+            position += _NAME_LENGTH.size
+            name = data[position:position + name_length].decode("utf-8")
+            position += name_length
+            offset, length = _BODY_LOCATION.unpack_from(data, position)
+            position += _BODY_LOCATION.size
+            if offset + length > len(data):
+                raise ValueError(f"theme '{name}' extends past the end of the file")
+            index[name] = (offset, length)
+        return index
+
+    def __contains__(self, theme_name: str) -> bool:
+        return theme_name in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __enter__(self) -> "ThemePack":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<ThemePack {self.path!r}: {len(self._index)} themes, {len(self._loaded)} loaded>"
+
+    def names(self) -> List[str]:
+        """
+        Get the names of the themes in the pack, without loading them.
+
+        Returns:
+            The theme names, in the order of the index
+        """
+        return list(self._index)
+
+    @property
+    def loaded_names(self) -> List[str]:
+        """The names of the themes deserialized so far"""
+        return list(self._loaded)
+
+    def load(self, theme_name: str) -> Dict[str, Any]:
+        """
+        Deserialize a theme from the pack. Each theme is only deserialized once.
+
+        Args:
+            theme_name: The name of the theme
+
+        Returns:
+            The theme configuration, normalized like the built-in themes
+
+        Raises:
+            ValueError: If the theme is not in the pack or its body is invalid
+        """
+        theme = self._loaded.get(theme_name)
+        if theme is not None:
+            return theme
+
+        location = self._index.get(theme_name)
+        if location is None:
+            valid_themes = ", ".join(self._index)
+            raise ValueError(f"Invalid theme: {theme_name}. Valid themes are: {valid_themes}")
+        if self._data.closed:
+            raise ValueError(f"Theme pack {self.path} is closed")
+
+        offset, length = location
+        try:
+            data = json.loads(self._data[offset:offset + length].decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ValueError(f"Invalid theme '{theme_name}' in theme pack {self.path}: {e}") from None
+        if not isinstance(data, dict):
+            raise ValueError(f"Invalid theme '{theme_name}' in theme pack {self.path}: not a JSON object")
+
+        theme = _freeze_lists(data)
+        normalize_theme(theme)
+        self._loaded[theme_name] = theme
+        return theme
+
+    def close(self) -> None:
+        """Close the pack file; themes already loaded remain usable"""
+        self._data.close()
+        self._file.close()
+
+
+def write_theme_pack(path: str, themes: Mapping[str, Dict[str, Any]]) -> None:
+    """
+    Write themes to a theme pack file.
+
+    Args:
+        path: Path of the theme pack file to write; it is replaced atomically
+        themes: A mapping from theme names to theme configurations, e.g. THEMES
+    """
+    names = [name.lower() for name in themes]
+    if len(set(names)) != len(names):
+        raise ValueError("Theme names must be unique regardless of case")
+
+    encoded_names = [name.encode("utf-8") for name in names]
+    bodies = [
+        json.dumps(theme, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        for theme in themes.values()
+    ]
+
+    offset = _HEADER.size + sum(
+        _NAME_LENGTH.size + len(name) + _BODY_LOCATION.size for name in encoded_names
+    )
+    index = bytearray(_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(names)))
+    for name, body in zip(encoded_names, bodies):
+        index += _NAME_LENGTH.pack(len(name)) + name + _BODY_LOCATION.pack(offset, len(body))
+        offset += len(body)
+
+    path = os.path.abspath(path)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(index)
+            for body in bodies:
+                file.write(body)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+def build_theme_pack(path: str, sources: Iterable[str]) -> List[str]:
+    """
+    Write the themes of JSON theme files to a theme pack file.
+
+    Args:
+        path: Path of the theme pack file to write
+        sources: JSON theme files, or directories whose JSON theme files are packed
+
+    Returns:
+        The names of the packed themes
+    """
+    files = []
+    for source in sources:
+        if os.path.isdir(source):
+            files.extend(
+                os.path.join(source, name) for name in sorted(os.listdir(source))
+                if name.lower().endswith(THEME_FILE_EXTENSION)
+            )
+        else:
+            files.append(source)
+
+    themes = {}
+    for file_path in files:
+        with open(file_path, "r", encoding="utf-8") as file:
+            try:
+                theme = json.load(file)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid theme file {file_path}: {e}") from None
+        if not isinstance(theme, dict):
+            raise ValueError(f"Invalid theme file {file_path}: not a JSON object")
+        themes[os.path.splitext(os.path.basename(file_path))[0].lower()] = theme
+
+    write_theme_pack(path, themes)
+    return list(themes)
+
+
+# Theme packs registered with add_theme_pack(), by path
+_theme_packs: Dict[str, ThemePack] = {}
+
+
+def add_theme_pack(path: str) -> ThemePack:
+    """
+    Make the themes of a theme pack available. Only the index is read; each theme is
+    loaded the first time it is used.
+
+    Args:
+        path: Path to the theme pack file
+
+    Returns:
+        The opened theme pack
+    """
+    path = os.path.abspath(path)
+    pack = _theme_packs.get(path)
+    if pack is None:
+        pack = _theme_packs[path] = ThemePack(path)
+        add_theme_provider(pack)
+    return pack
+
+
+def remove_theme_pack(path: str) -> None:
+    """
+    Stop offering the themes of a theme pack and close it. Themes already loaded from
+    it stay available.
+
+    Args:
+        path: Path to the theme pack file, as passed to add_theme_pack()
+    """
+    pack = _theme_packs.pop(os.path.abspath(path), None)
+    if pack is not None:
+        remove_theme_provider(pack)
+        pack.close()
+
+
+def get_theme_packs() -> List[ThemePack]:
+    """
+    Get the registered theme packs.
+
+    Returns:
+        The theme packs, in the order they were added
+    """
+    return list(_theme_packs.values())
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m CTkBootstrap.theme_pack",
+        description="Build a CTkBootstrap theme pack from JSON theme files"
+    )
+    parser.add_argument("output", help=f"The theme pack file to write (e.g. themes{THEME_PACK_EXTENSION})")
+    parser.add_argument("sources", nargs="+", help="JSON theme files or directories containing them")
+    args = parser.parse_args(argv)
+
+    try:
+        names = build_theme_pack(args.output, args.sources)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print(f"Packed {len(names)} themes into {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
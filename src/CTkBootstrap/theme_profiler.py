@@ -0,0 +1,403 @@
+"""
+Theme application profiler for CTkBootstrap.
+
+Records, per widget class, the wall time spent theming widgets, the number of
+configure() calls and which properties they set, and the number and duration of
+redraws, plus the total time of each theme walk. Profiling is switched on at runtime:
+
+    with profile_theming() as profile:
+        root.apply_theme("cyborg")
+    print(profile.to_json(indent=2))
+
+or for a whole process by setting the CTKBOOTSTRAP_PROFILE environment variable before
+the package is imported. "1" only enables profiling (see get_active_profile()); any
+other value except "0" is a file path the profile is written to as JSON at exit.
+
+The instrumentation is installed when profiling starts and removed when it stops, so
+theming costs nothing extra while the profiler is off.
+"""
+
+import os
+import json
+import time
+import atexit
+import warnings
+import functools
+import tkinter as tk
+from contextlib import contextmanager
+from typing import Dict, Any, Callable, Iterator, List, Optional, Tuple
+from . import widget_theme_mapper, themed_widgets
+from .theme_manager import ThemeManager
+from .theme_transactions import add_draw_observer, remove_draw_observer
+
+
+# Functions of widget_theme_mapper that theme a single widget
+_MAPPER_WIDGET_FUNCTIONS = ("_apply_planned_theme", "apply_theme_to_widget")
+
+# Functions of widget_theme_mapper that walk a widget tree or registry
+_MAPPER_WALK_FUNCTIONS = ("apply_theme_to_tree", "apply_theme_to_registry")
+
+# Generators of widget_theme_mapper that walk a widget tree or registry one widget per step
+_MAPPER_ITER_WALK_FUNCTIONS = ("iter_theme_tree", "iter_theme_registry")
+
+# Modules that import widget_theme_mapper functions by name; their references are
+# patched along with the originals
+_MAPPER_IMPORTERS = (themed_widgets,)
+
+# ThemeManager methods that theme a single widget, besides the _apply_*_theme methods
+_MANAGER_WIDGET_METHODS = ("apply_theme_to_widget", "_configure_widget")
+
+# ThemeManager methods that walk a widget tree or registry
+_MANAGER_WALK_METHODS = ("apply_theme_to_all_widgets",)
+
+_active_profile: Optional["ThemeProfile"] = None
+
+# (owner, attribute name, original value) of everything patched while profiling
+_patches: List[Tuple[Any, str, Any]] = []
+
+
+class ThemeProfile:
+    """
+    Statistics collected while theme profiling is enabled.
+    """
+
+    def __init__(self):
+        """Initialize an empty profile."""
+        self._classes: Dict[str, Dict[str, Any]] = {}
+        self._walks: List[Dict[str, Any]] = []
+        # Nesting depths used to only record the outermost call
+        self._widget_depth = 0
+        self._walk_depth = 0
+        self._configure_depth = 0
+        self._draw_depth = 0
+        self._draw_starts: List[float] = []
+
+    @property
+    def widget_classes(self) -> Dict[str, Dict[str, Any]]:
+        """Statistics per widget class name"""
+        return self._classes
+
+    @property
+    def walks(self) -> List[Dict[str, Any]]:
+        """One entry per theme walk, with the walk function and its duration"""
+        return self._walks
+
+    @property
+    def total_walk_time(self) -> float:
+        """The total time spent in theme walks, in seconds"""
+        return sum(walk["time"] for walk in self._walks)
+
+    def reset(self) -> None:
+        """Discard all collected statistics"""
+        self._classes.clear()
+        self._walks.clear()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Export the profile as plain data.
+
+        Returns:
+            A JSON-serializable dict with the per-class statistics, sorted by time spent,
+            the individual walks and the totals
+        """
+        classes = sorted(self._classes.items(), key=lambda item: item[1]["time"], reverse=True)
+        return {
+            "widget_classes": {
+                name: dict(stats, properties=dict(stats["properties"]))
+                for name, stats in classes
+            },
+            "walks": [dict(walk) for walk in self._walks],
+            "total_walk_time": self.total_walk_time,
+            "total_widgets": sum(stats["widgets"] for stats in self._classes.values()),
+            "total_configure_calls": sum(stats["configure_calls"] for stats in self._classes.values()),
+            "total_redraws": sum(stats["redraws"] for stats in self._classes.values()),
+        }
+
+    def to_json(self, **kwargs) -> str:
+        """
+        Export the profile as JSON.
+
+        Args:
+            **kwargs: Arguments passed to json.dumps(), e.g. indent
+
+        Returns:
+            The JSON document
+        """
+        return json.dumps(self.as_dict(), **kwargs)
+
+    def _stats(self, widget: Any) -> Dict[str, Any]:
+        """Get the statistics entry of a widget's class, creating it on first use"""
+        name = type(widget).__name__
+        stats = self._classes.get(name)
+        if stats is None:
+            stats = self._classes[name] = {
+                "widgets": 0,
+                "time": 0.0,
+                "configure_calls": 0,
+                "properties": {},
+                "redraws": 0,
+                "redraw_time": 0.0,
+            }
+        return stats
+
+    def _record_widget(self, widget: Any, elapsed: float) -> None:
+        stats = self._stats(widget)
+        stats["widgets"] += 1
+        stats["time"] += elapsed
+
+    def _record_configure(self, widget: Any, kwargs: Dict[str, Any]) -> None:
+        stats = self._stats(widget)
+        stats["configure_calls"] += 1
+        properties = stats["properties"]
+        for prop in kwargs:
+            properties[prop] = properties.get(prop, 0) + 1
+
+    def _record_walk(self, name: str, elapsed: float) -> None:
+        self._walks.append({"function": name, "time": elapsed})
+
+    # Draw observer interface (see theme_transaction.add_draw_observer)
+
+    def draw_started(self, widget: Any) -> None:
+        self._draw_depth += 1
+        self._draw_starts.append(time.perf_counter())
+
+    def draw_finished(self, widget: Any) -> None:
+        elapsed = time.perf_counter() - self._draw_starts.pop()
+        self._draw_depth -= 1
+        stats = self._stats(widget)
+        stats["redraws"] += 1
+        stats["redraw_time"] += elapsed
+
+
+def _profile_widget_call(function: Callable, widget_index: int) -> Callable:
+    """Wrap a function theming one widget so its outermost calls are timed per class"""
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        profile = _active_profile
+        if profile is None or profile._widget_depth:
+            return function(*args, **kwargs)
+        profile._widget_depth += 1
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            profile._widget_depth -= 1
+            if len(args) > widget_index:
+                profile._record_widget(args[widget_index], time.perf_counter() - start)
+    return wrapper
+
+
+def _profile_walk(function: Callable, name: str) -> Callable:
+    """Wrap a function walking a widget tree so its outermost calls are timed"""
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        profile = _active_profile
+        if profile is None or profile._walk_depth:
+            return function(*args, **kwargs)
+        profile._walk_depth += 1
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            profile._walk_depth -= 1
+            profile._record_walk(name, time.perf_counter() - start)
+    return wrapper
+
+
+def _profile_iter_walk(function: Callable, name: str) -> Callable:
+    """
+    Wrap a generator walking a widget tree so the time of its outermost steps is
+    recorded as one walk, e.g. the slices of an incremental switch
+    """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        steps = function(*args, **kwargs)
+        recording = None
+        elapsed = 0.0
+        try:
+            while True:
+                profile = _active_profile
+                if profile is None or profile._walk_depth:
+                    # Not profiling, or the step is part of a walk that is already timed
+                    try:
+                        widget = next(steps)
+                    except StopIteration:
+                        return
+                else:
+                    recording = profile
+                    profile._walk_depth += 1
+                    start = time.perf_counter()
+                    try:
+                        widget = next(steps)
+                    except StopIteration:
+                        return
+                    finally:
+                        profile._walk_depth -= 1
+                        elapsed += time.perf_counter() - start
+                yield widget
+        finally:
+            steps.close()
+            if recording is not None:
+                recording._record_walk(name, elapsed)
+    return wrapper
+
+
+def _profile_configure(function: Callable) -> Callable:
+    """Wrap a configure() method so outermost calls outside of redraws are counted"""
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        profile = _active_profile
+        if profile is None or profile._configure_depth or profile._draw_depth:
+            return function(self, *args, **kwargs)
+        profile._record_configure(self, kwargs)
+        profile._configure_depth += 1
+        try:
+            return function(self, *args, **kwargs)
+        finally:
+            profile._configure_depth -= 1
+    return wrapper
+
+
+def _iter_configure_classes() -> Iterator[type]:
+    """Yield the widget classes that define their own configure()"""
+    seen = set()
+    stack = [tk.Misc]
+    while stack:
+        widget_class = stack.pop()
+        if widget_class in seen:
+            continue
+        seen.add(widget_class)
+        if "configure" in widget_class.__dict__:
+            yield widget_class
+        stack.extend(widget_class.__subclasses__())
+
+
+def _patch(owner: Any, name: str, wrapper_factory: Callable[[Any], Any]) -> None:
+    """Replace an attribute with a wrapped version, remembering the original"""
+    original = owner.__dict__[name] if isinstance(owner, type) else getattr(owner, name)
+    _patches.append((owner, name, original))
+    setattr(owner, name, wrapper_factory(original))
+
+
+def _patch_mapper_function(name: str, wrapper_factory: Callable[[Any], Any]) -> None:
+    """Wrap a widget_theme_mapper function, including the references imported by name"""
+    original = getattr(widget_theme_mapper, name)
+    wrapper = wrapper_factory(original)
+    for module in (widget_theme_mapper,) + _MAPPER_IMPORTERS:
+        if getattr(module, name, None) is original:
+            _patches.append((module, name, original))
+            setattr(module, name, wrapper)
+
+
+def _install() -> None:
+    """Install the profiling wrappers"""
+    for name in _MAPPER_WIDGET_FUNCTIONS:
+        _patch_mapper_function(name, lambda f: _profile_widget_call(f, 0))
+    for name in _MAPPER_WALK_FUNCTIONS:
+        _patch_mapper_function(name, lambda f, n=name: _profile_walk(f, n))
+    for name in _MAPPER_ITER_WALK_FUNCTIONS:
+        _patch_mapper_function(name, lambda f, n=name: _profile_iter_walk(f, n))
+
+    manager_methods = list(_MANAGER_WIDGET_METHODS) + [
+        name for name in ThemeManager.__dict__
+        if name.startswith("_apply_") and name.endswith("_theme")
+    ]
+    for name in manager_methods:
+        _patch(ThemeManager, name, lambda f: _profile_widget_call(f, 1))
+    for name in _MANAGER_WALK_METHODS:
+        _patch(ThemeManager, name, lambda f, n=name: _profile_walk(f, f"ThemeManager.{n}"))
+
+    _patch(themed_widgets.CTk, "apply_theme", lambda f: _profile_walk(f, "CTk.apply_theme"))
+
+    for widget_class in _iter_configure_classes():
+        _patch(widget_class, "configure", _profile_configure)
+
+
+def _uninstall() -> None:
+    """Remove the profiling wrappers"""
+    while _patches:
+        owner, name, original = _patches.pop()
+        setattr(owner, name, original)
+
+
+def enable_profiling(profile: Optional[ThemeProfile] = None) -> ThemeProfile:
+    """
+    Start recording theme application statistics.
+
+    Args:
+        profile: The profile to record into, or None for a new one
+
+    Returns:
+        The profile being recorded
+
+    Raises:
+        RuntimeError: If profiling is already enabled
+    """
+    global _active_profile
+    if _active_profile is not None:
+        raise RuntimeError("Theme profiling is already enabled")
+
+    _active_profile = profile if profile is not None else ThemeProfile()
+    _install()
+    add_draw_observer(_active_profile)
+    return _active_profile
+
+
+def disable_profiling() -> Optional[ThemeProfile]:
+    """
+    Stop recording theme application statistics.
+
+    Returns:
+        The profile that was being recorded, or None if profiling was not enabled
+    """
+    global _active_profile
+    profile = _active_profile
+    if profile is None:
+        return None
+
+    remove_draw_observer(profile)
+    _uninstall()
+    _active_profile = None
+    return profile
+
+
+def get_active_profile() -> Optional[ThemeProfile]:
+    """Get the profile currently being recorded, or None if profiling is off"""
+    return _active_profile
+
+
+@contextmanager
+def profile_theming() -> Iterator[ThemeProfile]:
+    """
+    Record theme application statistics for the duration of a with block.
+
+    Yields:
+        The ThemeProfile being recorded
+    """
+    profile = enable_profiling()
+    try:
+        yield profile
+    finally:
+        disable_profiling()
+
+
+def _write_profile_at_exit(path: str) -> None:
+    """Write the process-wide profile to a JSON file"""
+    profile = disable_profiling()
+    if profile is None:
+        return
+    try:
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(profile.to_json(indent=2))
+    except OSError as e:
+        warnings.warn(f"Could not write theme profile to {path}: {e}", RuntimeWarning)
+
+
+def _enable_from_environment() -> None:
+    """Enable profiling for the whole process if CTKBOOTSTRAP_PROFILE is set"""
+    setting = os.environ.get("CTKBOOTSTRAP_PROFILE", "").strip()
+    if not setting or setting == "0" or _active_profile is not None:
+        return
+    enable_profiling()
+    if setting.lower() not in ("1", "true", "yes", "on"):
+        atexit.register(_write_profile_at_exit, setting)
@@ -0,0 +1,161 @@
+"""
+Incremental theme application for CTkBootstrap.
+
+Theming thousands of widgets in one go blocks the Tk event loop, freezing the window
+and dropping input. IncrementalThemeApplication spreads the work over several event
+loop iterations: each slice themes widgets until its time budget is used up, then
+yields back to Tk with after() so pending events are processed in between.
+"""
+
+import time
+import tkinter as tk
+from typing import Any, Callable, Iterator, Optional
+from .theme_transactions import theme_transaction
+
+
+class IncrementalThemeApplication:
+    """
+    Drives a theme traversal across Tk event loop ticks within a per-slice time budget.
+
+    Instances are returned by CTk.apply_theme(..., mode="incremental") and can be
+    used to follow progress or cancel the switch.
+    """
+
+    def __init__(self,
+                 root: tk.Misc,
+                 steps: Iterator[Any],
+                 budget_ms: float = 8.0,
+                 total: Optional[int] = None,
+                 on_progress: Optional[Callable[[int, Optional[int]], None]] = None,
+                 on_complete: Optional[Callable[[int], None]] = None):
+        """
+        Initialize an incremental theme application.
+
+        Args:
+            root: The widget whose after() scheduling is used
+            steps: An iterator that themes one widget per step (see widget_theme_mapper.iter_theme_tree)
+            budget_ms: The time each slice may spend theming widgets, in milliseconds
+            total: The number of widgets to theme, if known in advance
+            on_progress: Called after each slice with (widgets themed so far, total or None)
+            on_complete: Called once with the number of widgets themed when all work is done
+        """
+        if budget_ms <= 0:
+            raise ValueError(f"budget_ms must be positive, got {budget_ms}")
+
+        self._root = root
+        self._steps = steps
+        self._budget = budget_ms / 1000.0
+        self._total = total
+        self._on_progress = on_progress
+        self._on_complete = on_complete
+        self._visited = 0
+        self._slices = 0
+        self._after_id = None
+        self._done = False
+        self._cancelled = False
+
+    @property
+    def visited(self) -> int:
+        """The number of widgets themed so far"""
+        return self._visited
+
+    @property
+    def total(self) -> Optional[int]:
+        """The number of widgets to theme, or None if it is not known in advance"""
+        return self._total
+
+    @property
+    def slices(self) -> int:
+        """The number of event loop slices used so far"""
+        return self._slices
+
+    @property
+    def done(self) -> bool:
+        """Whether all widgets have been themed"""
+        return self._done
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the application was cancelled before completing"""
+        return self._cancelled
+
+    def start(self) -> "IncrementalThemeApplication":
+        """
+        Schedule the first slice for when Tk is idle.
+
+        Returns:
+            This instance
+        """
+        if self._after_id is None and not self._done and not self._cancelled:
+            self._after_id = self._root.after_idle(self._run_slice)
+        return self
+
+    def cancel(self) -> None:
+        """Stop theming; widgets not reached yet keep their current colors"""
+        if self._done or self._cancelled:
+            return
+        self._cancelled = True
+        self._cancel_scheduled()
+        close = getattr(self._steps, "close", None)
+        if close is not None:
+            close()
+
+    def run_to_completion(self) -> int:
+        """
+        Theme all remaining widgets immediately, without yielding to the event loop.
+
+        Returns:
+            The number of widgets themed
+        """
+        self._cancel_scheduled()
+        with theme_transaction(self._root):
+            for _ in self._steps:
+                self._visited += 1
+        self._finish()
+        return self._visited
+
+    def _cancel_scheduled(self) -> None:
+        """Cancel the pending slice, if any, without cancelling the application"""
+        if self._after_id is not None:
+            try:
+                self._root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+
+    def _run_slice(self) -> None:
+        """Theme widgets until the time budget is spent, then reschedule"""
+        self._after_id = None
+        if self._cancelled:
+            return
+
+        self._slices += 1
+        deadline = time.perf_counter() + self._budget
+        finished = True
+        # Widgets touched in this slice are redrawn once when the slice ends
+        with theme_transaction(self._root):
+            for _ in self._steps:
+                self._visited += 1
+                if time.perf_counter() >= deadline:
+                    finished = False
+                    break
+        
+        if finished:
+            self._finish()
+            return
+
+        if self._on_progress is not None:
+            self._on_progress(self._visited, self._total)
+
+        # after() rather than after_idle() lets queued input events run between slices
+        self._after_id = self._root.after(1, self._run_slice)
+
+    def _finish(self) -> None:
+        """Mark the application as done and report completion"""
+        if self._done:
+            return
+        self._done = True
+        if self._on_progress is not None:
+            self._on_progress(self._visited, self._total if self._total is not None else self._visited)
+        if self._on_complete is not None:
+            self._on_complete(self._visited)
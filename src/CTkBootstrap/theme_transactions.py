@@ -0,0 +1,179 @@
+"""
+Redraw-coalescing theme transactions for CTkBootstrap.
+
+Every configure() on a CustomTkinter widget redraws it immediately, and so does every
+appearance mode change. Inside a theme transaction those redraws are deferred: each
+touched widget is only marked as dirty, and when the outermost transaction ends every
+dirty widget is redrawn exactly once.
+
+Example:
+    with theme_transaction(root):
+        for button in buttons:
+            button.configure(fg_color=color)
+            button.configure(text_color=text_color)
+"""
+
+import tkinter as tk
+import customtkinter as ctk
+from typing import Any, Callable, Dict, List
+
+
+# Original _draw methods of the patched CustomTkinter classes
+_original_draws: Dict[type, Callable] = {}
+
+# Tcl interpreters that currently have an open transaction
+_interpreters: List[Any] = []
+
+# Widgets whose redraw was deferred, keyed by id() to keep first-touch order
+_dirty_widgets: Dict[int, Any] = {}
+
+# Objects with draw_started(widget) and draw_finished(widget) methods that are notified
+# around every outermost redraw while registered (see theme_profiler)
+_draw_observers: List[Any] = []
+
+# Nesting depth of real redraws, so super()._draw() calls are not reported again
+_draw_depth = 0
+
+
+def _iter_draw_classes():
+    """Yield every loaded CustomTkinter widget class that defines its own _draw()"""
+    seen = set()
+    stack = [ctk.CTkBaseClass]
+    while stack:
+        widget_class = stack.pop()
+        if widget_class in seen:
+            continue
+        seen.add(widget_class)
+        if "_draw" in widget_class.__dict__:
+            yield widget_class
+        stack.extend(widget_class.__subclasses__())
+
+
+def _make_deferred_draw(original_draw: Callable) -> Callable:
+    """Wrap a _draw() method so it only marks the widget dirty inside a transaction"""
+    def _draw(self, *args, **kwargs):
+        global _draw_depth
+        interpreter = getattr(self, "tk", None)
+        for active in _interpreters:
+            if interpreter is active:
+                _dirty_widgets[id(self)] = self
+                return
+        if not _draw_observers or _draw_depth:
+            return original_draw(self, *args, **kwargs)
+
+        for observer in _draw_observers:
+            observer.draw_started(self)
+        _draw_depth += 1
+        try:
+            return original_draw(self, *args, **kwargs)
+        finally:
+            _draw_depth -= 1
+            for observer in _draw_observers:
+                observer.draw_finished(self)
+    _draw.__wrapped__ = original_draw
+    return _draw
+
+
+def _patch_draw_methods() -> None:
+    """Defer the redraws of all CustomTkinter widget classes"""
+    if _original_draws:
+        return
+    for widget_class in _iter_draw_classes():
+        original_draw = widget_class.__dict__["_draw"]
+        _original_draws[widget_class] = original_draw
+        widget_class._draw = _make_deferred_draw(original_draw)
+
+
+def _restore_draw_methods() -> None:
+    """Put the original _draw() methods back, unless draws are still observed"""
+    if _interpreters or _draw_observers:
+        return
+    for widget_class, original_draw in _original_draws.items():
+        widget_class._draw = original_draw
+    _original_draws.clear()
+
+
+class ThemeTransaction:
+    """
+    Context manager that coalesces the redraws of CustomTkinter widgets.
+
+    Transactions can be nested; only the outermost one redraws the dirty widgets.
+    Use theme_transaction() to create one.
+    """
+
+    def __init__(self, root: tk.Misc):
+        """
+        Initialize a transaction.
+
+        Args:
+            root: Any widget of the Tk application whose redraws should be coalesced
+        """
+        self._interpreter = root.tk
+        self._redrawn = 0
+
+    @property
+    def redrawn(self) -> int:
+        """The number of widgets redrawn when the transaction ended"""
+        return self._redrawn
+
+    def __enter__(self) -> "ThemeTransaction":
+        _patch_draw_methods()
+        _interpreters.append(self._interpreter)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        _interpreters.remove(self._interpreter)
+        if _interpreters:
+            return
+
+        # Outermost transaction: restore drawing, then redraw each dirty widget once
+        _restore_draw_methods()
+        dirty_widgets = list(_dirty_widgets.values())
+        _dirty_widgets.clear()
+        for widget in dirty_widgets:
+            try:
+                widget._draw()
+            except tk.TclError:
+                # The widget was destroyed during the transaction
+                continue
+            self._redrawn += 1
+
+
+def add_draw_observer(observer: Any) -> None:
+    """
+    Get notified around every CustomTkinter redraw until the observer is removed.
+    
+    Args:
+        observer: An object with draw_started(widget) and draw_finished(widget) methods
+    """
+    _patch_draw_methods()
+    _draw_observers.append(observer)
+
+
+def remove_draw_observer(observer: Any) -> None:
+    """
+    Stop notifying an observer added with add_draw_observer().
+    
+    Args:
+        observer: The observer to remove
+    """
+    if observer in _draw_observers:
+        _draw_observers.remove(observer)
+    _restore_draw_methods()
+
+
+def theme_transaction(root: tk.Misc) -> ThemeTransaction:
+    """
+    Create a context manager that coalesces CustomTkinter redraws.
+
+    Inside the context, configure() calls and appearance mode changes do not redraw
+    CustomTkinter widgets. When the context exits, each widget that needed a redraw
+    is redrawn exactly once.
+
+    Args:
+        root: Any widget of the Tk application, usually the root window
+
+    Returns:
+        A ThemeTransaction to use in a with statement
+    """
+    return ThemeTransaction(root)
@@ -0,0 +1,92 @@
+"""
+Incremental theme transitions for CTkBootstrap.
+
+Switching between two themes only needs to touch the properties whose values differ.
+This module computes per-widget-class property diffs between two themes and caches
+them per (from, to) pair, so repeated switches reconfigure as little as possible.
+"""
+
+from typing import Dict, Any, Hashable, Tuple
+from .style_plans import StylePlan, get_style_plan
+
+
+# Cached diffs keyed by transition. The two source mappings are stored next to the
+# diff so that a transition is recomputed if either theme has been recompiled.
+_transition_cache: Dict[Hashable, Tuple[Any, Any, Dict[Any, Dict[str, Any]]]] = {}
+
+_MISSING = object()
+
+
+def diff_theme_props(old_props: Dict[Any, Dict[str, Any]],
+                     new_props: Dict[Any, Dict[str, Any]]) -> Dict[Any, Dict[str, Any]]:
+    """
+    Compute the properties that change between two per-widget property mappings.
+
+    Args:
+        old_props: Widget key (class or theme key) -> properties of the outgoing theme
+        new_props: Widget key (class or theme key) -> properties of the incoming theme
+
+    Returns:
+        A mapping with the same keys as new_props, where each value only contains the
+        properties whose value differs from (or is missing in) the outgoing theme
+    """
+    diff = {}
+    for key, props in new_props.items():
+        previous = old_props.get(key, {})
+        changed = {}
+        for prop, value in props.items():
+            # Interned colors and color pairs (see colors.py) are equal only if identical
+            old_value = previous.get(prop, _MISSING)
+            if old_value is not value and old_value != value:
+                changed[prop] = value
+        diff[key] = changed
+    return diff
+
+
+def get_transition(cache_key: Hashable,
+                   old_props: Dict[Any, Dict[str, Any]],
+                   new_props: Dict[Any, Dict[str, Any]]) -> Dict[Any, Dict[str, Any]]:
+    """
+    Get the cached property diff for a transition, computing it on first use.
+
+    Args:
+        cache_key: A hashable key identifying the transition, e.g. ("plan", "darkly", "cyborg")
+        old_props: The properties of the outgoing theme
+        new_props: The properties of the incoming theme
+
+    Returns:
+        The property diff (see diff_theme_props). It is shared and must not be modified.
+    """
+    cached = _transition_cache.get(cache_key)
+    if cached is None or cached[0] is not old_props or cached[1] is not new_props:
+        cached = (old_props, new_props, diff_theme_props(old_props, new_props))
+        _transition_cache[cache_key] = cached
+    return cached[2]
+
+
+def get_transition_plan(from_theme: str, to_theme: str) -> StylePlan:
+    """
+    Get a style plan that only contains the properties changing between two themes.
+
+    Widgets already styled with from_theme end up fully styled with to_theme after
+    this plan is applied. Widget classes with no changes map to an empty dict.
+
+    Args:
+        from_theme: The name of the theme currently applied
+        to_theme: The name of the theme to switch to
+
+    Returns:
+        The transition style plan
+    """
+    from_theme = from_theme.lower()
+    to_theme = to_theme.lower()
+    return get_transition(
+        ("plan", from_theme, to_theme),
+        get_style_plan(from_theme),
+        get_style_plan(to_theme),
+    )
+
+
+def clear_transition_cache() -> None:
+    """Discard all cached theme transitions."""
+    _transition_cache.clear()
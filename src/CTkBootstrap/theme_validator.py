@@ -0,0 +1,478 @@
+"""
+WCAG contrast validation of themes for CTkBootstrap.
+
+The validator extracts every text/background color pair of a theme (see CONTRAST_RULES),
+computes all their contrast ratios in one batch (with NumPy when it is installed, see
+colors.contrast_ratios()) and reports the pairs below the required ratio, per theme and
+widget key. Only the colors of the theme's appearance mode are checked, since those are
+the ones shown.
+
+Theme files and theme packs are validated in worker processes, so large collections of
+themes are checked in parallel. It can be run from the command line, e.g. in CI:
+
+    python -m CTkBootstrap.theme_validator themes/ corporate.ctkpack --min-ratio 4.5
+"""
+
+import os
+import sys
+import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+from .colors import contrast_ratios, parse_color
+from .themes import THEMES, THEME_FILE_EXTENSION, extend_theme, get_theme
+
+
+# WCAG 2 AA minimum contrast ratio for normal text
+DEFAULT_MIN_RATIO = 4.5
+
+# Text/background pairs checked per widget key: (text property, background widget key,
+# background property). Text drawn next to a widget, such as checkbox labels, is checked
+# against the window background.
+CONTRAST_RULES: Dict[str, Tuple[Tuple[str, str, str], ...]] = {
+    "button": (
+        ("text_color", "button", "fg_color"),
+        ("text_color", "button", "hover_color"),
+    ),
+    "label": (
+        ("text_color", "window", "fg_color"),
+    ),
+    "entry": (
+        ("text_color", "entry", "fg_color"),
+    ),
+    "textbox": (
+        ("text_color", "textbox", "fg_color"),
+    ),
+    "checkbox": (
+        ("text_color", "window", "fg_color"),
+    ),
+    "radio_button": (
+        ("text_color", "window", "fg_color"),
+    ),
+    "switch": (
+        ("text_color", "window", "fg_color"),
+    ),
+    "option_menu": (
+        ("text_color", "option_menu", "fg_color"),
+        ("dropdown_text_color", "option_menu", "dropdown_fg_color"),
+        ("dropdown_text_color", "option_menu", "dropdown_hover_color"),
+    ),
+    "combobox": (
+        ("text_color", "combobox", "fg_color"),
+        ("dropdown_text_color", "combobox", "dropdown_fg_color"),
+        ("dropdown_text_color", "combobox", "dropdown_hover_color"),
+    ),
+    "tabview": (
+        ("text_color", "tabview", "segmented_button_selected_color"),
+        ("selected_text_color", "tabview", "segmented_button_selected_color"),
+        ("unselected_text_color", "tabview", "segmented_button_unselected_color"),
+    ),
+    "segmented_button": (
+        ("text_color", "segmented_button", "selected_color"),
+        ("selected_text_color", "segmented_button", "selected_color"),
+        ("unselected_text_color", "segmented_button", "unselected_color"),
+    ),
+    "ttk": (
+        ("foreground", "ttk", "background"),
+        ("foreground", "ttk", "fieldbackground"),
+        ("selectforeground", "ttk", "selectbackground"),
+        ("activeforeground", "ttk", "activebackground"),
+    ),
+    "tk": (
+        ("foreground", "tk", "background"),
+        ("selectforeground", "tk", "selectbackground"),
+        ("activeforeground", "tk", "activebackground"),
+    ),
+}
+
+# Themes validated per worker task
+_CHUNK_SIZE = 64
+
+
+class ContrastViolation:
+    """
+    A text/background color pair of a theme with too little contrast.
+
+    Attributes:
+        theme: The theme name
+        widget_key: The widget key of the text color, e.g. "button"
+        foreground_prop: The text color property, e.g. "text_color"
+        background_key: The widget key of the background color
+        background_prop: The background color property, e.g. "hover_color"
+        foreground: The text color
+        background: The background color
+        ratio: The contrast ratio of the two colors
+        source: The theme file or theme pack the theme was read from, if any
+    """
+
+    __slots__ = (
+        "theme", "widget_key", "foreground_prop", "background_key", "background_prop",
+        "foreground", "background", "ratio", "source",
+    )
+
+    def __init__(self, theme: str, widget_key: str, foreground_prop: str, background_key: str,
+                 background_prop: str, foreground: str, background: str, ratio: float,
+                 source: Optional[str] = None):
+        self.theme = theme
+        self.widget_key = widget_key
+        self.foreground_prop = foreground_prop
+        self.background_key = background_key
+        self.background_prop = background_prop
+        self.foreground = foreground
+        self.background = background
+        self.ratio = ratio
+        self.source = source
+
+    def __repr__(self) -> str:
+        return (f"<ContrastViolation {self.theme}.{self.widget_key}.{self.foreground_prop} "
+                f"{self.foreground} on {self.background_key}.{self.background_prop} "
+                f"{self.background}: {self.ratio:.2f}>")
+
+    def __reduce__(self):
+        return ContrastViolation, tuple(getattr(self, name) for name in self.__slots__)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Get the violation as a dictionary, e.g. for JSON output.
+
+        Returns:
+            The attributes of the violation, with the ratio rounded to two decimals
+        """
+        result = {name: getattr(self, name) for name in self.__slots__}
+        result["foreground"] = str(self.foreground)
+        result["background"] = str(self.background)
+        result["ratio"] = round(self.ratio, 2)
+        return result
+
+
+class ValidationReport:
+    """
+    The result of validating themes.
+
+    Attributes:
+        min_ratio: The contrast ratio text colors had to reach
+        violations: Theme name -> the contrast violations of the theme; every validated
+            theme has an entry
+        errors: Theme name or file path -> why it could not be validated
+        checked: The number of color pairs checked
+    """
+
+    def __init__(self, min_ratio: float):
+        self.min_ratio = min_ratio
+        self.violations: Dict[str, List[ContrastViolation]] = {}
+        self.errors: Dict[str, str] = {}
+        self.checked = 0
+
+    @property
+    def passed(self) -> bool:
+        """Whether every theme was validated without violations"""
+        return not self.errors and not any(self.violations.values())
+
+    def by_widget_key(self, theme_name: str) -> Dict[str, List[ContrastViolation]]:
+        """
+        Group the violations of a theme by widget key.
+
+        Args:
+            theme_name: The name of a validated theme
+
+        Returns:
+            Widget key -> the violations of its text colors
+        """
+        grouped: Dict[str, List[ContrastViolation]] = {}
+        for violation in self.violations.get(theme_name, ()):
+            grouped.setdefault(violation.widget_key, []).append(violation)
+        return grouped
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Get the report as a dictionary, e.g. for JSON output.
+
+        Returns:
+            The minimum ratio, the number of checked pairs, the violations per theme and
+            the errors
+        """
+        return {
+            "min_ratio": self.min_ratio,
+            "checked": self.checked,
+            "violations": {
+                name: [violation.as_dict() for violation in violations]
+                for name, violations in self.violations.items()
+            },
+            "errors": dict(self.errors),
+        }
+
+    def _merge(self, other: "ValidationReport") -> None:
+        for name, violations in other.violations.items():
+            self.violations.setdefault(name, []).extend(violations)
+        self.errors.update(other.errors)
+        self.checked += other.checked
+
+
+def _mode_color(value: Any, index: int) -> Any:
+    """Get the color of a (light, dark) pair shown in an appearance mode, or a single color"""
+    if isinstance(value, (tuple, list)):
+        return value[index] if len(value) == 2 else None
+    return value
+
+
+def _is_color(value: Any) -> bool:
+    if not isinstance(value, str):
+        return False
+    try:
+        parse_color(value)
+    except ValueError:
+        # Named colors and "transparent" are not checked
+        return False
+    return True
+
+
+def _validate(themes: Iterable[Tuple[str, Mapping[str, Any], Optional[str]]],
+              min_ratio: float) -> ValidationReport:
+    """Validate flattened themes, computing the contrast ratios of all of them in one batch"""
+    report = ValidationReport(min_ratio)
+    pairs = []
+    foregrounds = []
+    backgrounds = []
+    for theme_name, theme, source in themes:
+        report.violations.setdefault(theme_name, [])
+        index = 0 if theme.get("appearance_mode", "dark") == "light" else 1
+        for widget_key, rules in CONTRAST_RULES.items():
+            props = theme.get(widget_key)
+            if not isinstance(props, dict):
+                continue
+            for foreground_prop, background_key, background_prop in rules:
+                background_props = theme.get(background_key)
+                if foreground_prop not in props or not isinstance(background_props, dict):
+                    continue
+                foreground = _mode_color(props[foreground_prop], index)
+                background = _mode_color(background_props.get(background_prop), index)
+                if not _is_color(foreground) or not _is_color(background):
+                    continue
+                pairs.append((theme_name, widget_key, foreground_prop, background_key, background_prop, source))
+                foregrounds.append(foreground)
+                backgrounds.append(background)
+
+    report.checked = len(pairs)
+    if not pairs:
+        return report
+    ratios = contrast_ratios(foregrounds, backgrounds)
+    for pair, foreground, background, ratio in zip(pairs, foregrounds, backgrounds, ratios):
+        # Compare with a small tolerance, so rounding never fails exactly 4.5:1 pairs
+        if ratio < min_ratio - 1e-9:
+            theme_name, widget_key, foreground_prop, background_key, background_prop, source = pair
+            report.violations[theme_name].append(ContrastViolation(
+                theme_name, widget_key, foreground_prop, background_key, background_prop,
+                foreground, background, float(ratio), source
+            ))
+    return report
+
+
+def validate_themes(themes: Optional[Mapping[str, Mapping[str, Any]]] = None,
+                    min_ratio: float = DEFAULT_MIN_RATIO) -> ValidationReport:
+    """
+    Validate the contrast of the text colors of themes.
+
+    Args:
+        themes: Theme name -> theme configuration (default: all themes in THEMES). Themes
+            that extend another theme are flattened first.
+        min_ratio: The contrast ratio text colors must reach (default: WCAG AA, 4.5)
+
+    Returns:
+        The validation report
+    """
+    if themes is None:
+        themes = {name: get_theme(name) for name in THEMES}
+
+    report = ValidationReport(min_ratio)
+    flattened = []
+    for theme_name, theme in themes.items():
+        try:
+            flattened.append((theme_name, _flatten(theme_name, theme, get_theme), None))
+        except ValueError as e:
+            report.errors[theme_name] = str(e)
+    report._merge(_validate(flattened, min_ratio))
+    return report
+
+
+def _flatten(theme_name: str, theme: Mapping[str, Any], lookup, extending: Tuple[str, ...] = ()) -> Mapping[str, Any]:
+    """Flatten a theme that extends another theme, finding its ancestors with lookup(name)"""
+    parent_name = theme.get("extends")
+    if parent_name is None:
+        return theme
+    if not isinstance(parent_name, str):
+        raise ValueError(f"Invalid theme: {theme_name}. 'extends' must be a theme name")
+    parent_name = parent_name.lower()
+    extending += (theme_name,)
+    if parent_name in extending:
+        raise ValueError(f"Invalid theme: {theme_name}. Circular theme inheritance: {' -> '.join(extending + (parent_name,))}")
+    try:
+        parent = lookup(parent_name)
+    except ValueError:
+        raise ValueError(f"Invalid theme: {theme_name}. It extends unknown theme {parent_name}") from None
+    return extend_theme(_flatten(parent_name, parent, lookup, extending), theme)
+
+
+def _read_theme_file(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as file:
+        try:
+            theme = json.load(file)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON: {e}") from None
+    if not isinstance(theme, dict):
+        raise ValueError("A theme file must contain a JSON object")
+    return theme
+
+
+def _validate_task(task: Tuple[str, str, List[str]], min_ratio: float) -> ValidationReport:
+    """
+    Validate part of the theme sources; runs in a worker process.
+
+    A task is ("files", directory, file paths) or ("pack", pack path, theme names).
+    Parents of themes that extend another theme are looked up in the same directory
+    or pack, then in the available themes.
+    """
+    from .theme_pack import ThemePack
+
+    kind, location, items = task
+    report = ValidationReport(min_ratio)
+    themes = []
+
+    if kind == "pack":
+        with ThemePack(location) as pack:
+            def lookup(name):
+                return pack.load(name) if name in pack else get_theme(name)
+            for theme_name in items:
+                try:
+                    themes.append((theme_name, _flatten(theme_name, pack.load(theme_name), lookup), location))
+                except ValueError as e:
+                    report.errors[f"{location}:{theme_name}"] = str(e)
+            report._merge(_validate(themes, min_ratio))
+        return report
+
+    def lookup(name):
+        sibling = os.path.join(location, name + THEME_FILE_EXTENSION)
+        if os.path.isfile(sibling):
+            try:
+                return _read_theme_file(sibling)
+            except OSError as e:
+                raise ValueError(str(e)) from None
+        return get_theme(name)
+
+    for path in items:
+        theme_name = os.path.splitext(os.path.basename(path))[0].lower()
+        try:
+            themes.append((theme_name, _flatten(theme_name, _read_theme_file(path), lookup), path))
+        except (OSError, ValueError) as e:
+            report.errors[path] = str(e)
+    report._merge(_validate(themes, min_ratio))
+    return report
+
+
+def _make_tasks(sources: Iterable[str]) -> List[Tuple[str, str, List[str]]]:
+    """Split theme files, directories and theme packs into worker tasks"""
+    from .theme_pack import ThemePack, THEME_PACK_EXTENSION
+
+    files_by_directory: Dict[str, List[str]] = {}
+    tasks = []
+    for source in sources:
+        source = os.path.abspath(os.path.expanduser(source))
+        if os.path.isdir(source):
+            for name in sorted(os.listdir(source)):
+                if name.lower().endswith(THEME_FILE_EXTENSION):
+                    files_by_directory.setdefault(source, []).append(os.path.join(source, name))
+                elif name.lower().endswith(THEME_PACK_EXTENSION):
+                    tasks.extend(_pack_tasks(ThemePack, os.path.join(source, name)))
+        elif source.lower().endswith(THEME_PACK_EXTENSION):
+            tasks.extend(_pack_tasks(ThemePack, source))
+        else:
+            files_by_directory.setdefault(os.path.dirname(source), []).append(source)
+
+    for directory, paths in files_by_directory.items():
+        for start in range(0, len(paths), _CHUNK_SIZE):
+            tasks.append(("files", directory, paths[start:start + _CHUNK_SIZE]))
+    return tasks
+
+
+def _pack_tasks(pack_class, path: str) -> List[Tuple[str, str, List[str]]]:
+    with pack_class(path) as pack:
+        names = pack.names()
+    return [("pack", path, names[start:start + _CHUNK_SIZE]) for start in range(0, len(names), _CHUNK_SIZE)]
+
+
+def validate_theme_files(sources: Iterable[str],
+                         min_ratio: float = DEFAULT_MIN_RATIO,
+                         max_workers: Optional[int] = None) -> ValidationReport:
+    """
+    Validate the contrast of the themes in theme files and theme packs.
+
+    Sources are split into tasks of up to 64 themes, which run in a process pool when
+    there is more than one and more than one CPU.
+
+    Args:
+        sources: JSON theme files, theme packs, or directories containing them
+        min_ratio: The contrast ratio text colors must reach (default: WCAG AA, 4.5)
+        max_workers: The number of worker processes (default: the number of CPUs); 1
+            validates in the calling process
+
+    Returns:
+        The validation report
+
+    Raises:
+        ValueError: If a theme pack is invalid
+    """
+    tasks = _make_tasks(sources)
+    report = ValidationReport(min_ratio)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if len(tasks) <= 1 or max_workers <= 1:
+        for task in tasks:
+            report._merge(_validate_task(task, min_ratio))
+        return report
+
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+        for result in executor.map(_validate_task, tasks, [min_ratio] * len(tasks)):
+            report._merge(result)
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m CTkBootstrap.theme_validator",
+        description="Check the WCAG contrast of the text colors of CTkBootstrap themes"
+    )
+    parser.add_argument("sources", nargs="*",
+                        help="JSON theme files, theme packs or directories (default: the built-in themes)")
+    parser.add_argument("--min-ratio", type=float, default=DEFAULT_MIN_RATIO,
+                        help=f"The minimum contrast ratio (default: {DEFAULT_MIN_RATIO}, WCAG AA)")
+    parser.add_argument("--workers", type=int, default=None, help="The number of worker processes")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.sources:
+            report = validate_theme_files(args.sources, args.min_ratio, args.workers)
+        else:
+            report = validate_themes(min_ratio=args.min_ratio)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps(report.as_dict(), indent=2))
+    else:
+        for theme_name, violations in report.violations.items():
+            for widget_key, key_violations in report.by_widget_key(theme_name).items():
+                for violation in key_violations:
+                    print(f"{theme_name}: {widget_key}.{violation.foreground_prop} {violation.foreground} on "
+                          f"{violation.background_key}.{violation.background_prop} {violation.background}: "
+                          f"{violation.ratio:.2f} < {args.min_ratio}")
+        for source, error in report.errors.items():
+            print(f"{source}: {error}")
+        failed = sum(1 for violations in report.violations.values() if violations)
+        print(f"Checked {report.checked} color pairs in {len(report.violations)} themes: "
+              f"{failed} themes with violations, {len(report.errors)} errors")
+    return 0 if report.passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
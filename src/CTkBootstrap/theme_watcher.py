@@ -0,0 +1,168 @@
+"""
+Hot reloading of theme files for CTkBootstrap.
+
+ThemeWatcher polls the theme search paths from the Tk event loop with after(), so it
+needs no extra threads or dependencies. A poll only compares modification times and
+sizes; a changed file is parsed again by the theme loader. When the theme in use by the
+ThemeManager, or a theme it extends, changed, it is re-applied to the watched windows,
+and only the properties whose values changed are reconfigured.
+
+Example:
+    manager = ThemeManager("acme-dark")
+    manager.apply_theme_to_all_widgets(root)
+    watcher = watch_themes(root, manager)
+    ...
+    watcher.stop()
+"""
+
+import weakref
+import tkinter as tk
+from typing import Any, Callable, List, Optional
+from . import theme_loader
+from .themes import THEMES, theme_ancestors
+from .theme_manager import ThemeManager, get_theme_manager
+from .theme_transactions import theme_transaction
+
+
+class ThemeWatcher:
+    """
+    Polls the theme search paths and re-applies the active theme when its file changes.
+    """
+
+    def __init__(self,
+                 root: tk.Misc,
+                 manager: Optional[ThemeManager] = None,
+                 interval_ms: int = 250,
+                 on_change: Optional[Callable[[List[str]], None]] = None):
+        """
+        Initialize a theme watcher. Call start() to begin polling.
+
+        Args:
+            root: A window whose after() scheduling is used; it is also watched
+            manager: The theme manager whose theme is re-applied (default: the global manager)
+            interval_ms: The time between two polls, in milliseconds
+            on_change: Called after each poll that found changes, with the names of the
+                added, modified or removed themes
+        """
+        if interval_ms <= 0:
+            raise ValueError(f"interval_ms must be positive, got {interval_ms}")
+
+        self._root = root
+        self._manager = manager if manager is not None else get_theme_manager()
+        self._interval = int(interval_ms)
+        self._on_change = on_change
+        self._windows = weakref.WeakSet()
+        self._windows.add(root)
+        self._after_id = None
+
+    @property
+    def manager(self) -> ThemeManager:
+        """The theme manager whose theme is re-applied"""
+        return self._manager
+
+    @property
+    def running(self) -> bool:
+        """Whether the watcher is polling"""
+        return self._after_id is not None
+
+    def watch(self, window: tk.Misc) -> None:
+        """
+        Re-apply the theme to another window (e.g. a CTkToplevel) when it changes.
+
+        Args:
+            window: The window or frame to keep themed
+        """
+        self._windows.add(window)
+
+    def unwatch(self, window: tk.Misc) -> None:
+        """
+        Stop re-applying the theme to a window.
+
+        Args:
+            window: A window passed to watch()
+        """
+        self._windows.discard(window)
+
+    def start(self) -> "ThemeWatcher":
+        """
+        Start polling.
+
+        Returns:
+            The watcher, for chaining
+        """
+        if self._after_id is None:
+            self._after_id = self._root.after(self._interval, self._tick)
+        return self
+
+    def stop(self) -> None:
+        """Stop polling"""
+        if self._after_id is not None:
+            try:
+                self._root.after_cancel(self._after_id)
+            except tk.TclError:
+                # The root window has been destroyed
+                pass
+            self._after_id = None
+
+    def poll(self) -> List[str]:
+        """
+        Check the theme files once and re-apply the active theme if it changed.
+
+        Returns:
+            The names of the themes that were added, modified or removed
+        """
+        changed = theme_loader.poll_changes()
+        if not changed:
+            return changed
+
+        theme_name = self._manager.theme_name
+        # A removed theme file leaves the theme in use as it is. A theme also changes
+        # with the themes it extends.
+        affected = theme_name in changed or any(name in changed for name in theme_ancestors(theme_name))
+        if affected and theme_name in THEMES:
+            # One redraw pass for a changed appearance mode and the changed properties
+            with theme_transaction(self._root):
+                self._manager.change_theme(theme_name)
+                for window in list(self._windows):
+                    if _exists(window):
+                        self._manager.apply_theme_to_all_widgets(window)
+
+        if self._on_change is not None:
+            self._on_change(changed)
+        return changed
+
+    def _tick(self) -> None:
+        self._after_id = None
+        if not _exists(self._root):
+            return
+        try:
+            self.poll()
+        finally:
+            if _exists(self._root):
+                self._after_id = self._root.after(self._interval, self._tick)
+
+
+def _exists(widget: Any) -> bool:
+    try:
+        return bool(widget.winfo_exists())
+    except tk.TclError:
+        return False
+
+
+def watch_themes(root: tk.Misc,
+                 manager: Optional[ThemeManager] = None,
+                 interval_ms: int = 250,
+                 on_change: Optional[Callable[[List[str]], None]] = None) -> ThemeWatcher:
+    """
+    Start hot reloading the theme files in the theme search paths.
+
+    Args:
+        root: The window to keep themed; its after() scheduling is used for polling
+        manager: The theme manager whose theme is re-applied (default: the global manager)
+        interval_ms: The time between two polls, in milliseconds
+        on_change: Called with the names of the changed themes after each poll that found changes
+
+    Returns:
+        The running ThemeWatcher; call stop() to stop it
+    """
+    return ThemeWatcher(root, manager, interval_ms, on_change).start()
@@ -0,0 +1,394 @@
+"""
+Themed CustomTkinter window and widgets for CTkBootstrap.
+
+CTk is a CustomTkinter window that applies CTkBootstrap themes to itself and its
+widgets; the widget classes pick up the theme of their window when they are created.
+"""
+
+from typing import Optional, Literal, Dict, Any, Callable, Iterator
+import tkinter as tk
+import customtkinter as ctk
+
+from .themes import THEMES, get_theme
+from .widget_theme_mapper import (
+    apply_theme_to_widget,
+    apply_theme_to_tree,
+    iter_theme_tree,
+    iter_theme_registry
+)
+from .style_plans import get_style_plan
+from .theme_transitions import get_transition_plan
+from .widget_registry import WidgetRegistry
+from .theme_scheduler import IncrementalThemeApplication
+from .theme_transactions import theme_transaction
+from .deferred_theming import DeferredTheming
+from .appearance import set_color_theme
+from .ttk_themes import use_ttk_theme
+
+
+class CTk(ctk.CTk):
+    """
+    A wrapper around the CTk class that adds theme support.
+    """
+    
+    def __init__(
+        self,
+        style: Optional[str] = None,
+        fg_color: Optional[str | tuple[str, str]] = None,
+        track_widgets: bool = False,
+        **kwargs
+    ):
+        """
+        Initialize a themed CTk window.
+        
+        Args:
+            style: The name of the theme to apply ("solar", "darkly", "cyborg", "vapor", "monodim", "normal", "aurium")
+            fg_color: The background color of the window (overrides theme if provided)
+            track_widgets: Keep a registry of the window's widgets so themes are applied
+                without walking the widget tree (see widget_registry)
+            **kwargs: Additional arguments to pass to CTk
+        """
+        self._init_theme_state(track_widgets)
+        
+        # Initialize the base CTk window
+        super().__init__(fg_color=fg_color, **kwargs)
+        
+        # Widgets created with plain CustomTkinter classes do not register themselves,
+        # so the registry picks them up when they are first mapped
+        if self._widget_registry is not None:
+            tk.Misc.bind(self, "<Map>", self._register_mapped_widget, add="+")
+        
+        # Apply the theme if provided
+        if style:
+            self.apply_theme(style)
+    
+    def _init_theme_state(self, track_widgets: bool) -> None:
+        """Initialize the theme bookkeeping; runs before the Tk window exists"""
+        # Store the current theme name
+        self._current_theme = None
+        
+        # Optional registry of themed widgets
+        self._widget_registry = WidgetRegistry() if track_widgets else None
+        
+        # Incremental theme switch in progress, if any
+        self._theme_application = None
+        
+        # Subtrees waiting for their first <Map> to be themed, created on first use
+        self._deferred_theming = None
+    
+    def apply_theme(
+        self,
+        theme_name: str,
+        full: bool = False,
+        mode: Literal["immediate", "incremental"] = "immediate",
+        budget_ms: float = 8.0,
+        on_progress: Optional[Callable[[int, Optional[int]], None]] = None,
+        on_complete: Optional[Callable[[int], None]] = None,
+        defer_hidden: bool = False
+    ) -> Optional[IncrementalThemeApplication]:
+        """
+        Apply a predefined theme to the CTk window.
+        
+        When switching from another theme, only the widget properties whose values
+        differ between the two themes are reconfigured.
+        
+        Args:
+            theme_name: The name of the theme to apply
+            full: Reconfigure every theme property, e.g. after widgets were added
+                or restyled outside of the theme
+            mode: "immediate" themes all widgets before returning. "incremental" themes
+                them in slices scheduled on the Tk event loop, so the window stays
+                responsive while a large widget tree is switched. A switch that changes
+                the appearance mode redraws every widget of the process, which no slice
+                budget can hold, so it is applied in a single pass before returning.
+            budget_ms: In incremental mode, the time each slice may take, in milliseconds
+            on_progress: In incremental mode, called after each slice with
+                (widgets themed so far, total widgets or None if unknown)
+            on_complete: Called with the number of widgets themed once the theme is fully applied
+            defer_hidden: Only theme widgets that are currently mapped. Unmapped subtrees,
+                such as hidden tabs and withdrawn toplevels, are themed when they are
+                first mapped (see deferred_theming).
+            
+        Returns:
+            In incremental mode, the IncrementalThemeApplication driving the switch
+            (already done if the appearance mode changed); otherwise None
+        """
+        if mode not in ("immediate", "incremental"):
+            raise ValueError(f"Invalid mode: {mode}. Valid modes are: immediate, incremental")
+        
+        theme_name = theme_name.lower()
+        
+        # Get the theme configuration, loading it from a theme pack on first use
+        theme = get_theme(theme_name)
+        
+        # A newer switch supersedes one that is still in progress. Widgets it did not
+        # reach still carry older colors, so the new theme must be applied in full.
+        if self._theme_application is not None:
+            self._theme_application.cancel()
+            self._theme_application = None
+            full = True
+        
+        # Subtrees deferred by an earlier switch still carry an older theme, so a
+        # switch that does not defer them again has to theme them in full
+        defer = None
+        if defer_hidden:
+            if self._deferred_theming is None:
+                self._deferred_theming = DeferredTheming(self, self._apply_deferred_theme)
+            self._deferred_theming.begin_switch()
+        elif self._deferred_theming is not None and self._deferred_theming.pending_count:
+            self._deferred_theming.clear()
+            full = True
+        
+        # Store the current theme name
+        previous_theme = self._current_theme
+        self._current_theme = theme_name
+        
+        # Only send the properties that change when switching between themes
+        if previous_theme is not None and previous_theme != theme_name and not full:
+            plan = get_transition_plan(previous_theme, theme_name)
+        else:
+            plan = get_style_plan(theme_name)
+        
+        # Apply theme to the window and existing widgets, one configure() per widget.
+        # The "window" properties are part of the compiled style plan.
+        total = None
+        if self._widget_registry is not None:
+            # Widgets created with plain CustomTkinter classes are picked up by a
+            # full scan on the first application and whenever full=True is passed,
+            # and afterwards when they are first mapped (see _register_mapped_widget)
+            if previous_theme is None or full:
+                self._widget_registry.register_tree(self)
+            if defer_hidden:
+                defer = self._deferred_theming.hidden_ancestor_deferrer()
+            else:
+                total = len(self._widget_registry)
+            steps = iter_theme_registry(self._widget_registry, theme_name, theme, plan=plan, defer=defer)
+        else:
+            if defer_hidden:
+                defer = self._deferred_theming.defer_if_unmapped
+            steps = iter_theme_tree(self, theme_name, theme, plan=plan, defer=defer)
+        
+        if mode == "incremental":
+            # The appearance, color theme and ttk theme are set by the first slice
+            application = IncrementalThemeApplication(
+                self, self._iter_with_appearance(theme, steps), budget_ms=budget_ms, total=total,
+                on_progress=on_progress, on_complete=self._on_theme_applied(on_complete)
+            )
+            if theme["appearance_mode"].lower() != ctk.get_appearance_mode().lower():
+                # A new appearance mode redraws every widget; one transaction redraws
+                # each of them once, where slices would redraw them again later
+                application.run_to_completion()
+                return application
+            self._theme_application = application
+            return application.start()
+        
+        # Coalesce the redraws caused by the appearance mode and by the new widget
+        # properties, so every widget is redrawn once when the transaction ends
+        with theme_transaction(self):
+            self._apply_appearance(theme)
+            visited = 0
+            for _ in steps:
+                visited += 1
+        if on_complete is not None:
+            on_complete(visited)
+        return None
+    
+    def _iter_with_appearance(self, theme: Dict[str, Any], steps: Iterator[Any]) -> Iterator[Any]:
+        """Apply the appearance of a theme when the first step is taken, then take the steps"""
+        self._apply_appearance(theme)
+        yield from steps
+    
+    def _apply_appearance(self, theme: Dict[str, Any]) -> None:
+        """Set the global appearance mode, default color theme and ttk theme of a theme"""
+        # Set the appearance mode (light or dark); CustomTkinter only redraws if it
+        # changes, and those redraws are folded into the caller's theme transaction
+        ctk.set_appearance_mode(theme["appearance_mode"])
+        
+        # Set the default color theme; loading it reads a file, so only if it changes
+        set_color_theme(theme.get("color_theme", "blue"))
+        
+        # Switch to the prebuilt ttk theme; Tk restyles all ttk widgets itself
+        use_ttk_theme(self, self._current_theme, theme)
+    
+    def _apply_deferred_theme(self, widget) -> None:
+        """Theme a deferred subtree with the current theme when it is first mapped"""
+        if self._current_theme is None:
+            return
+        
+        # The subtree missed one or more switches, so it needs the full style plan
+        theme_name = self._current_theme
+        with theme_transaction(self):
+            apply_theme_to_tree(
+                widget, theme_name, get_theme(theme_name),
+                plan=get_style_plan(theme_name),
+                defer=self._deferred_theming.defer_if_unmapped
+            )
+    
+    def _register_mapped_widget(self, event) -> None:
+        """Register and theme a widget the registry does not know yet when it is mapped"""
+        widget = event.widget
+        registry = self._widget_registry
+        if isinstance(widget, str) or widget is self or widget in registry:
+            return
+        # The internal widgets of CustomTkinter widgets are themed through their owner
+        if isinstance(getattr(widget, "master", None), ctk.CTkBaseClass) and not isinstance(
+            widget, (ctk.CTkBaseClass, ctk.CTkScrollableFrame)
+        ):
+            return
+        
+        registry.register_tree(widget)
+        if self._current_theme is None:
+            return
+        theme_name = self._current_theme
+        with theme_transaction(self):
+            apply_theme_to_tree(widget, theme_name, get_theme(theme_name), plan=get_style_plan(theme_name))
+    
+    def _on_theme_applied(self, on_complete: Optional[Callable[[int], None]]) -> Callable[[int], None]:
+        """Wrap a completion callback so the finished incremental switch is released"""
+        def callback(visited: int) -> None:
+            self._theme_application = None
+            if on_complete is not None:
+                on_complete(visited)
+        return callback
+    
+    @property
+    def widget_registry(self) -> Optional[WidgetRegistry]:
+        """The registry of the window's widgets, or None if the window does not track widgets"""
+        return self._widget_registry
+    
+    def register_widget(self, widget):
+        """
+        Track a widget in the window's registry so theme changes reach it.
+        
+        The themed widget classes of this package register themselves automatically.
+        
+        Args:
+            widget: The widget to track
+            
+        Returns:
+            The widget
+        """
+        if self._widget_registry is not None:
+            self._widget_registry.register(widget)
+        return widget
+    
+    def get_current_theme(self) -> Optional[str]:
+        """
+        Get the name of the currently applied theme.
+        
+        Returns:
+            The name of the currently applied theme, or None if no theme has been applied
+        """
+        return self._current_theme
+    
+    def apply_theme_to_widget(self, widget, widget_props=None):
+        """
+        Apply the current theme to a specific widget.
+        
+        Args:
+            widget: The widget to apply the theme to
+            widget_props: Optional override for widget properties
+        """
+        if self._current_theme is None:
+            return
+        
+        theme = get_theme(self._current_theme)
+        widget_type = type(widget).__name__.lower()
+        
+        # Get specific properties for this widget type, or use the widget_props if provided
+        if widget_props is None:
+            widget_props = theme.get(widget_type, {})
+        
+        apply_theme_to_widget(widget, self._current_theme, widget_props)
+
+
+def _register_with_window(widget) -> None:
+    """Add a widget to the registry of the first master that tracks widgets, if any"""
+    master = widget.master
+    while master is not None:
+        registry = getattr(master, "widget_registry", None)
+        if registry is not None:
+            registry.register(widget)
+            return
+        master = getattr(master, "master", None)
+
+
+# Enhanced versions of CustomTkinter widgets with theme support
+
+class CTkButton(ctk.CTkButton):
+    """Themed version of CTkButton."""
+    
+    def __init__(self, master=None, **kwargs):
+        super().__init__(master, **kwargs)
+        _register_with_window(self)
+        
+        # Apply theme if master has a theme applied
+        if hasattr(master, "get_current_theme") and master.get_current_theme():
+            theme_name = master.get_current_theme()
+            if theme_name and theme_name in THEMES:
+                theme = get_theme(theme_name)
+                if "button" in theme:
+                    button_props = theme["button"]
+                    for prop, value in button_props.items():
+                        if hasattr(self, prop):
+                            setattr(self, prop, value)
+
+
+class CTkFrame(ctk.CTkFrame):
+    """Themed version of CTkFrame."""
+    
+    def __init__(self, master=None, **kwargs):
+        super().__init__(master, **kwargs)
+        _register_with_window(self)
+        
+        # Apply theme if master has a theme applied
+        if hasattr(master, "get_current_theme") and master.get_current_theme():
+            theme_name = master.get_current_theme()
+            if theme_name and theme_name in THEMES:
+                theme = get_theme(theme_name)
+                if "frame" in theme:
+                    frame_props = theme["frame"]
+                    for prop, value in frame_props.items():
+                        if hasattr(self, prop):
+                            setattr(self, prop, value)
+
+
+class CTkLabel(ctk.CTkLabel):
+    """Themed version of CTkLabel."""
+    
+    def __init__(self, master=None, **kwargs):
+        super().__init__(master, **kwargs)
+        _register_with_window(self)
+        
+        # Apply theme if master has a theme applied
+        if hasattr(master, "get_current_theme") and master.get_current_theme():
+            theme_name = master.get_current_theme()
+            if theme_name and theme_name in THEMES:
+                theme = get_theme(theme_name)
+                if "label" in theme:
+                    label_props = theme["label"]
+                    for prop, value in label_props.items():
+                        if hasattr(self, prop):
+                            setattr(self, prop, value)
+
+
+class CTkEntry(ctk.CTkEntry):
+    """Themed version of CTkEntry."""
+    
+    def __init__(self, master=None, **kwargs):
+        super().__init__(master, **kwargs)
+        _register_with_window(self)
+        
+        # Apply theme if master has a theme applied
+        if hasattr(master, "get_current_theme") and master.get_current_theme():
+            theme_name = master.get_current_theme()
+            if theme_name and theme_name in THEMES:
+                theme = get_theme(theme_name)
+                if "entry" in theme:
+                    entry_props = theme["entry"]
+                    for prop, value in entry_props.items():
+                        if hasattr(self, prop):
+                            setattr(self, prop, value)
+
+
+# Add more themed widgets as needed...
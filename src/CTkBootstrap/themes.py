@@ -5,6 +5,8 @@ This module contains predefined theme configurations for the CTkBootstrap packag
 Each theme defines colors, appearance modes, and other UI properties.
 """
 
+from .colors import intern_theme, intern_props, intern_color_value, is_color_property
+
 # Theme definitions for CTkBootstrap
 THEMES = {
     # Solar theme - A dark theme with accent colors inspired by the sun
@@ -920,6 +922,195 @@ THEMES = {
     }
 }
 
+# Built-in themes share one Color object per distinct color
+for _theme in THEMES.values():
+    intern_theme(_theme)
+del _theme
+
+# Sources of themes that are only loaded into THEMES when first used, such as theme
+# packs. A provider supports "name in provider", names() and load(name); later
+# providers take precedence.
+_theme_providers = []
+
+def add_theme_provider(provider) -> None:
+    """
+    Make the themes of a provider available without loading them.
+    
+    Args:
+        provider: An object supporting "name in provider", names() and load(name)
+    """
+    if provider not in _theme_providers:
+        _theme_providers.append(provider)
+
+def remove_theme_provider(provider) -> None:
+    """
+    Stop offering the themes of a provider. Themes already loaded stay in THEMES.
+    
+    Args:
+        provider: A provider passed to add_theme_provider()
+    """
+    if provider in _theme_providers:
+        _theme_providers.remove(provider)
+
+def theme_names() -> list:
+    """
+    Get the names of all available themes, including themes not loaded yet.
+    
+    Returns:
+        The theme names in THEMES, followed by the names only offered by providers
+    """
+    names = list(THEMES)
+    if _theme_providers:
+        seen = set(names)
+        for provider in _theme_providers:
+            for name in provider.names():
+                if name not in seen:
+                    seen.add(name)
+                    names.append(name)
+    return names
+
+def _get_theme_source(theme_name: str) -> dict:
+    """Get a theme as defined in THEMES, loading it from a theme provider on first use"""
+    theme = THEMES.get(theme_name)
+    if theme is not None:
+        return theme
+    
+    for provider in reversed(_theme_providers):
+        if theme_name in provider:
+            theme = THEMES[theme_name] = provider.load(theme_name)
+            return theme
+    
+    valid_themes = ", ".join(theme_names())
+    raise ValueError(f"Invalid theme: {theme_name}. Valid themes are: {valid_themes}")
+
+def get_theme(theme_name: str) -> dict:
+    """
+    Get a theme configuration, loading it from a theme provider on first use.
+    
+    A theme that extends another theme (see extend_theme()) is returned flattened.
+    
+    Args:
+        theme_name: The lowercase name of the theme
+        
+    Returns:
+        The theme configuration, as stored in THEMES or flattened
+    """
+    theme = _get_theme_source(theme_name)
+    if "extends" in theme:
+        return _get_flattened_theme(theme_name, theme, ())
+    return theme
+
+# Theme name -> (theme as defined, flattened parent, flattened theme) of the themes that
+# extend another theme. A theme is flattened again when it or any of its ancestors is
+# replaced in THEMES (e.g. by reloading its theme file).
+_flattened_themes = {}
+
+def _get_flattened_theme(theme_name: str, source: dict, extending: tuple) -> dict:
+    """Flatten a theme that extends another theme, memoized per theme and parent version"""
+    parent_name = source["extends"]
+    if not isinstance(parent_name, str):
+        raise ValueError(f"Invalid theme: {theme_name}. 'extends' must be a theme name")
+    parent_name = parent_name.lower()
+    extending += (theme_name,)
+    if parent_name in extending:
+        cycle = " -> ".join(extending + (parent_name,))
+        raise ValueError(f"Invalid theme: {theme_name}. Circular theme inheritance: {cycle}")
+    
+    try:
+        parent = _get_theme_source(parent_name)
+    except ValueError:
+        raise ValueError(f"Invalid theme: {theme_name}. It extends unknown theme {parent_name}") from None
+    if "extends" in parent:
+        parent = _get_flattened_theme(parent_name, parent, extending)
+    
+    cached = _flattened_themes.get(theme_name)
+    if cached is not None and cached[0] is source and cached[1] is parent:
+        return cached[2]
+    theme = extend_theme(parent, source)
+    _flattened_themes[theme_name] = (source, parent, theme)
+    return theme
+
+def extend_theme(parent: dict, overrides: dict) -> dict:
+    """
+    Create a theme from a parent theme and the keys that differ from it.
+    
+    Themes in THEMES and theme files declare their parent with "extends", e.g.
+    {"extends": "darkly", "colors": {"primary": "#6F42C1"}}. Widget entries and the
+    palette are merged property by property, other keys are replaced. Inherited colors
+    equal to a palette color the overrides redefine follow the new palette color, so
+    changing "primary" also changes every inherited property derived from it.
+    
+    Args:
+        parent: The flattened parent theme
+        overrides: The keys that differ from the parent; an "extends" key is ignored
+        
+    Returns:
+        A new, normalized theme. Values the two themes share are not copied.
+    """
+    parent_palette = parent.get("colors", {})
+    palette = overrides.get("colors", {})
+    
+    # Parent palette colors redefined by the overrides; a parent color used by several
+    # palette entries that now differ is ambiguous and left as it is
+    replacements = {}
+    for color_name, value in palette.items():
+        previous = parent_palette.get(color_name)
+        if previous is not None:
+            replacements.setdefault(intern_color_value(previous), set()).add(intern_color_value(value))
+    replacements = {
+        previous: next(iter(values)) for previous, values in replacements.items()
+        if len(values) == 1 and previous not in values
+    }
+    
+    theme = {}
+    for key, value in parent.items():
+        if replacements and key != "colors" and isinstance(value, dict):
+            value = {
+                prop: _replace_colors(prop_value, replacements) if is_color_property(prop) else prop_value
+                for prop, prop_value in value.items()
+            }
+        theme[key] = value
+    
+    for key, value in overrides.items():
+        if key == "extends":
+            continue
+        inherited = theme.get(key)
+        if isinstance(value, dict) and isinstance(inherited, dict):
+            value = {**inherited, **value}
+        theme[key] = value
+    
+    normalize_theme(theme)
+    return theme
+
+def _replace_colors(value, replacements: dict):
+    """Replace the colors of a property value, including both colors of a (light, dark) pair"""
+    if isinstance(value, str):
+        return replacements.get(value, value)
+    if isinstance(value, (tuple, list)):
+        return type(value)(replacements.get(item, item) if isinstance(item, str) else item for item in value)
+    return value
+
+def theme_ancestors(theme_name: str) -> list:
+    """
+    Get the themes a theme inherits from.
+    
+    Args:
+        theme_name: The lowercase name of the theme
+        
+    Returns:
+        The names of its parent, its parent's parent and so on; empty for themes that
+        do not extend another theme or are not loaded
+    """
+    ancestors = []
+    theme = THEMES.get(theme_name)
+    while theme is not None and isinstance(theme.get("extends"), str):
+        parent_name = theme["extends"].lower()
+        if parent_name == theme_name or parent_name in ancestors:
+            break
+        ancestors.append(parent_name)
+        theme = THEMES.get(parent_name)
+    return ancestors
+
 def get_theme_colors(theme_name: str) -> dict:
     """
     Get the colors for a specific theme.
@@ -931,26 +1122,67 @@ def get_theme_colors(theme_name: str) -> dict:
         A dictionary of color definitions
     """
     theme_name = theme_name.lower()
-    if theme_name not in THEMES:
-        raise ValueError(f"Theme {theme_name} not found")
+    try:
+        theme = get_theme(theme_name)
+    except ValueError:
+        raise ValueError(f"Theme {theme_name} not found") from None
     
-    return THEMES[theme_name].get("colors", {})
+    return theme.get("colors", {})
+
+# File extension of theme files (see theme_loader and theme_pack)
+THEME_FILE_EXTENSION = ".json"
 
-# Check the first few themes to see what entries exist for ctktext
-sample_themes = list(THEMES.keys())[:3]
-for theme_name in sample_themes:
-    theme = THEMES[theme_name]
-    print(f"Theme '{theme_name}' structure:")
-    if "ctktext" in theme:
-        print(f"  ctktext exists with properties: {theme['ctktext']}")
-    elif "ctktextbox" in theme:
-        print(f"  ctktextbox exists with properties: {theme['ctktextbox']}")
-    else:
-        print("  No ctktext or ctktextbox entry found!")
+def _freeze_lists(value):
+    """Turn JSON arrays into tuples, like the (light, dark) colors of the built-in themes"""
+    if isinstance(value, list):
+        return tuple(_freeze_lists(item) for item in value)
+    if isinstance(value, dict):
+        return {key: _freeze_lists(item) for key, item in value.items()}
+    return value
+
+# Theme name -> theme dict that has been normalized, so each theme is only normalized once
+_normalized_themes = {}
+
+def normalize_themes(verbose: bool = False) -> None:
+    """
+    Make sure every theme defines the text color of its text widgets.
+    
+    Themes without a 'ctktext' entry get one, taken from 'ctktextbox' or 'ctkentry'
+    when they define it. Each theme is only normalized once; themes added to or
+    replaced in THEMES are normalized on the next call.
+    
+    Args:
+        verbose: Print which text widget entry each theme defines before normalizing it
+    """
+    for theme_name, theme in THEMES.items():
+        if _normalized_themes.get(theme_name) is theme:
+            continue
         
-# Now add or ensure that text_color is defined for each theme's text widgets
-for theme_name in THEMES:
-    theme = THEMES[theme_name]
+        if verbose:
+            print(f"Theme '{theme_name}' structure:")
+            if "ctktext" in theme:
+                print(f"  ctktext exists with properties: {theme['ctktext']}")
+            elif "ctktextbox" in theme:
+                print(f"  ctktextbox exists with properties: {theme['ctktextbox']}")
+            else:
+                print("  No ctktext or ctktextbox entry found!")
+        
+        normalize_theme(theme)
+        
+        _normalized_themes[theme_name] = theme
+
+def normalize_theme(theme: dict) -> None:
+    """
+    Make sure a theme defines the text color of its text widgets, adding a 'ctktext'
+    entry taken from 'ctktextbox' or 'ctkentry' if it has none, and intern its colors.
+    Themes that extend another theme inherit the entry, and only get it when flattened.
+    
+    Args:
+        theme: The theme configuration; it is modified in place
+    """
+    if "extends" in theme:
+        intern_theme(theme)
+        return
     
     # Check if we need to add ctktext entry
     if "ctktext" not in theme and "ctktextbox" not in theme:
@@ -958,12 +1190,163 @@ for theme_name in THEMES:
         if "ctkentry" in theme and "text_color" in theme["ctkentry"]:
             theme["ctktext"] = {"text_color": theme["ctkentry"]["text_color"]}
         else:
-            # Default to a contrasting color based on background
-            bg_color = theme.get("frame", {}).get("fg_color", ["#FFFFFF", "#333333"])
-            # Use light color for dark backgrounds, dark for light backgrounds
-            text_color = ["#000000", "#FFFFFF"]  # Default black for light mode, white for dark
-            theme["ctktext"] = {"text_color": text_color}
+            # Default black for light mode, white for dark
+            theme["ctktext"] = {"text_color": ["#000000", "#FFFFFF"]}
     
     # Ensure theme uses the correct key 'ctktext' not 'ctktextbox'
     if "ctktextbox" in theme and "ctktext" not in theme:
-        theme["ctktext"] = theme["ctktextbox"] 
\ No newline at end of file
+        theme["ctktext"] = theme["ctktextbox"]
+    
+    intern_theme(theme)
+
+# Palette colors used when a theme does not define them
+_DEFAULT_COLORS = {
+    "primary": "#375A7F",
+    "secondary": "#444444",
+    "success": "#00BC8C",
+    "danger": "#E74C3C",
+    "warning": "#F39C12",
+    "info": "#3498DB",
+    "light": "#ADB5BD",
+    "dark": "#303030",
+}
+
+def resolve_widget_props(theme: dict) -> dict:
+    """
+    Resolve the configure() properties of every widget kind of a theme.
+    
+    Properties the theme does not define fall back to related widget kinds (e.g. radio
+    buttons to checkboxes, textboxes to entries) and then to defaults derived from the
+    theme colors.
+    
+    Args:
+        theme: The theme configuration
+        
+    Returns:
+        A dictionary mapping widget kinds (e.g. 'button', 'radio_button') to properties,
+        with interned colors
+    """
+    colors = theme.get("colors", {})
+    primary = colors.get("primary", _DEFAULT_COLORS["primary"])
+    info = colors.get("info", _DEFAULT_COLORS["info"])
+    dark = colors.get("dark", _DEFAULT_COLORS["dark"])
+    
+    def _theme_props(widget_type: str) -> dict:
+        return theme.get(widget_type.lower(), {})
+    
+    button_props = _theme_props("button")
+    entry_props = _theme_props("entry")
+    textbox_props = _theme_props("textbox")
+    checkbox_props = _theme_props("checkbox")
+    radiobutton_props = _theme_props("radio_button")
+    switch_props = _theme_props("switch")
+    slider_props = _theme_props("slider")
+    progressbar_props = _theme_props("progressbar")
+    optionmenu_props = _theme_props("option_menu")
+    combobox_props = _theme_props("combobox")
+    frame_props = _theme_props("frame")
+    tabview_props = _theme_props("tabview")
+    segmentedbutton_props = _theme_props("segmented_button")
+    scrollableframe_props = _theme_props("scrollable_frame")
+    
+    return intern_props({
+        "button": {
+            "fg_color": button_props.get("fg_color", [primary, primary]),
+            "hover_color": button_props.get("hover_color", [info, info]),
+            "text_color": button_props.get("text_color", ["#FFFFFF", "#FFFFFF"]),
+        },
+        "entry": {
+            "fg_color": entry_props.get("fg_color", ["#343638", "#343638"]),
+            "border_color": entry_props.get("border_color", [info, info]),
+            "text_color": entry_props.get("text_color", ["#FFFFFF", "#FFFFFF"]),
+        },
+        # Fall back to entry properties if textbox properties are not defined
+        "textbox": {
+            "fg_color": textbox_props.get("fg_color", entry_props.get("fg_color", ["#343638", "#343638"])),
+            "border_color": textbox_props.get("border_color", entry_props.get("border_color", [info, info])),
+            "text_color": textbox_props.get("text_color", entry_props.get("text_color", ["#FFFFFF", "#FFFFFF"])),
+        },
+        "checkbox": {
+            "fg_color": checkbox_props.get("fg_color", ["#343638", "#343638"]),
+            "border_color": checkbox_props.get("border_color", [info, info]),
+            "checkmark_color": checkbox_props.get("checkmark_color", ["#FFFFFF", "#FFFFFF"]),
+            "hover_color": checkbox_props.get("hover_color", [primary, primary]),
+            "text_color": checkbox_props.get("text_color", ["#FFFFFF", "#FFFFFF"]),
+        },
+        # Fall back to checkbox properties if radio button properties are not defined
+        "radio_button": {
+            "fg_color": radiobutton_props.get("fg_color", checkbox_props.get("fg_color", ["#343638", "#343638"])),
+            "border_color": radiobutton_props.get("border_color", checkbox_props.get("border_color", [info, info])),
+            "hover_color": radiobutton_props.get("hover_color", checkbox_props.get("hover_color", [primary, primary])),
+            "text_color": radiobutton_props.get("text_color", checkbox_props.get("text_color", ["#FFFFFF", "#FFFFFF"])),
+        },
+        "switch": {
+            "fg_color": switch_props.get("fg_color", ["#343638", "#343638"]),
+            "progress_color": switch_props.get("progress_color", [primary, primary]),
+            "button_color": switch_props.get("button_color", ["#FFFFFF", "#FFFFFF"]),
+            "button_hover_color": switch_props.get("button_hover_color", ["#E9ECEF", "#E9ECEF"]),
+            "text_color": switch_props.get("text_color", ["#FFFFFF", "#FFFFFF"]),
+        },
+        "slider": {
+            "fg_color": slider_props.get("fg_color", ["#343638", "#343638"]),
+            "progress_color": slider_props.get("progress_color", [primary, primary]),
+            "button_color": slider_props.get("button_color", ["#FFFFFF", "#FFFFFF"]),
+            "button_hover_color": slider_props.get("button_hover_color", ["#E9ECEF", "#E9ECEF"]),
+        },
+        "progressbar": {
+            "fg_color": progressbar_props.get("fg_color", ["#343638", "#343638"]),
+            "progress_color": progressbar_props.get("progress_color", [primary, primary]),
+        },
+        "option_menu": {
+            "fg_color": optionmenu_props.get("fg_color", ["#343638", "#343638"]),
+            "button_color": optionmenu_props.get("button_color", [primary, primary]),
+            "button_hover_color": optionmenu_props.get("button_hover_color", [info, info]),
+            "text_color": optionmenu_props.get("text_color", ["#FFFFFF", "#FFFFFF"]),
+            "dropdown_fg_color": optionmenu_props.get("dropdown_fg_color", [dark, dark]),
+            "dropdown_hover_color": optionmenu_props.get("dropdown_hover_color", [primary, primary]),
+            "dropdown_text_color": optionmenu_props.get("dropdown_text_color", ["#FFFFFF", "#FFFFFF"]),
+        },
+        "combobox": {
+            "fg_color": combobox_props.get("fg_color", ["#343638", "#343638"]),
+            "border_color": combobox_props.get("border_color", [info, info]),
+            "button_color": combobox_props.get("button_color", [primary, primary]),
+            "button_hover_color": combobox_props.get("button_hover_color", [info, info]),
+            "text_color": combobox_props.get("text_color", ["#FFFFFF", "#FFFFFF"]),
+            "dropdown_fg_color": combobox_props.get("dropdown_fg_color", [dark, dark]),
+            "dropdown_hover_color": combobox_props.get("dropdown_hover_color", [primary, primary]),
+            "dropdown_text_color": combobox_props.get("dropdown_text_color", ["#FFFFFF", "#FFFFFF"]),
+        },
+        "frame": {
+            "fg_color": frame_props.get("fg_color", ["#2B2B2B", "#2B2B2B"]),
+            "border_color": frame_props.get("border_color", [info, info]),
+        },
+        "tabview": {
+            "fg_color": tabview_props.get("fg_color", ["#2B2B2B", "#2B2B2B"]),
+            "segmented_button_fg_color": tabview_props.get("segmented_button_fg_color", [dark, dark]),
+            "segmented_button_selected_color": tabview_props.get("segmented_button_selected_color", [primary, primary]),
+            "segmented_button_selected_hover_color": tabview_props.get("segmented_button_selected_hover_color", [info, info]),
+            "segmented_button_unselected_color": tabview_props.get("segmented_button_unselected_color", ["#2B2B2B", "#2B2B2B"]),
+            "segmented_button_unselected_hover_color": tabview_props.get("segmented_button_unselected_hover_color", [dark, dark]),
+            "text_color": tabview_props.get("text_color", ["#FFFFFF", "#FFFFFF"]),
+        },
+        "segmented_button": {
+            "fg_color": segmentedbutton_props.get("fg_color", [dark, dark]),
+            "selected_color": segmentedbutton_props.get("selected_color", [primary, primary]),
+            "selected_hover_color": segmentedbutton_props.get("selected_hover_color", [info, info]),
+            "unselected_color": segmentedbutton_props.get("unselected_color", ["#2B2B2B", "#2B2B2B"]),
+            "unselected_hover_color": segmentedbutton_props.get("unselected_hover_color", [dark, dark]),
+            "text_color": segmentedbutton_props.get("text_color", ["#FFFFFF", "#FFFFFF"]),
+        },
+        "scrollable_frame": {
+            "fg_color": scrollableframe_props.get("fg_color", ["#2B2B2B", "#2B2B2B"]),
+            "border_color": scrollableframe_props.get("border_color", [info, info]),
+            "scrollbar_fg_color": scrollableframe_props.get("scrollbar_fg_color", ["#2B2B2B", "#2B2B2B"]),
+            "scrollbar_button_color": scrollableframe_props.get("scrollbar_button_color", [primary, primary]),
+            "scrollbar_button_hover_color": scrollableframe_props.get("scrollbar_button_hover_color", [info, info]),
+        },
+        # Labels don't have specific theme properties in the theme dict,
+        # so we'll use text_color from the button properties
+        "label": {
+            "text_color": button_props.get("text_color", ["#FFFFFF", "#FFFFFF"]),
+        },
+    })
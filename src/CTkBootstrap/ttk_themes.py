@@ -0,0 +1,291 @@
+"""
+Prebuilt ttk themes for CTkBootstrap.
+
+The "ttk" entry of a theme (and its optional "ttk_styles") is compiled once into the
+settings of a named ttk theme, "ctkb-<theme name>", which is created in each Tcl
+interpreter on first use. Switching themes is then a single style.theme_use(): Tk
+restyles every ttk widget itself, without a configure() call per widget or style.
+
+Compiled themes derive from the "clam" theme (or the theme's "ttk_theme"), whose
+elements and layouts honor the configured colors. Besides the base colors, they carry
+state maps for selected, active and disabled states, notably for the rows and headings
+of Treeview, the tabs of Notebook and the thumb of Scrollbar.
+"""
+
+import itertools
+import tkinter as tk
+from tkinter import ttk
+from typing import Any, Dict, Optional, Tuple
+from .themes import get_theme
+from .widget_theme_mapper import extract_single_color
+
+
+# Settings of a ttk theme, in the format of ttk.Style.theme_create()
+TtkSettings = Dict[str, Dict[str, Any]]
+
+TTK_THEME_PREFIX = "ctkb-"
+
+DEFAULT_PARENT_THEME = "clam"
+
+# Compiled themes keyed by theme name: (source theme dictionary, settings, parent
+# theme, version). A theme replaced in THEMES is recompiled on its next use and gets a
+# new version, so the ttk themes created from the old one are updated.
+_ttk_theme_cache: Dict[str, Tuple[Dict[str, Any], TtkSettings, str, int]] = {}
+
+_versions = itertools.count(1)
+
+# Tcl array holding the version of every ttk theme created in an interpreter
+_VERSION_VARIABLE = "ctkbootstrap_ttk_themes"
+
+
+def ttk_theme_name(theme_name: str) -> str:
+    """
+    Get the name of the ttk theme compiled from a theme.
+
+    Args:
+        theme_name: The name of the theme
+
+    Returns:
+        The ttk theme name, e.g. "ctkb-darkly"
+    """
+    return TTK_THEME_PREFIX + theme_name.lower()
+
+
+def compile_ttk_theme(theme_data: Dict[str, Any]) -> Optional[TtkSettings]:
+    """
+    Compile the ttk properties of a theme into the settings of a ttk theme.
+
+    Args:
+        theme_data: The theme configuration, as found in THEMES
+
+    Returns:
+        The settings for ttk.Style.theme_create(), or None if the theme has no "ttk" entry
+    """
+    if "ttk" not in theme_data:
+        return None
+
+    base = {prop: extract_single_color(value) for prop, value in theme_data["ttk"].items()}
+    background = base.get("background")
+    foreground = base.get("foreground")
+    field = base.get("fieldbackground", background)
+    select = base.get("selectbackground")
+    select_text = base.get("selectforeground")
+    active = base.get("activebackground")
+    active_text = base.get("activeforeground")
+    disabled_text = base.get("disabledforeground")
+
+    def options(**values: Optional[str]) -> Dict[str, str]:
+        return {option: value for option, value in values.items() if value is not None}
+
+    def state_map(**states: Tuple[Tuple[str, Any], ...]) -> Dict[str, list]:
+        mapped = {}
+        for option, entries in states.items():
+            entries = [(state, value) for state, value in entries if value is not None]
+            if entries:
+                mapped[option] = entries
+        return mapped
+
+    # A derived theme inherits the elements and layouts of its parent, but none of its
+    # style settings, so the geometry of the clam styles is repeated here
+    settings = {
+        ".": {
+            # Flat colors for the bevels of the clam elements, unless the theme sets them
+            "configure": {**options(troughcolor=field, lightcolor=background, darkcolor=background), **base},
+            "map": state_map(
+                background=(("disabled", background), ("active", active)),
+                foreground=(("disabled", disabled_text),),
+            ),
+        },
+        "TButton": {
+            "configure": {"anchor": "center", "width": -11, "padding": 5, "relief": "raised"},
+            "map": state_map(
+                background=(("disabled", background), ("pressed", select), ("active", active)),
+                foreground=(("disabled", disabled_text), ("pressed", select_text), ("active", active_text)),
+            ),
+        },
+        "TCheckbutton": {
+            "configure": {"indicatormargin": (1, 1, 4, 1), "padding": 2, **options(indicatorbackground=field)},
+            "map": state_map(indicatorbackground=(("pressed", background), ("selected", select))),
+        },
+        "TRadiobutton": {
+            "configure": {"indicatormargin": (1, 1, 4, 1), "padding": 2, **options(indicatorbackground=field)},
+            "map": state_map(indicatorbackground=(("pressed", background), ("selected", select))),
+        },
+        "TMenubutton": {
+            "configure": {"width": -11, "padding": 5, "relief": "raised"},
+            "map": state_map(background=(("active", active),), foreground=(("active", active_text),)),
+        },
+        "TEntry": {
+            "configure": {"padding": 1, "insertwidth": 1},
+            "map": state_map(
+                fieldbackground=(("readonly", background),),
+                bordercolor=(("focus", select),),
+            ),
+        },
+        "TCombobox": {
+            "configure": {"padding": 1, "insertwidth": 1, **options(arrowcolor=foreground)},
+            "map": state_map(
+                background=(("active", active), ("pressed", active)),
+                fieldbackground=(("readonly", field),),
+                bordercolor=(("focus", select),),
+                arrowcolor=(("disabled", disabled_text),),
+            ),
+        },
+        "ComboboxPopdownFrame": {
+            "configure": {"relief": "solid", "borderwidth": 1},
+        },
+        "TSpinbox": {
+            "configure": {"arrowsize": 10, "padding": (2, 0, 10, 0), **options(arrowcolor=foreground)},
+            "map": state_map(
+                bordercolor=(("focus", select),),
+                arrowcolor=(("disabled", disabled_text),),
+            ),
+        },
+        "TNotebook": {
+            "configure": options(background=background),
+        },
+        "TNotebook.Tab": {
+            "configure": {"padding": (6, 2, 6, 2), **options(background=field, foreground=foreground)},
+            "map": state_map(
+                padding=(("selected", (6, 4, 6, 2)),),
+                background=(("selected", select), ("active", active)),
+                foreground=(("selected", select_text), ("active", active_text)),
+            ),
+        },
+        "Treeview": {
+            "configure": options(background=field, fieldbackground=field, foreground=foreground),
+            "map": state_map(
+                background=(("disabled", background), ("selected", select)),
+                foreground=(("disabled", disabled_text), ("selected", select_text)),
+                bordercolor=(("focus", select),),
+            ),
+        },
+        "Heading": {
+            "configure": {"font": "TkHeadingFont", "relief": "raised", "padding": 3,
+                          **options(background=background, foreground=foreground)},
+            "map": state_map(
+                background=(("active", active),),
+                foreground=(("active", active_text),),
+            ),
+        },
+        "TScrollbar": {
+            "configure": options(background=field, troughcolor=background, arrowcolor=foreground),
+            "map": state_map(
+                background=(("pressed", select), ("active", active)),
+                arrowcolor=(("disabled", disabled_text),),
+            ),
+        },
+        "TLabelframe": {
+            "configure": {"labeloutside": True, "labelmargins": (0, 0, 0, 4), "borderwidth": 2, "relief": "raised"},
+        },
+        "TProgressbar": {
+            "configure": options(background=select, troughcolor=field),
+        },
+        "Sash": {
+            "configure": {"sashthickness": 6, "gripcount": 10},
+        },
+    }
+
+    # Custom styles of the theme are configured on top
+    for style_name, style_props in theme_data.get("ttk_styles", {}).items():
+        style_settings = settings.setdefault(style_name, {})
+        style_settings["configure"] = {
+            **style_settings.get("configure", {}),
+            **{prop: extract_single_color(value) for prop, value in style_props.items()},
+        }
+    return settings
+
+
+def _get_compiled(theme_name: str, theme_data: Dict[str, Any]) -> Optional[Tuple[Dict[str, Any], TtkSettings, str, int]]:
+    """Get the compiled ttk theme of a theme, compiling it on first use"""
+    cached = _ttk_theme_cache.get(theme_name)
+    if cached is None or cached[0] is not theme_data:
+        settings = compile_ttk_theme(theme_data)
+        if settings is None:
+            _ttk_theme_cache.pop(theme_name, None)
+            return None
+        parent = theme_data.get("ttk_theme", DEFAULT_PARENT_THEME)
+        cached = (theme_data, settings, parent, next(_versions))
+        _ttk_theme_cache[theme_name] = cached
+    return cached
+
+
+def get_ttk_settings(theme_name: str) -> Optional[TtkSettings]:
+    """
+    Get the compiled ttk theme settings of a theme, compiling them on first use.
+
+    Args:
+        theme_name: The name of the theme
+
+    Returns:
+        The settings, or None if the theme has no "ttk" entry. They are shared and must
+        not be modified.
+
+    Raises:
+        ValueError: If the theme does not exist
+    """
+    theme_name = theme_name.lower()
+    compiled = _get_compiled(theme_name, get_theme(theme_name))
+    return compiled[1] if compiled is not None else None
+
+
+def use_ttk_theme(root: Any, theme_name: str, theme_data: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    """
+    Switch the ttk widgets of an interpreter to the ttk theme of a theme.
+
+    The ttk theme is created in the interpreter of the root on first use, and updated
+    if the theme has changed since.
+
+    Args:
+        root: Any widget of the Tcl interpreter to switch
+        theme_name: The name of the theme
+        theme_data: The theme configuration (default: looked up in THEMES)
+
+    Returns:
+        The name of the ttk theme in use, or None if the theme has no "ttk" entry or
+        the root has no Tcl interpreter (see null_backend)
+
+    Raises:
+        ValueError: If the theme does not exist
+    """
+    theme_name = theme_name.lower()
+    if theme_data is None:
+        theme_data = get_theme(theme_name)
+    compiled = _get_compiled(theme_name, theme_data)
+    interpreter = getattr(root, "tk", None)
+    if compiled is None or getattr(interpreter, "call", None) is None:
+        return None
+
+    _, settings, parent, version = compiled
+    name = ttk_theme_name(theme_name)
+    style = ttk.Style(root)
+    variable = f"{_VERSION_VARIABLE}({name})"
+    try:
+        created = str(interpreter.globalgetvar(variable))
+    except tk.TclError:
+        created = None
+
+    if created != str(version):
+        theme_names = style.theme_names()
+        if name in theme_names:
+            style.theme_settings(name, settings)
+        else:
+            style.theme_create(name, parent if parent in theme_names else "default", settings)
+        interpreter.globalsetvar(variable, version)
+
+    if style.theme_use() != name:
+        style.theme_use(name)
+    return name
+
+
+def clear_ttk_theme_cache(theme_name: Optional[str] = None) -> None:
+    """
+    Discard compiled ttk themes. Themes created in interpreters are updated when used next.
+
+    Args:
+        theme_name: Only discard the compiled theme of this theme (default: all)
+    """
+    if theme_name is None:
+        _ttk_theme_cache.clear()
+    else:
+        _ttk_theme_cache.pop(theme_name.lower(), None)
@@ -0,0 +1,167 @@
+"""
+Widget registry for CTkBootstrap.
+
+An opt-in index of themed widgets, grouped by widget class and held through weak
+references. Theme application can iterate the registry instead of walking the widget
+tree with winfo_children(), which costs one Tk round-trip per widget and also descends
+into the internal canvases and labels of CustomTkinter widgets.
+"""
+
+import weakref
+import tkinter as tk
+import customtkinter as ctk
+from typing import Dict, Any, Iterator, List, Optional
+
+
+class WidgetRegistry:
+    """
+    A weak-reference index of widgets, keyed by widget class.
+
+    Widgets are removed automatically when they are destroyed or garbage collected.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._widgets: Dict[type, "weakref.WeakSet[Any]"] = {}
+
+    def register(self, widget: Any) -> Any:
+        """
+        Add a widget to the registry.
+
+        Args:
+            widget: The widget to track
+
+        Returns:
+            The widget, so the call can wrap widget creation
+        """
+        widgets = self._widgets.get(type(widget))
+        if widgets is None:
+            widgets = self._widgets[type(widget)] = weakref.WeakSet()
+        elif widget in widgets:
+            return widget
+
+        widgets.add(widget)
+        self._bind_destroy(widget)
+        return widget
+
+    def unregister(self, widget: Any) -> None:
+        """
+        Remove a widget from the registry.
+
+        Args:
+            widget: The widget to stop tracking
+        """
+        widgets = self._widgets.get(type(widget))
+        if widgets is not None:
+            widgets.discard(widget)
+
+    def register_tree(self, root: Any) -> int:
+        """
+        Register a widget and all of its descendants.
+
+        The internal Tkinter widgets of CustomTkinter widgets (canvases, labels and
+        the like) are not registered; CustomTkinter widgets nested inside them are.
+
+        Args:
+            root: The root widget of the tree
+
+        Returns:
+            The number of widgets registered
+        """
+        count = 0
+        stack = [(root, False)]
+        while stack:
+            widget, internal = stack.pop()
+            if not internal:
+                self.register(widget)
+                count += 1
+
+            if hasattr(widget, "winfo_children"):
+                is_ctk_widget = isinstance(widget, ctk.CTkBaseClass)
+                for child in widget.winfo_children():
+                    child_internal = is_ctk_widget and not isinstance(
+                        child, (ctk.CTkBaseClass, ctk.CTkScrollableFrame)
+                    )
+                    stack.append((child, child_internal))
+        return count
+
+    def widgets(self, widget_class: Optional[type] = None, include_subclasses: bool = True) -> List[Any]:
+        """
+        Get the registered widgets, optionally restricted to a widget class.
+
+        Args:
+            widget_class: Only return widgets of this class, or None for all widgets
+            include_subclasses: Also return widgets whose class derives from widget_class
+
+        Returns:
+            A list of the registered widgets that are still alive
+        """
+        if widget_class is None:
+            return [widget for widgets in self._widgets.values() for widget in widgets]
+        if not include_subclasses:
+            return list(self._widgets.get(widget_class, ()))
+        return [
+            widget
+            for registered_class, widgets in self._widgets.items()
+            if issubclass(registered_class, widget_class)
+            for widget in widgets
+        ]
+
+    def configure_all(self, widget_class: type, **kwargs) -> int:
+        """
+        Configure every registered widget of a class, e.g. to recolor all buttons.
+
+        Args:
+            widget_class: The class of the widgets to configure, subclasses included
+            **kwargs: The options to pass to configure()
+
+        Returns:
+            The number of widgets configured
+        """
+        widgets = self.widgets(widget_class)
+        for widget in widgets:
+            widget.configure(**kwargs)
+        return len(widgets)
+
+    def classes(self) -> List[type]:
+        """Get the widget classes that currently have registered widgets"""
+        return [widget_class for widget_class, widgets in self._widgets.items() if len(widgets)]
+
+    def clear(self) -> None:
+        """Remove all widgets from the registry"""
+        self._widgets.clear()
+
+    def __len__(self) -> int:
+        return sum(len(widgets) for widgets in self._widgets.values())
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.widgets())
+
+    def __contains__(self, widget: Any) -> bool:
+        widgets = self._widgets.get(type(widget))
+        return widgets is not None and widget in widgets
+
+    def _bind_destroy(self, widget: Any) -> None:
+        """Unregister the widget when Tk destroys it"""
+        if not isinstance(widget, tk.Misc):
+            return
+
+        # The callback only holds weak references, so it never keeps a widget alive
+        widget_ref = weakref.ref(widget)
+        registry_ref = weakref.ref(self)
+        widget_path = str(widget)
+
+        def on_destroy(event):
+            # Toplevel windows also receive <Destroy> for each of their children
+            if str(event.widget) != widget_path:
+                return
+            registry = registry_ref()
+            destroyed = widget_ref()
+            if registry is not None and destroyed is not None:
+                registry.unregister(destroyed)
+
+        # CustomTkinter widgets do not allow bind() on themselves, so bind on the Tk widget
+        try:
+            tk.Misc.bind(widget, "<Destroy>", on_destroy, add="+")
+        except tk.TclError:
+            pass
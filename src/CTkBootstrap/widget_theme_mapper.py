@@ -4,10 +4,11 @@ Widget theme mapper for CTkBootstrap.
 This module provides functions to apply theme properties to specific CustomTkinter widgets.
 """
 
-from typing import Dict, Any, Optional, List, Union, Tuple
+from typing import Dict, Any, Optional, List, Union, Tuple, Callable, Iterator
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import ttk
+from .colors import Color, contrast_text_color
 
 
 # Helper function to extract a single color from a tuple
@@ -22,6 +23,9 @@ def extract_single_color(color_value: Any) -> str:
     Returns:
         A single color string
     """
+    # Interned colors (see colors.py) are already single, canonical colors
+    if type(color_value) is Color:
+        return color_value
     if isinstance(color_value, tuple) and len(color_value) > 0:
         # For standard Tkinter widgets, use the first color in the tuple
         return color_value[0]
@@ -40,6 +44,94 @@ def extract_single_color(color_value: Any) -> str:
 
 # CustomTkinter Widget Mappers
 
+# Theme properties each CustomTkinter widget class accepts, in application order
+WIDGET_THEME_PROPERTIES = {
+    ctk.CTkButton: ("fg_color", "hover_color", "text_color", "border_color"),
+    ctk.CTkFrame: ("fg_color", "border_color", "corner_radius"),
+    ctk.CTkLabel: ("fg_color", "text_color", "corner_radius"),
+    ctk.CTkEntry: ("fg_color", "border_color", "text_color", "placeholder_text_color"),
+    ctk.CTkCheckBox: ("fg_color", "border_color", "text_color", "hover_color", "checkmark_color"),
+    ctk.CTkRadioButton: ("fg_color", "border_color", "text_color", "hover_color"),
+    ctk.CTkSwitch: ("fg_color", "progress_color", "button_color", "button_hover_color", "text_color"),
+    ctk.CTkSlider: ("fg_color", "progress_color", "button_color", "button_hover_color"),
+    ctk.CTkProgressBar: ("fg_color", "progress_color", "border_color"),
+    ctk.CTkOptionMenu: ("fg_color", "button_color", "button_hover_color", "dropdown_fg_color",
+                        "dropdown_hover_color", "dropdown_text_color", "text_color"),
+    ctk.CTkComboBox: ("fg_color", "border_color", "button_color", "button_hover_color",
+                      "dropdown_fg_color", "dropdown_hover_color", "dropdown_text_color", "text_color"),
+    ctk.CTkTextbox: ("fg_color", "border_color", "text_color", "scrollbar_button_color",
+                     "scrollbar_button_hover_color"),
+    ctk.CTkScrollbar: ("fg_color", "button_color", "button_hover_color"),
+    ctk.CTkScrollableFrame: ("fg_color", "border_color", "scrollbar_fg_color", "scrollbar_button_color",
+                             "scrollbar_button_hover_color", "corner_radius"),
+    ctk.CTkTabview: ("fg_color", "segmented_button_fg_color", "segmented_button_selected_color",
+                     "segmented_button_selected_hover_color", "segmented_button_unselected_color",
+                     "segmented_button_unselected_hover_color", "text_color"),
+    ctk.CTkSegmentedButton: ("fg_color", "selected_color", "selected_hover_color",
+                             "unselected_color", "unselected_hover_color", "text_color",
+                             "text_color_disabled"),
+    ctk.CTk: ("fg_color",),
+    ctk.CTkToplevel: ("fg_color",),
+}
+
+# Key of the THEMES entry that holds the properties for each CustomTkinter widget class
+WIDGET_THEME_KEYS = {
+    ctk.CTkButton: "button",
+    ctk.CTkFrame: "frame",
+    ctk.CTkLabel: "label",
+    ctk.CTkEntry: "entry",
+    ctk.CTkCheckBox: "checkbox",
+    ctk.CTkRadioButton: "radio_button",
+    ctk.CTkSwitch: "switch",
+    ctk.CTkSlider: "slider",
+    ctk.CTkProgressBar: "progressbar",
+    ctk.CTkOptionMenu: "option_menu",
+    ctk.CTkComboBox: "combobox",
+    ctk.CTkTextbox: "textbox",
+    ctk.CTkScrollbar: "scrollbar",
+    ctk.CTkScrollableFrame: "scrollable_frame",
+    ctk.CTkTabview: "tabview",
+    ctk.CTkSegmentedButton: "segmented_button",
+    ctk.CTk: "window",
+    ctk.CTkToplevel: "window",
+}
+
+
+def _configure_theme_props(widget: Any, prop_names: Tuple[str, ...], theme_props: Dict[str, Any]) -> None:
+    """
+    Apply the listed theme properties to a widget with a single configure() call.
+    
+    CustomTkinter redraws a widget on every configure(), so merging the properties
+    means one redraw per widget instead of one per property.
+    
+    Args:
+        widget: The widget to style
+        prop_names: The property names the widget accepts
+        theme_props: The theme properties to apply
+    """
+    kwargs = {prop: theme_props[prop] for prop in prop_names if prop in theme_props}
+    if kwargs:
+        widget.configure(**kwargs)
+
+
+def _configure_tk_props(widget: Any, prop_map: List[Tuple[str, str]], theme_props: Dict[str, Any]) -> None:
+    """
+    Apply theme properties to a standard Tkinter widget with a single configure() call.
+    
+    Args:
+        widget: The widget to style
+        prop_map: Pairs of (tk option name, theme property name)
+        theme_props: The theme properties to apply
+    """
+    kwargs = {
+        prop: extract_single_color(theme_props[theme_prop])
+        for prop, theme_prop in prop_map
+        if theme_prop in theme_props
+    }
+    if kwargs:
+        widget.configure(**kwargs)
+
+
 def apply_theme_to_button(button: ctk.CTkButton, theme_props: Dict[str, Any]) -> None:
     """
     Apply theme properties to a CTkButton.
@@ -48,9 +140,7 @@ def apply_theme_to_button(button: ctk.CTkButton, theme_props: Dict[str, Any]) ->
         button: The button widget to style
         theme_props: The theme properties to apply
     """
-    for prop in ["fg_color", "hover_color", "text_color", "border_color"]:
-        if prop in theme_props:
-            button.configure(**{prop: theme_props[prop]})
+    _configure_theme_props(button, WIDGET_THEME_PROPERTIES[ctk.CTkButton], theme_props)
 
 
 def apply_theme_to_frame(frame: ctk.CTkFrame, theme_props: Dict[str, Any]) -> None:
@@ -61,9 +151,7 @@ def apply_theme_to_frame(frame: ctk.CTkFrame, theme_props: Dict[str, Any]) -> No
         frame: The frame widget to style
         theme_props: The theme properties to apply
     """
-    for prop in ["fg_color", "border_color", "corner_radius"]:
-        if prop in theme_props:
-            frame.configure(**{prop: theme_props[prop]})
+    _configure_theme_props(frame, WIDGET_THEME_PROPERTIES[ctk.CTkFrame], theme_props)
 
 
 def apply_theme_to_label(label: ctk.CTkLabel, theme_props: Dict[str, Any]) -> None:
@@ -74,9 +162,7 @@ def apply_theme_to_label(label: ctk.CTkLabel, theme_props: Dict[str, Any]) -> No
         label: The label widget to style
         theme_props: The theme properties to apply
     """
-    for prop in ["fg_color", "text_color", "corner_radius"]:
-        if prop in theme_props:
-            label.configure(**{prop: theme_props[prop]})
+    _configure_theme_props(label, WIDGET_THEME_PROPERTIES[ctk.CTkLabel], theme_props)
 
 
 def apply_theme_to_entry(entry: ctk.CTkEntry, theme_props: Dict[str, Any]) -> None:
@@ -88,25 +174,25 @@ def apply_theme_to_entry(entry: ctk.CTkEntry, theme_props: Dict[str, Any]) -> No
         theme_props: The theme properties to apply
     """
     # First apply properties to the CTkEntry container
-    for prop in ["fg_color", "border_color", "text_color", "placeholder_text_color"]:
-        if prop in theme_props:
-            entry.configure(**{prop: theme_props[prop]})
-    
-    # Then directly apply text_color to the internal tk.Entry widget if it exists
+    _configure_theme_props(entry, WIDGET_THEME_PROPERTIES[ctk.CTkEntry], theme_props)
+    _configure_internal_entry(entry, theme_props)
+
+
+def _configure_internal_entry(entry: ctk.CTkEntry, theme_props: Dict[str, Any]) -> None:
+    """Apply the text and cursor colors of a CTkEntry to its internal tk.Entry"""
     # Similar to CTkTextbox, CTkEntry contains an internal standard tk.Entry widget
     # that needs to be styled directly for text color to be applied properly
     if "text_color" in theme_props and hasattr(entry, "_entry"):
         internal_entry = entry._entry
         if isinstance(internal_entry, tk.Entry):
             text_color = extract_single_color(theme_props["text_color"])
-            internal_entry.configure(fg=text_color)
             
             # Also update the cursor color to match text color if applicable
             if "cursor_color" in theme_props:
                 cursor_color = extract_single_color(theme_props["cursor_color"])
             else:
                 cursor_color = text_color
-            internal_entry.configure(insertbackground=cursor_color)
+            internal_entry.configure(fg=text_color, insertbackground=cursor_color)
 
 
 def apply_theme_to_checkbox(checkbox: ctk.CTkCheckBox, theme_props: Dict[str, Any]) -> None:
@@ -117,9 +203,7 @@ def apply_theme_to_checkbox(checkbox: ctk.CTkCheckBox, theme_props: Dict[str, An
         checkbox: The checkbox widget to style
         theme_props: The theme properties to apply
     """
-    for prop in ["fg_color", "border_color", "text_color", "hover_color", "checkmark_color"]:
-        if prop in theme_props:
-            checkbox.configure(**{prop: theme_props[prop]})
+    _configure_theme_props(checkbox, WIDGET_THEME_PROPERTIES[ctk.CTkCheckBox], theme_props)
 
 
 def apply_theme_to_radio_button(radio: ctk.CTkRadioButton, theme_props: Dict[str, Any]) -> None:
@@ -130,9 +214,7 @@ def apply_theme_to_radio_button(radio: ctk.CTkRadioButton, theme_props: Dict[str
         radio: The radio button widget to style
         theme_props: The theme properties to apply
     """
-    for prop in ["fg_color", "border_color", "text_color", "hover_color"]:
-        if prop in theme_props:
-            radio.configure(**{prop: theme_props[prop]})
+    _configure_theme_props(radio, WIDGET_THEME_PROPERTIES[ctk.CTkRadioButton], theme_props)
 
 
 def apply_theme_to_switch(switch: ctk.CTkSwitch, theme_props: Dict[str, Any]) -> None:
@@ -143,9 +225,7 @@ def apply_theme_to_switch(switch: ctk.CTkSwitch, theme_props: Dict[str, Any]) ->
         switch: The switch widget to style
         theme_props: The theme properties to apply
     """
-    for prop in ["fg_color", "progress_color", "button_color", "button_hover_color", "text_color"]:
-        if prop in theme_props:
-            switch.configure(**{prop: theme_props[prop]})
+    _configure_theme_props(switch, WIDGET_THEME_PROPERTIES[ctk.CTkSwitch], theme_props)
 
 
 def apply_theme_to_slider(slider: ctk.CTkSlider, theme_props: Dict[str, Any]) -> None:
@@ -156,9 +236,7 @@ def apply_theme_to_slider(slider: ctk.CTkSlider, theme_props: Dict[str, Any]) ->
         slider: The slider widget to style
         theme_props: The theme properties to apply
     """
-    for prop in ["fg_color", "progress_color", "button_color", "button_hover_color"]:
-        if prop in theme_props:
-            slider.configure(**{prop: theme_props[prop]})
+    _configure_theme_props(slider, WIDGET_THEME_PROPERTIES[ctk.CTkSlider], theme_props)
 
 
 def apply_theme_to_progressbar(progressbar: ctk.CTkProgressBar, theme_props: Dict[str, Any]) -> None:
@@ -169,9 +247,7 @@ def apply_theme_to_progressbar(progressbar: ctk.CTkProgressBar, theme_props: Dic
         progressbar: The progress bar widget to style
         theme_props: The theme properties to apply
     """
-    for prop in ["fg_color", "progress_color", "border_color"]:
-        if prop in theme_props:
-            progressbar.configure(**{prop: theme_props[prop]})
+    _configure_theme_props(progressbar, WIDGET_THEME_PROPERTIES[ctk.CTkProgressBar], theme_props)
 
 
 def apply_theme_to_option_menu(option_menu: ctk.CTkOptionMenu, theme_props: Dict[str, Any]) -> None:
@@ -182,10 +258,7 @@ def apply_theme_to_option_menu(option_menu: ctk.CTkOptionMenu, theme_props: Dict
         option_menu: The option menu widget to style
         theme_props: The theme properties to apply
     """
-    for prop in ["fg_color", "button_color", "button_hover_color", "dropdown_fg_color", 
-                "dropdown_hover_color", "dropdown_text_color", "text_color"]:
-        if prop in theme_props:
-            option_menu.configure(**{prop: theme_props[prop]})
+    _configure_theme_props(option_menu, WIDGET_THEME_PROPERTIES[ctk.CTkOptionMenu], theme_props)
 
 
 def apply_theme_to_combobox(combobox: ctk.CTkComboBox, theme_props: Dict[str, Any]) -> None:
@@ -196,10 +269,7 @@ def apply_theme_to_combobox(combobox: ctk.CTkComboBox, theme_props: Dict[str, An
         combobox: The combobox widget to style
         theme_props: The theme properties to apply
     """
-    for prop in ["fg_color", "border_color", "button_color", "button_hover_color", 
-                "dropdown_fg_color", "dropdown_hover_color", "dropdown_text_color", "text_color"]:
-        if prop in theme_props:
-            combobox.configure(**{prop: theme_props[prop]})
+    _configure_theme_props(combobox, WIDGET_THEME_PROPERTIES[ctk.CTkComboBox], theme_props)
 
 
 def apply_theme_to_textbox(textbox: ctk.CTkTextbox, theme_props: Dict[str, Any]) -> None:
@@ -211,10 +281,7 @@ def apply_theme_to_textbox(textbox: ctk.CTkTextbox, theme_props: Dict[str, Any])
         theme_props: The theme properties to apply
     """
     # First apply properties to the CTkTextbox container
-    for prop in ["fg_color", "border_color", "text_color", "scrollbar_button_color", 
-                "scrollbar_button_hover_color"]:
-        if prop in theme_props:
-            textbox.configure(**{prop: theme_props[prop]})
+    _configure_theme_props(textbox, WIDGET_THEME_PROPERTIES[ctk.CTkTextbox], theme_props)
     
     # Directly access and style the internal tk.Text widget
     if hasattr(textbox, "_textbox"):
@@ -245,16 +312,11 @@ def apply_theme_to_textbox(textbox: ctk.CTkTextbox, theme_props: Dict[str, Any])
                     else:
                         bg = bg_prop
                     
-                    # Very simple contrast check - improve this if needed
+                    # Pick the text color with the most contrast (WCAG)
                     if bg.startswith('#'):
-                        # Convert hex to RGB and check brightness
                         try:
-                            r = int(bg[1:3], 16)
-                            g = int(bg[3:5], 16)
-                            b = int(bg[5:7], 16)
-                            brightness = (r * 299 + g * 587 + b * 114) / 1000
-                            text_color = "#FFFFFF" if brightness < 128 else "#000000"
-                        except:
+                            text_color = contrast_text_color(bg)
+                        except ValueError:
                             text_color = "#FFFFFF"  # Default to white text
                     else:
                         text_color = "#FFFFFF"  # Default to white text
@@ -265,10 +327,8 @@ def apply_theme_to_textbox(textbox: ctk.CTkTextbox, theme_props: Dict[str, Any])
             if text_color:
                 if isinstance(text_color, (list, tuple)) and len(text_color) > 0:
                     text_color = text_color[1]  # Use dark mode color
-                internal_text.configure(fg=text_color)
-                
                 # Also update cursor color
-                internal_text.configure(insertbackground=text_color)
+                internal_text.configure(fg=text_color, insertbackground=text_color)
 
 
 def apply_theme_to_scrollbar(scrollbar: ctk.CTkScrollbar, theme_props: Dict[str, Any]) -> None:
@@ -279,9 +339,7 @@ def apply_theme_to_scrollbar(scrollbar: ctk.CTkScrollbar, theme_props: Dict[str,
         scrollbar: The scrollbar widget to style
         theme_props: The theme properties to apply
     """
-    for prop in ["fg_color", "button_color", "button_hover_color"]:
-        if prop in theme_props:
-            scrollbar.configure(**{prop: theme_props[prop]})
+    _configure_theme_props(scrollbar, WIDGET_THEME_PROPERTIES[ctk.CTkScrollbar], theme_props)
 
 
 def apply_theme_to_scrollable_frame(scrollable_frame: ctk.CTkScrollableFrame, theme_props: Dict[str, Any]) -> None:
@@ -292,10 +350,7 @@ def apply_theme_to_scrollable_frame(scrollable_frame: ctk.CTkScrollableFrame, th
         scrollable_frame: The scrollable frame widget to style
         theme_props: The theme properties to apply
     """
-    for prop in ["fg_color", "border_color", "scrollbar_fg_color", "scrollbar_button_color", 
-                "scrollbar_button_hover_color", "corner_radius"]:
-        if prop in theme_props:
-            scrollable_frame.configure(**{prop: theme_props[prop]})
+    _configure_theme_props(scrollable_frame, WIDGET_THEME_PROPERTIES[ctk.CTkScrollableFrame], theme_props)
 
 
 def apply_theme_to_tabview(tabview: ctk.CTkTabview, theme_props: Dict[str, Any]) -> None:
@@ -306,11 +361,7 @@ def apply_theme_to_tabview(tabview: ctk.CTkTabview, theme_props: Dict[str, Any])
         tabview: The tabview widget to style
         theme_props: The theme properties to apply
     """
-    for prop in ["fg_color", "segmented_button_fg_color", "segmented_button_selected_color",
-                "segmented_button_selected_hover_color", "segmented_button_unselected_color",
-                "segmented_button_unselected_hover_color", "text_color"]:
-        if prop in theme_props:
-            tabview.configure(**{prop: theme_props[prop]})
+    _configure_theme_props(tabview, WIDGET_THEME_PROPERTIES[ctk.CTkTabview], theme_props)
 
 
 def apply_theme_to_segmented_button(segmented_button: ctk.CTkSegmentedButton, theme_props: Dict[str, Any]) -> None:
@@ -321,11 +372,7 @@ def apply_theme_to_segmented_button(segmented_button: ctk.CTkSegmentedButton, th
         segmented_button: The segmented button widget to style
         theme_props: The theme properties to apply
     """
-    for prop in ["fg_color", "selected_color", "selected_hover_color", 
-                "unselected_color", "unselected_hover_color", "text_color",
-                "text_color_disabled"]:
-        if prop in theme_props:
-            segmented_button.configure(**{prop: theme_props[prop]})
+    _configure_theme_props(segmented_button, WIDGET_THEME_PROPERTIES[ctk.CTkSegmentedButton], theme_props)
 
 
 # ttk Widget Mappers
@@ -436,14 +483,12 @@ def apply_theme_to_ttk_treeview(treeview: ttk.Treeview, theme_props: Dict[str, A
 
 def apply_theme_to_tk_button(button: tk.Button, theme_props: Dict[str, Any]) -> None:
     """Apply theme properties to a tk.Button."""
-    for prop, theme_prop in [
+    _configure_tk_props(button, [
         ("bg", "bg_color"), 
         ("fg", "text_color"),
         ("activebackground", "active_bg_color"),
         ("activeforeground", "active_text_color")
-    ]:
-        if theme_prop in theme_props:
-            button.configure(**{prop: extract_single_color(theme_props[theme_prop])})
+    ], theme_props)
 
 
 def apply_theme_to_tk_canvas(canvas: tk.Canvas, theme_props: Dict[str, Any]) -> None:
@@ -454,26 +499,22 @@ def apply_theme_to_tk_canvas(canvas: tk.Canvas, theme_props: Dict[str, Any]) ->
 
 def apply_theme_to_tk_checkbutton(checkbutton: tk.Checkbutton, theme_props: Dict[str, Any]) -> None:
     """Apply theme properties to a tk.Checkbutton."""
-    for prop, theme_prop in [
+    _configure_tk_props(checkbutton, [
         ("bg", "bg_color"), 
         ("fg", "text_color"),
         ("activebackground", "active_bg_color"),
         ("activeforeground", "active_text_color"),
         ("selectcolor", "select_color")
-    ]:
-        if theme_prop in theme_props:
-            checkbutton.configure(**{prop: extract_single_color(theme_props[theme_prop])})
+    ], theme_props)
 
 
 def apply_theme_to_tk_entry(entry: tk.Entry, theme_props: Dict[str, Any]) -> None:
     """Apply theme properties to a tk.Entry."""
-    for prop, theme_prop in [
+    _configure_tk_props(entry, [
         ("bg", "bg_color"), 
         ("fg", "text_color"),
         ("insertbackground", "cursor_color")
-    ]:
-        if theme_prop in theme_props:
-            entry.configure(**{prop: extract_single_color(theme_props[theme_prop])})
+    ], theme_props)
 
 
 def apply_theme_to_tk_frame(frame: tk.Frame, theme_props: Dict[str, Any]) -> None:
@@ -484,120 +525,100 @@ def apply_theme_to_tk_frame(frame: tk.Frame, theme_props: Dict[str, Any]) -> Non
 
 def apply_theme_to_tk_label(label: tk.Label, theme_props: Dict[str, Any]) -> None:
     """Apply theme properties to a tk.Label."""
-    for prop, theme_prop in [
+    _configure_tk_props(label, [
         ("bg", "bg_color"), 
         ("fg", "text_color")
-    ]:
-        if theme_prop in theme_props:
-            label.configure(**{prop: extract_single_color(theme_props[theme_prop])})
+    ], theme_props)
 
 
 def apply_theme_to_tk_listbox(listbox: tk.Listbox, theme_props: Dict[str, Any]) -> None:
     """Apply theme properties to a tk.Listbox."""
-    for prop, theme_prop in [
+    _configure_tk_props(listbox, [
         ("bg", "bg_color"), 
         ("fg", "text_color"),
         ("selectbackground", "select_bg_color"),
         ("selectforeground", "select_text_color")
-    ]:
-        if theme_prop in theme_props:
-            listbox.configure(**{prop: extract_single_color(theme_props[theme_prop])})
+    ], theme_props)
 
 
 def apply_theme_to_tk_menu(menu: tk.Menu, theme_props: Dict[str, Any]) -> None:
     """Apply theme properties to a tk.Menu."""
-    for prop, theme_prop in [
+    _configure_tk_props(menu, [
         ("bg", "bg_color"), 
         ("fg", "text_color"),
         ("activebackground", "active_bg_color"),
         ("activeforeground", "active_text_color")
-    ]:
-        if theme_prop in theme_props:
-            menu.configure(**{prop: extract_single_color(theme_props[theme_prop])})
+    ], theme_props)
 
 
 def apply_theme_to_tk_menubutton(menubutton: tk.Menubutton, theme_props: Dict[str, Any]) -> None:
     """Apply theme properties to a tk.Menubutton."""
-    for prop, theme_prop in [
+    _configure_tk_props(menubutton, [
         ("bg", "bg_color"), 
         ("fg", "text_color"),
         ("activebackground", "active_bg_color"),
         ("activeforeground", "active_text_color")
-    ]:
-        if theme_prop in theme_props:
-            menubutton.configure(**{prop: extract_single_color(theme_props[theme_prop])})
+    ], theme_props)
 
 
 def apply_theme_to_tk_message(message: tk.Message, theme_props: Dict[str, Any]) -> None:
     """Apply theme properties to a tk.Message."""
-    for prop, theme_prop in [
+    _configure_tk_props(message, [
         ("bg", "bg_color"), 
         ("fg", "text_color")
-    ]:
-        if theme_prop in theme_props:
-            message.configure(**{prop: extract_single_color(theme_props[theme_prop])})
+    ], theme_props)
 
 
 def apply_theme_to_tk_radiobutton(radiobutton: tk.Radiobutton, theme_props: Dict[str, Any]) -> None:
     """Apply theme properties to a tk.Radiobutton."""
-    for prop, theme_prop in [
+    _configure_tk_props(radiobutton, [
         ("bg", "bg_color"), 
         ("fg", "text_color"),
         ("activebackground", "active_bg_color"),
         ("activeforeground", "active_text_color"),
         ("selectcolor", "select_color")
-    ]:
-        if theme_prop in theme_props:
-            radiobutton.configure(**{prop: extract_single_color(theme_props[theme_prop])})
+    ], theme_props)
 
 
 def apply_theme_to_tk_scale(scale: tk.Scale, theme_props: Dict[str, Any]) -> None:
     """Apply theme properties to a tk.Scale."""
-    for prop, theme_prop in [
+    _configure_tk_props(scale, [
         ("bg", "bg_color"), 
         ("fg", "text_color"),
         ("activebackground", "active_bg_color"),
         ("troughcolor", "trough_color")
-    ]:
-        if theme_prop in theme_props:
-            scale.configure(**{prop: extract_single_color(theme_props[theme_prop])})
+    ], theme_props)
 
 
 def apply_theme_to_tk_scrollbar(scrollbar: tk.Scrollbar, theme_props: Dict[str, Any]) -> None:
     """Apply theme properties to a tk.Scrollbar."""
-    for prop, theme_prop in [
+    _configure_tk_props(scrollbar, [
         ("bg", "bg_color"),
         ("activebackground", "active_bg_color"),
         ("troughcolor", "trough_color")
-    ]:
-        if theme_prop in theme_props:
-            scrollbar.configure(**{prop: extract_single_color(theme_props[theme_prop])})
+    ], theme_props)
 
 
 def apply_theme_to_tk_spinbox(spinbox: tk.Spinbox, theme_props: Dict[str, Any]) -> None:
     """Apply theme properties to a tk.Spinbox."""
-    for prop, theme_prop in [
+    _configure_tk_props(spinbox, [
         ("bg", "bg_color"), 
         ("fg", "text_color"),
         ("buttonbackground", "button_bg_color"),
         ("selectbackground", "select_bg_color"),
         ("selectforeground", "select_text_color")
-    ]:
-        if theme_prop in theme_props:
-            spinbox.configure(**{prop: extract_single_color(theme_props[theme_prop])})
+    ], theme_props)
 
 
 def apply_theme_to_tk_text(text: tk.Text, theme_props: Dict[str, Any]) -> None:
     """Apply theme properties to a tk.Text."""
-    for prop, theme_prop in [
+    _configure_tk_props(text, [
         ("bg", "bg_color"), 
         ("fg", "text_color"),
         ("insertbackground", "cursor_color"),
         ("selectbackground", "select_bg_color"),
         ("selectforeground", "select_text_color")
-    ]:
-        if theme_prop in theme_props:
-            text.configure(**{prop: extract_single_color(theme_props[theme_prop])})
+    ], theme_props)
 
 
 def apply_theme_to_tk_toplevel(toplevel: tk.Toplevel, theme_props: Dict[str, Any]) -> None:
@@ -665,6 +686,130 @@ WIDGET_THEME_MAPPERS = {
 }
 
 
+# CustomTkinter classes that derive from Tkinter widgets. Their subclasses never
+# fall back to the plain Tkinter mappers of those bases (e.g. tk.Frame, tk.Toplevel).
+_CTK_BASE_CLASSES = (ctk.CTkBaseClass, ctk.CTkScrollableFrame, ctk.CTk, ctk.CTkToplevel)
+
+# Classes whose mapper was registered with register_mapper; they bypass style plans
+_registered_mapper_classes = set()
+
+# Resolved (mapper, style plan class, class name key, theme key) per widget class
+_dispatch_cache: Dict[type, Tuple[Optional[Callable[[Any, Dict[str, Any]], None]], Optional[type], str, Optional[str]]] = {}
+
+
+def _resolve_dispatch(widget_class: type) -> Tuple[Optional[Callable[[Any, Dict[str, Any]], None]], Optional[type], str, Optional[str]]:
+    """
+    Resolve how a widget class is themed, walking its MRO.
+    
+    The result is memoized per class, so subclasses of mapped widgets (including the
+    themed wrappers in this package) pay for the MRO walk only once.
+    
+    Args:
+        widget_class: The widget class
+        
+    Returns:
+        A tuple of (mapper function or None, class of the style plan entry or None,
+        lowercase class name, THEMES key of the closest base with one or None)
+    """
+    try:
+        return _dispatch_cache[widget_class]
+    except KeyError:
+        pass
+    
+    mapper_func = None
+    plan_class = None
+    theme_key = None
+    mapper_found = False
+    is_ctk_class = issubclass(widget_class, _CTK_BASE_CLASSES)
+    for base in widget_class.__mro__:
+        if is_ctk_class and not issubclass(base, _CTK_BASE_CLASSES):
+            continue
+        if theme_key is None:
+            theme_key = WIDGET_THEME_KEYS.get(base)
+        if not mapper_found and (base in WIDGET_THEME_MAPPERS or base in WIDGET_THEME_PROPERTIES):
+            mapper_found = True
+            mapper_func = WIDGET_THEME_MAPPERS.get(base)
+            if base in WIDGET_THEME_PROPERTIES and base not in _registered_mapper_classes:
+                plan_class = base
+        if mapper_found and theme_key is not None:
+            break
+    
+    dispatch = (mapper_func, plan_class, widget_class.__name__.lower(), theme_key)
+    _dispatch_cache[widget_class] = dispatch
+    return dispatch
+
+
+def _get_widget_theme_props(widget: Any, theme_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get the theme properties for a widget from a theme's data.
+    
+    The lowercase class name is looked up first, then the THEMES key of the
+    closest mapped base class (e.g. "button" for CTkButton subclasses).
+    
+    Args:
+        widget: The widget to style
+        theme_data: The theme data containing widget properties
+        
+    Returns:
+        The theme properties for the widget, or an empty dict
+    """
+    _, _, name_key, theme_key = _resolve_dispatch(type(widget))
+    widget_props = theme_data.get(name_key)
+    if widget_props is None and theme_key is not None:
+        widget_props = theme_data.get(theme_key)
+    return widget_props if widget_props is not None else {}
+
+
+def get_theme_mapper(widget_class: type) -> Optional[Callable[[Any, Dict[str, Any]], None]]:
+    """
+    Get the theme mapper for a widget class, honouring inheritance.
+    
+    Args:
+        widget_class: The widget class
+        
+    Returns:
+        The mapper of the closest mapped base class, or None if no base class is mapped
+    """
+    return _resolve_dispatch(widget_class)[0]
+
+
+def register_mapper(widget_class: type, theme_key: Optional[str] = None) -> Callable:
+    """
+    Decorator that registers a theme mapper for a widget class and its subclasses.
+    
+    Example:
+        @register_mapper(MyFancyButton, theme_key="button")
+        def apply_theme_to_fancy_button(button, theme_props):
+            ...
+    
+    Args:
+        widget_class: The widget class the mapper applies to
+        theme_key: The THEMES key whose properties are passed to the mapper, if the
+            lowercase class name is not a key of the theme
+        
+    Returns:
+        A decorator that registers the mapper function and returns it unchanged
+    """
+    def decorator(mapper_func: Callable[[Any, Dict[str, Any]], None]) -> Callable[[Any, Dict[str, Any]], None]:
+        WIDGET_THEME_MAPPERS[widget_class] = mapper_func
+        if theme_key is not None:
+            WIDGET_THEME_KEYS[widget_class] = theme_key
+        _registered_mapper_classes.add(widget_class)
+        clear_mapper_cache()
+        return mapper_func
+    return decorator
+
+
+def clear_mapper_cache() -> None:
+    """
+    Discard the memoized mapper dispatch.
+    
+    Call this after modifying WIDGET_THEME_MAPPERS or WIDGET_THEME_KEYS directly;
+    register_mapper does it for you.
+    """
+    _dispatch_cache.clear()
+
+
 def apply_theme_to_widget(widget: Any, theme_name: str, theme_props: Dict[str, Any]) -> None:
     """
     Apply theme properties to a widget based on its type.
@@ -674,10 +819,9 @@ def apply_theme_to_widget(widget: Any, theme_name: str, theme_props: Dict[str, A
         theme_name: The name of the theme
         theme_props: The theme properties to apply
     """
-    widget_type = type(widget)
+    mapper_func = _resolve_dispatch(type(widget))[0]
     
-    if widget_type in WIDGET_THEME_MAPPERS:
-        mapper_func = WIDGET_THEME_MAPPERS[widget_type]
+    if mapper_func is not None:
         mapper_func(widget, theme_props)
     else:
         # For unsupported widget types, try to apply common properties
@@ -704,39 +848,26 @@ def apply_theme_to_widget(widget: Any, theme_name: str, theme_props: Dict[str, A
             pass
 
 
-def directly_update_text_widgets_colors(parent, theme_name):
+def _resolve_text_widget_color(theme_name: str) -> str:
     """
-    A solution to force update text colors for all CTkTextbox and CTkEntry widgets.
-    This function recursively finds all text widgets and applies the appropriate text color
-    based on the current theme and appearance mode.
+    Resolve the text color applied to the internal widgets of CTkTextbox and CTkEntry.
     
     Args:
-        parent: The parent widget to recursively search for text widgets
         theme_name: The current theme name
+        
+    Returns:
+        A single color string
     """
-    if not hasattr(parent, "winfo_children"):
-        return
-    
     try:
-        from CTkBootstrap.themes import THEMES
+        from CTkBootstrap.themes import THEMES, get_theme, normalize_themes
     except ImportError:
-        # Fallback if we can't import the themes
-        # Get the current appearance mode
-        mode = ctk.get_appearance_mode()
-        
-        # Set appropriate colors based on appearance mode
-        if mode == "Dark":
-            text_color = "#DCE4EE"  # Light color for dark mode
-        else:
-            text_color = "#1E1E1E"  # Dark color for light mode
-            
-        # Process all children with the fallback color
-        _update_text_widgets_with_color(parent, text_color)
-        return
+        THEMES = {}
+    else:
+        normalize_themes()
     
     # If we have themes imported, try to get colors from theme
     if theme_name in THEMES:
-        theme_data = THEMES[theme_name]
+        theme_data = get_theme(theme_name)
         text_color = None
         
         # Try to get text color from different possible theme properties
@@ -757,22 +888,56 @@ def directly_update_text_widgets_colors(parent, theme_name):
                 text_color = colors["primary-text"]
             elif "content" in colors:
                 text_color = colors["content"]
-            
+        
         # If we found a text color in the theme, use it
         if text_color:
             # Extract single color if it's a tuple/list
-            text_color = extract_single_color(text_color)
-            _update_text_widgets_with_color(parent, text_color)
-            return
+            return extract_single_color(text_color)
     
     # Fallback - use appearance mode-based colors
     mode = ctk.get_appearance_mode()
     if mode == "Dark":
-        text_color = "#DCE4EE"  # Light color for dark mode
-    else:
-        text_color = "#1E1E1E"  # Dark color for light mode
+        return "#DCE4EE"  # Light color for dark mode
+    return "#1E1E1E"  # Dark color for light mode
+
+
+def _update_internal_text_color(widget: Any, text_color: str) -> None:
+    """
+    Apply a text color to the internal tk widget of a CTkTextbox or CTkEntry.
+    
+    Args:
+        widget: The widget whose internal text widget should be updated
+        text_color: The color to apply
+    """
+    # Handle CTkTextbox widgets
+    if isinstance(widget, ctk.CTkTextbox) and hasattr(widget, "_textbox"):
+        internal_text = widget._textbox
+        if isinstance(internal_text, tk.Text):
+            # Apply text color directly to internal text widget
+            internal_text.configure(fg=text_color, insertbackground=text_color)
+    
+    # Handle CTkEntry widgets
+    elif isinstance(widget, ctk.CTkEntry) and hasattr(widget, "_entry"):
+        internal_entry = widget._entry
+        if isinstance(internal_entry, tk.Entry):
+            # Apply text color directly to internal entry widget
+            internal_entry.configure(fg=text_color, insertbackground=text_color)
+
+
+def directly_update_text_widgets_colors(parent, theme_name):
+    """
+    A solution to force update text colors for all CTkTextbox and CTkEntry widgets.
+    This function recursively finds all text widgets and applies the appropriate text color
+    based on the current theme and appearance mode.
+    
+    Args:
+        parent: The parent widget to recursively search for text widgets
+        theme_name: The current theme name
+    """
+    if not hasattr(parent, "winfo_children"):
+        return
     
-    _update_text_widgets_with_color(parent, text_color)
+    _update_text_widgets_with_color(parent, _resolve_text_widget_color(theme_name))
 
 
 def _update_text_widgets_with_color(parent, text_color):
@@ -787,103 +952,196 @@ def _update_text_widgets_with_color(parent, text_color):
         return
         
     for child in parent.winfo_children():
-        # Handle CTkTextbox widgets
-        if isinstance(child, ctk.CTkTextbox) and hasattr(child, "_textbox"):
-            internal_text = child._textbox
-            if isinstance(internal_text, tk.Text):
-                # Apply text color directly to internal text widget
-                internal_text.configure(fg=text_color)
-                internal_text.configure(insertbackground=text_color)
-        
-        # Handle CTkEntry widgets
-        elif isinstance(child, ctk.CTkEntry) and hasattr(child, "_entry"):
-            internal_entry = child._entry
-            if isinstance(internal_entry, tk.Entry):
-                # Apply text color directly to internal entry widget
-                internal_entry.configure(fg=text_color)
-                internal_entry.configure(insertbackground=text_color)
+        _update_internal_text_color(child, text_color)
         
         # Recursively process this child's children
         _update_text_widgets_with_color(child, text_color)
 
 
-def apply_theme_to_all_children(parent, theme_name, theme_data):
+def _apply_planned_theme(widget: Any, theme_name: str, widget_props: Dict[str, Any],
+                         plan: Optional[Dict[type, Dict[str, Any]]]) -> None:
     """
-    Apply theme properties to a parent widget and all its children recursively.
+    Apply a theme to one widget, preferring its entry in a compiled style plan.
+    
+    Args:
+        widget: The widget to style
+        theme_name: The name of the theme
+        widget_props: The theme properties used when the plan has no entry for the widget
+        plan: A compiled style plan, or None to always use the widget mappers
+    """
+    if plan is not None:
+        kwargs = plan.get(_resolve_dispatch(type(widget))[1])
+        if kwargs is not None:
+            if kwargs:
+                widget.configure(**kwargs)
+                # The internal tk.Entry is not covered by configure()
+                if isinstance(widget, ctk.CTkEntry):
+                    _configure_internal_entry(widget, kwargs)
+            return
+    apply_theme_to_widget(widget, theme_name, widget_props)
+
+
+def iter_theme_tree(parent, theme_name: str, theme_data: Dict[str, Any],
+                    plan: Optional[Dict[type, Dict[str, Any]]] = None,
+                    defer: Optional[Callable[[Any], bool]] = None) -> Iterator[Any]:
+    """
+    Theme a parent widget and its descendants one widget per step.
+    
+    This generator yields each widget right after it has been themed, so callers can
+    stop and resume the traversal at any point, e.g. to spread a theme switch over
+    several event loop iterations. See apply_theme_to_tree for the traversal rules.
     
     Args:
         parent: The parent widget to apply theme to and all its children
         theme_name: The name of the theme to apply
         theme_data: The theme data containing widget properties
+        plan: An optional compiled style plan (see style_plans.get_style_plan)
+        defer: An optional callback taking a descendant before it is themed; when it
+            returns True the descendant and its subtree are skipped (see deferred_theming)
+        
+    Yields:
+        Each widget after it has been themed, starting with the parent
     """
-    # First apply theme to the parent widget
-    apply_theme_to_widget(parent, theme_name, theme_data)
+    text_color = _resolve_text_widget_color(theme_name)
     
-    # Then apply theme to all children recursively
-    if hasattr(parent, "winfo_children"):
-        for child in parent.winfo_children():
-            # Get the widget type
-            widget_type = type(child).__name__.lower()
-            
-            # Convert CustomTkinter widget type to theme key format
-            if widget_type.startswith("ctk"):
-                theme_key = widget_type
-            else:
-                theme_key = widget_type
-            
-            # Get specific properties for this widget type
-            widget_props = theme_data.get(theme_key, {})
-            
-            # Apply theme to this child
-            apply_theme_to_widget(child, theme_name, widget_props)
-            
-            # Recursively apply theme to this child's children
-            apply_theme_to_all_children(child, theme_name, theme_data)
+    # The parent receives the full theme data, as it always has
+    _apply_planned_theme(parent, theme_name, theme_data, plan)
+    yield parent
+    
+    if not hasattr(parent, "winfo_children"):
+        return
     
-    # After all the standard theme application, directly update text widgets
-    # to ensure colors are applied correctly to internal tk widgets
-    directly_update_text_widgets_colors(parent, theme_name)
+    # Stack entries are (widget, finish). Text widgets push a finishing entry below
+    # their children so the internal text color is applied after their subtree has
+    # been themed, which keeps the text color fix authoritative.
+    stack = [(child, False) for child in reversed(parent.winfo_children())]
+    while stack:
+        widget, finish = stack.pop()
+        if finish:
+            _update_internal_text_color(widget, text_color)
+            continue
+        if defer is not None and defer(widget):
+            continue
+        
+        # Get specific properties for this widget type
+        widget_props = _get_widget_theme_props(widget, theme_data)
+        _apply_planned_theme(widget, theme_name, widget_props, plan)
+        
+        if isinstance(widget, (ctk.CTkTextbox, ctk.CTkEntry)):
+            stack.append((widget, True))
+        if hasattr(widget, "winfo_children"):
+            stack.extend((child, False) for child in reversed(widget.winfo_children()))
+        yield widget
 
 
-def configure_ttk_styles(root: Union[tk.Tk, tk.Toplevel, ctk.CTk], theme_name: str, theme_data: Dict[str, Any]) -> None:
+def apply_theme_to_tree(parent, theme_name: str, theme_data: Dict[str, Any],
+                        plan: Optional[Dict[type, Dict[str, Any]]] = None,
+                        defer: Optional[Callable[[Any], bool]] = None) -> int:
     """
-    Configure ttk styles for the current theme.
+    Apply theme properties to a parent widget and all of its descendants in a single pass.
+    
+    Every widget is visited exactly once. The widget mapper and the internal text color
+    fix for CTkTextbox/CTkEntry are handled during the same visit, so the cost of a
+    theme switch grows linearly with the number of widgets instead of with their depth.
+    The traversal uses an explicit stack, so deep widget trees cannot hit the recursion limit.
     
     Args:
-        root: The root window
-        theme_name: The name of the theme
-        theme_data: The theme configuration data
+        parent: The parent widget to apply theme to and all its children
+        theme_name: The name of the theme to apply
+        theme_data: The theme data containing widget properties
+        plan: An optional compiled style plan (see style_plans.get_style_plan). Widgets
+            whose class has an entry in the plan are styled with one configure() call.
+        defer: An optional callback deciding which descendants (and their subtrees)
+            to skip, e.g. DeferredTheming.defer_if_unmapped
+        
+    Returns:
+        The number of widgets visited, including the parent
     """
-    if "ttk" not in theme_data:
-        return
+    visited = 0
+    for _ in iter_theme_tree(parent, theme_name, theme_data, plan, defer):
+        visited += 1
+    return visited
+
+
+def iter_theme_registry(registry, theme_name: str, theme_data: Dict[str, Any],
+                        plan: Optional[Dict[type, Dict[str, Any]]] = None,
+                        defer: Optional[Callable[[Any], bool]] = None) -> Iterator[Any]:
+    """
+    Theme the widgets of a widget registry one widget per step.
+    
+    Args:
+        registry: A widget_registry.WidgetRegistry
+        theme_name: The name of the theme to apply
+        theme_data: The theme data containing widget properties
+        plan: An optional compiled style plan (see style_plans.get_style_plan)
+        defer: An optional callback taking a widget before it is themed; widgets for
+            which it returns True are skipped
+        
+    Yields:
+        Each widget after it has been themed
+    """
+    text_color = _resolve_text_widget_color(theme_name)
     
-    style = ttk.Style(root)
+    for widget in registry.widgets():
+        if defer is not None and defer(widget):
+            continue
+        widget_props = _get_widget_theme_props(widget, theme_data)
+        _apply_planned_theme(widget, theme_name, widget_props, plan)
+        _update_internal_text_color(widget, text_color)
+        yield widget
+
+
+def apply_theme_to_registry(registry, theme_name: str, theme_data: Dict[str, Any],
+                            plan: Optional[Dict[type, Dict[str, Any]]] = None,
+                            defer: Optional[Callable[[Any], bool]] = None) -> int:
+    """
+    Apply theme properties to every widget in a widget registry.
     
-    # Configure the ttk theme if specified
-    if "ttk_theme" in theme_data:
-        try:
-            style.theme_use(theme_data["ttk_theme"])
-        except tk.TclError:
-            # If the theme doesn't exist, use the default theme
-            pass
+    Unlike apply_theme_to_tree, this does not call winfo_children(); it only touches
+    the widgets tracked by the registry.
     
-    # Apply ttk theme properties
-    ttk_props = theme_data.get("ttk", {})
-    processed_props = {}
+    Args:
+        registry: A widget_registry.WidgetRegistry
+        theme_name: The name of the theme to apply
+        theme_data: The theme data containing widget properties
+        plan: An optional compiled style plan (see style_plans.get_style_plan)
+        defer: An optional callback deciding which widgets to skip
+        
+    Returns:
+        The number of widgets visited
+    """
+    visited = 0
+    for _ in iter_theme_registry(registry, theme_name, theme_data, plan, defer):
+        visited += 1
+    return visited
+
+
+def apply_theme_to_all_children(parent, theme_name, theme_data) -> int:
+    """
+    Apply theme properties to a parent widget and all its children recursively.
     
-    # Process ttk properties to extract single colors from tuples
-    for prop, value in ttk_props.items():
-        processed_props[prop] = extract_single_color(value)
+    Args:
+        parent: The parent widget to apply theme to and all its children
+        theme_name: The name of the theme to apply
+        theme_data: The theme data containing widget properties
+        
+    Returns:
+        The number of widgets visited, including the parent
+    """
+    return apply_theme_to_tree(parent, theme_name, theme_data)
+
+
+def configure_ttk_styles(root: Union[tk.Tk, tk.Toplevel, ctk.CTk], theme_name: str, theme_data: Dict[str, Any]) -> None:
+    """
+    Configure ttk styles for the current theme.
     
-    # Configure the ttk theme
-    style.configure(".", **processed_props)
+    The theme is compiled once into a named ttk theme (see ttk_themes), so this is a
+    single style.theme_use() once the ttk theme exists.
     
-    # Apply custom styles if available
-    if "ttk_styles" in theme_data:
-        for style_name, style_props in theme_data["ttk_styles"].items():
-            # Process style properties to extract single colors
-            processed_style_props = {}
-            for prop, value in style_props.items():
-                processed_style_props[prop] = extract_single_color(value)
-            
-            style.configure(style_name, **processed_style_props) 
\ No newline at end of file
+    Args:
+        root: The root window
+        theme_name: The name of the theme
+        theme_data: The theme configuration data
+    """
+    from .ttk_themes import use_ttk_theme
+    use_ttk_theme(root, theme_name, theme_data) 
\ No newline at end of file